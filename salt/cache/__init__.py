@@ -179,6 +179,36 @@ class Cache(object):
         fun = '{0}.fetch'.format(self.driver)
         return self.modules[fun](bank, key, **self._kwargs)
 
+    def fetch_many(self, banks, key):
+        '''
+        Fetch the same key from several banks using the specified module
+
+        Cache modules can provide a ``fetch_many`` function to fetch them in a
+        single request to their backend, otherwise they are fetched one by
+        one.
+
+        :param banks:
+            The names of the locations inside the cache which hold the key.
+
+        :param key:
+            The name of the key (or file inside a directory) which will hold
+            the data. File extensions should not be provided, as they will be
+            added by the driver itself.
+
+        :return:
+            Return a dict mapping each bank to the python object fetched from
+            the cache, or an empty dict if the key was not found in the bank.
+
+        :raises SaltCacheError:
+            Raises an exception if cache driver detected an error accessing data
+            in the cache backend (auth, permissions, etc).
+        '''
+        fun = '{0}.fetch_many'.format(self.driver)
+        if fun in self.modules:
+            return self.modules[fun](banks, key, **self._kwargs)
+        fetch = self.modules['{0}.fetch'.format(self.driver)]
+        return dict((bank, fetch(bank, key, **self._kwargs)) for bank in banks)
+
     def updated(self, bank, key):
         '''
         Get the last updated epoch for the specified key
@@ -342,6 +372,27 @@ class MemCache(Cache):
         self.storage[(bank, key)] = [now, data]
         return data
 
+    def fetch_many(self, banks, key):
+        ret = {}
+        missing = []
+        for bank in banks:
+            if (bank, key) in self.storage:
+                ret[bank] = self.fetch(bank, key)
+            else:
+                missing.append(bank)
+        if missing:
+            now = time.time()
+            for bank, data in six.iteritems(
+                    super(MemCache, self).fetch_many(missing, key)):
+                if len(self.storage) >= self.max:
+                    if self.cleanup:
+                        MemCache.__cleanup(self.expire)
+                    if len(self.storage) >= self.max:
+                        self.storage.popitem(last=False)
+                self.storage[(bank, key)] = [now, data]
+                ret[bank] = data
+        return ret
+
     def store(self, bank, key, data):
         self.storage.pop((bank, key), None)
         super(MemCache, self).store(bank, key, data)
@@ -376,6 +376,32 @@ def fetch(bank, key):
     return __context__['serial'].loads(redis_value)
 
 
+def fetch_many(banks, key):
+    '''
+    Fetch the same key from several banks of the Redis cache, in a single
+    request.
+    '''
+    banks = list(banks)
+    if not banks:
+        return {}
+    redis_server = _get_redis_server()
+    redis_keys = [_get_key_redis_key(bank, key) for bank in banks]
+    try:
+        redis_values = redis_server.mget(redis_keys)
+    except (RedisConnectionError, RedisResponseError) as rerr:
+        mesg = 'Cannot fetch the Redis cache keys {rkeys}: {rerr}'.format(rkeys=redis_keys,
+                                                                          rerr=rerr)
+        log.error(mesg)
+        raise SaltCacheError(mesg)
+    ret = {}
+    for bank, redis_value in zip(banks, redis_values):
+        if redis_value is None:
+            ret[bank] = {}
+        else:
+            ret[bank] = __context__['serial'].loads(redis_value)
+    return ret
+
+
 def flush(bank, key=None):
     '''
     Remove the key from the cache bank with all the key content. If no key is specified, remove
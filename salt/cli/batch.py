@@ -98,6 +98,30 @@ class Batch(object):
                 salt.utils.stringutils.print_cli('Invalid batch data sent: {0}\nData must be in the '
                           'form of %10, 10% or 3'.format(self.opts['batch']))
 
+    def __retcode(self, data):
+        '''
+        Return the retcode of a minion's return, 0 if there is none
+        '''
+        if isinstance(data.get('data'), dict):
+            # raw event
+            data = data['data']
+        retcode = data.get('retcode', 0)
+        return retcode if isinstance(retcode, int) else 0
+
+    def __adapt(self, slots, bnum, failed):
+        '''
+        Return the number of minions to run at once after a minion returned.
+        Halve it when the minion failed, and grow it by one up to the batch
+        size when it succeeded.
+        '''
+        if failed:
+            new_slots = max(1, slots // 2)
+        else:
+            new_slots = min(bnum, slots + 1)
+        if new_slots != slots:
+            log.info('Running the batch on %s minions at a time', new_slots)
+        return new_slots
+
     def __update_wait(self, wait):
         now = datetime.now()
         i = 0
@@ -121,12 +145,16 @@ class Batch(object):
         if not self.minions:
             return
         to_run = copy.deepcopy(self.minions)
-        active = []
+        active = set()
         ret = {}
         iters = []
         # wait the specified time before decide a job is actually done
         bwait = self.opts.get('batch_wait', 0)
         wait = []
+        # the number of minions to run at once, lowered when minions fail if
+        # the batch size is adaptive
+        adaptive = self.opts.get('batch_adaptive', False)
+        slots = bnum
 
         if self.options:
             show_jid = self.options.show_jid
@@ -154,12 +182,12 @@ class Batch(object):
             next_ = []
             if bwait and wait:
                 self.__update_wait(wait)
-            if len(to_run) <= bnum - len(wait) and not active:
+            if len(to_run) <= slots - len(wait) and not active:
                 # last bit of them, add them all to next iterator
                 while to_run:
                     next_.append(to_run.pop())
             else:
-                for i in range(bnum - len(active) - len(wait)):
+                for i in range(slots - len(active) - len(wait)):
                     if to_run:
                         minion_id = to_run.pop()
                         if isinstance(minion_id, dict):
@@ -167,7 +195,7 @@ class Batch(object):
                         else:
                             next_.append(minion_id)
 
-            active += next_
+            active.update(next_)
             args[0] = next_
 
             if next_:
@@ -189,9 +217,9 @@ class Batch(object):
                 minion_tracker[new_iter]['minions'] = next_
                 minion_tracker[new_iter]['active'] = True
 
-            else:
-                time.sleep(0.02)
             parts = {}
+            # the minions which did not return before their job timed out
+            no_return = set()
 
             # see if we found more minions
             for ping_ret in self.ping_gen:
@@ -205,15 +233,10 @@ class Batch(object):
             for queue in iters:
                 try:
                     # Gather returns until we get to the bottom
-                    ncnt = 0
                     while True:
                         part = next(queue)
                         if part is None:
-                            time.sleep(0.01)
-                            ncnt += 1
-                            if ncnt > 5:
-                                break
-                            continue
+                            break
                         if self.opts.get('raw'):
                             parts.update({part['data']['id']: part})
                             if part['data']['id'] in minion_tracker[queue]['minions']:
@@ -242,6 +265,7 @@ class Batch(object):
                             if minion not in parts:
                                 parts[minion] = {}
                                 parts[minion]['ret'] = {}
+                                no_return.add(minion)
 
             for minion, data in six.iteritems(parts):
                 if minion in active:
@@ -255,6 +279,9 @@ class Batch(object):
                     if self.opts.get('failhard') and data['ret']['retcode'] > 0:
                         failhard = True
 
+                if adaptive:
+                    slots = self.__adapt(slots, bnum, minion in no_return or self.__retcode(data) > 0)
+
                 if self.opts.get('raw'):
                     ret[minion] = data
                     yield data
@@ -280,13 +307,17 @@ class Batch(object):
                     raise StopIteration
 
             # remove inactive iterators from the iters list
-            for queue in minion_tracker:
+            for queue in list(iters):
                 # only remove inactive queues
-                if not minion_tracker[queue]['active'] and queue in iters:
+                if not minion_tracker[queue]['active']:
                     iters.remove(queue)
                     # also remove the iterator's minions from the active list
-                    for minion in minion_tracker[queue]['minions']:
+                    for minion in minion_tracker.pop(queue)['minions']:
                         if minion in active:
                             active.remove(minion)
                             if bwait:
                                 wait.append(datetime.now() + timedelta(seconds=bwait))
+
+            if not next_ and not parts:
+                # nothing happened, wait for the minions a little
+                time.sleep(0.01)
@@ -23,6 +23,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 import os
 import time
 import random
+import itertools
 import logging
 from datetime import datetime
 
@@ -517,6 +518,9 @@ class LocalClient(object):
 
         :param batch: The batch identifier of systems to execute on
 
+        :param batch_adaptive: Halve the number of systems to execute on at
+            once when one fails, see :conf_master:`batch_adaptive`
+
         :returns: A generator of minion returns
 
         .. code-block:: python
@@ -553,6 +557,8 @@ class LocalClient(object):
             opts['gather_job_timeout'] = kwargs['gather_job_timeout']
         if 'batch_wait' in kwargs:
             opts['batch_wait'] = int(kwargs['batch_wait'])
+        if 'batch_adaptive' in kwargs:
+            opts['batch_adaptive'] = kwargs['batch_adaptive']
 
         eauth = {}
         if 'eauth' in kwargs:
@@ -1107,9 +1113,15 @@ class LocalClient(object):
         # iterator for this job's return
         if self.opts['order_masters']:
             # If we are a MoM, we need to gather expected minions from downstreams masters.
-            ret_iter = self.get_returns_no_block('(salt/job|syndic/.*)/{0}'.format(jid), 'regex')
+            ret_tag, ret_match_type = '(salt/job|syndic/.*)/{0}'.format(jid), 'regex'
         else:
-            ret_iter = self.get_returns_no_block('salt/job/{0}'.format(jid))
+            ret_tag, ret_match_type = 'salt/job/{0}'.format(jid), None
+        ret_iter = self.get_returns_no_block(ret_tag, ret_match_type)
+        # the return received while waiting for events, if any
+        waited = []
+        # the minions or the found minions changed since the last check
+        changed = True
+        all_found = False
         # iterator for the info of this job
         jinfo_iter = []
         # open event jids that need to be un-subscribed from later
@@ -1125,10 +1137,11 @@ class LocalClient(object):
         )
         while True:
             # Process events until timeout is reached or all minions have returned
-            for raw in ret_iter:
+            for raw in itertools.chain(waited, ret_iter):
                 # if we got None, then there were no events
                 if raw is None:
                     break
+                changed = True
                 if 'minions' in raw.get('data', {}):
                     minions.update(raw['data']['minions'])
                     if 'missing' in raw.get('data', {}):
@@ -1152,13 +1165,25 @@ class LocalClient(object):
                         ret[raw['data']['id']].update(raw['data'])
                     log.debug('jid %s return from %s', jid, raw['data']['id'])
                     yield ret
+            del waited[:]
+
+            # Only go through all of the minions when some returned or were
+            # added, there can be many of them
+            if changed:
+                changed = False
+                all_found = len(found.intersection(minions)) >= len(minions)
+                # let start the timeouts for all remaining minions
+                for id_ in minions - found:
+                    # if we have a new minion in the list, make sure it has a timeout
+                    if id_ not in minion_timeouts:
+                        minion_timeouts[id_] = time.time() + timeout
 
             # if we have all of the returns (and we aren't a syndic), no need for anything fancy
-            if len(found.intersection(minions)) >= len(minions) and not self.opts['order_masters']:
+            if all_found and not self.opts['order_masters']:
                 # All minions have returned, break out of the loop
                 log.debug('jid %s found all minions %s', jid, found)
                 break
-            elif len(found.intersection(minions)) >= len(minions) and self.opts['order_masters']:
+            elif all_found and self.opts['order_masters']:
                 if len(found) >= len(minions) and len(minions) > 0 and time.time() > gather_syndic_wait:
                     # There were some minions to find and we found them
                     # However, this does not imply that *all* masters have yet responded with expected minion lists.
@@ -1169,29 +1194,31 @@ class LocalClient(object):
             # If we get here we may not have gathered the minion list yet. Keep waiting
             # for all lower-level masters to respond with their minion lists
 
-            # let start the timeouts for all remaining minions
-
-            for id_ in minions - found:
-                # if we have a new minion in the list, make sure it has a timeout
-                if id_ not in minion_timeouts:
-                    minion_timeouts[id_] = time.time() + timeout
-
             # if the jinfo has timed out and some minions are still running the job
             # re-do the ping
-            if time.time() > timeout_at and minions_running:
-                # since this is a new ping, no one has responded yet
-                jinfo = self.gather_job_info(jid, list(minions - found), 'list', **kwargs)
-                minions_running = False
-                # if we weren't assigned any jid that means the master thinks
-                # we have nothing to send
-                if 'jid' not in jinfo:
-                    jinfo_iter = []
+            now = time.time()
+            if now > timeout_at and minions_running:
+                # only ping the minions which have not returned in their timeout
+                pending = minions - found
+                expired = [id_ for id_ in pending if minion_timeouts.get(id_, 0) <= now]
+                if pending and not expired:
+                    # check again when the first of them times out
+                    timeout_at = min(minion_timeouts[id_] for id_ in pending)
                 else:
-                    jinfo_iter = self.get_returns_no_block('salt/job/{0}'.format(jinfo['jid']))
-                timeout_at = time.time() + gather_job_timeout
-                # if you are a syndic, wait a little longer
-                if self.opts['order_masters']:
-                    timeout_at += self.opts.get('syndic_wait', 1)
+                    # since this is a new ping, no one has responded yet
+                    jinfo = self.gather_job_info(jid, expired, 'list', **kwargs)
+                    # the minions which were not pinged did not time out yet
+                    minions_running = len(expired) < len(pending)
+                    # if we weren't assigned any jid that means the master thinks
+                    # we have nothing to send
+                    if 'jid' not in jinfo:
+                        jinfo_iter = []
+                    else:
+                        jinfo_iter = self.get_returns_no_block('salt/job/{0}'.format(jinfo['jid']))
+                    timeout_at = time.time() + gather_job_timeout
+                    # if you are a syndic, wait a little longer
+                    if self.opts['order_masters']:
+                        timeout_at += self.opts.get('syndic_wait', 1)
 
             # check for minions that are running the job still
             for raw in jinfo_iter:
@@ -1202,6 +1229,7 @@ class LocalClient(object):
                     if raw['data']['retcode'] > 0:
                         log.error('saltutil returning errors on minion %s', raw['data']['id'])
                         minions.remove(raw['data']['id'])
+                        changed = True
                         break
                 except KeyError as exc:
                     # This is a safe pass. We're just using the try/except to
@@ -1221,9 +1249,11 @@ class LocalClient(object):
                 # TODO: move to a library??
                 if 'minions' in raw.get('data', {}):
                     minions.update(raw['data']['minions'])
+                    changed = True
                     continue
                 if 'syndic' in raw.get('data', {}):
                     minions.update(raw['syndic'])
+                    changed = True
                     continue
                 if 'return' not in raw.get('data', {}):
                     continue
@@ -1246,6 +1276,7 @@ class LocalClient(object):
                 # if we didn't originally target the minion, lets add it to the list
                 if raw['data']['id'] not in minions:
                     minions.add(raw['data']['id'])
+                    changed = True
                 # update this minion's timeout, as long as the job is still running
                 minion_timeouts[raw['data']['id']] = time.time() + timeout
                 # a minion returned, so we know its running somewhere
@@ -1268,7 +1299,17 @@ class LocalClient(object):
 
             # don't spin
             if block:
-                time.sleep(0.01)
+                # wait for the next return, until the next deadline at most
+                deadline = timeout_at if timeout_at > now else now + 0.1
+                if self.opts['order_masters'] and gather_syndic_wait > now:
+                    deadline = min(deadline, gather_syndic_wait)
+                raw = self.event.get_event(wait=min(max(deadline - now, 0.01), 1),
+                                           tag=ret_tag,
+                                           match_type=ret_match_type,
+                                           full=True,
+                                           auto_reconnect=self.auto_reconnect)
+                if raw is not None:
+                    waited.append(raw)
             else:
                 yield
 
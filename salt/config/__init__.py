@@ -188,6 +188,18 @@ VALID_OPTS = {
     # '': Disable the key cache [default]
     'key_cache': six.string_types,
 
+    # Keep the list of the keys in each key directory of the pki_dir in memory and in a snapshot
+    # file, and only list the directory again when it changed
+    'pki_index': bool,
+
+    # The number of parsed minion public keys each master worker keeps, 0 to read and parse
+    # the key of a minion for every request it makes
+    'minion_key_cache_size': int,
+
+    # The number of seconds a master worker trusts a minion token it verified, 0 to verify
+    # it on every request
+    'minion_token_cache_ttl': int,
+
     # The user under which the daemon should run
     'user': six.string_types,
 
@@ -245,6 +257,9 @@ VALID_OPTS = {
     # Rendrerer blacklist. Renderers from this list are disalloed even if specified in whitelist.
     'renderer_blacklist': list,
 
+    # Record per-file and per-renderer timings of SLS and pillar rendering
+    'render_profile': bool,
+
     # A flag indicating that a highstate run should immediately cease if a failure occurs.
     'failhard': bool,
 
@@ -399,6 +414,10 @@ VALID_OPTS = {
     # The TCP port for mworkers to connect to on the master
     'tcp_master_workers': int,
 
+    # The number of minions the TCP transport's publisher sends a publish to before letting
+    # other work run, 0 to send it to all minions at once
+    'tcp_publish_batch_size': int,
+
     # The file to send logging data to
     'log_file': six.string_types,
 
@@ -480,6 +499,20 @@ VALID_OPTS = {
     # Fire events as state chunks are processed by the state compiler
     'state_events': bool,
 
+    # Run chunks which have no requisite relationship in parallel processes
+    'state_auto_parallel': bool,
+
+    # The maximum number of parallel state processes to run at once, None for
+    # the number of CPUs, 0 for no limit
+    'state_parallel_workers': (type(None), int),
+
+    # Skip states whose inputs are unchanged since their last successful run
+    'state_incremental': bool,
+
+    # Cache the compiled highstate and reuse it while the top matches, SLS files, pillar and
+    # grains are unchanged
+    'state_compile_cache': bool,
+
     # The number of seconds a minion should wait before retry when attempting authentication
     'acceptance_wait_time': float,
 
@@ -550,6 +583,21 @@ VALID_OPTS = {
     # returner specified by 'event_return'
     'event_return_queue': int,
 
+    # The number of seconds after which queued events are pushed to the event returner even
+    # if fewer than 'event_return_queue' events were queued, 0 to disable
+    'event_return_queue_max_seconds': int,
+
+    # The number of queued batches of events waiting to be stored by the event returner, 0 for
+    # no limit
+    'event_return_backlog': int,
+
+    # Spool batches of events the event returner could not store to disk and store them later
+    'event_return_spool': bool,
+
+    # The maximum number of bytes of spooled events for each event returner, the oldest
+    # spooled events are dropped beyond it, 0 for no limit
+    'event_return_spool_size': int,
+
     # Only forward events to an event returner if it matches one of the tags in this list
     'event_return_whitelist': list,
 
@@ -599,6 +647,22 @@ VALID_OPTS = {
     # Refs https://github.com/saltstack/salt/issues/34215
     'ipc_write_buffer': int,
 
+    # The maximum number of bytes the event publisher queues for a single subscriber, 0 for
+    # no limit
+    'ipc_publisher_queue_size': int,
+
+    # What the event publisher does when a subscriber's queue is full: drop_oldest, drop_newest
+    # or disconnect
+    'ipc_publisher_queue_policy': six.string_types,
+
+    # The number of events the event publisher keeps for listeners to resume from after
+    # reconnecting, 0 to disable
+    'ipc_publisher_backlog': int,
+
+    # The maximum number of bytes of events the event publisher keeps for listeners to resume
+    # from, 0 for no limit
+    'ipc_publisher_backlog_size': int,
+
     # The number of MWorker processes for a master to startup. This number needs to scale up as
     # the number of connected minions increases.
     'worker_threads': int,
@@ -795,6 +859,10 @@ VALID_OPTS = {
     # applied only if the user didn't matched by other matchers.
     'permissive_acl': bool,
 
+    # The number of seconds the result of a publisher_acl or external_auth check
+    # is reused for the same permissions, functions, arguments and target
+    'auth_check_cache_ttl': int,
+
     # Optionally enables keeping the calculated user's auth list in the token file.
     'keep_acl_in_token': bool,
 
@@ -846,6 +914,10 @@ VALID_OPTS = {
     # reply from executions.
     'minion_data_cache': bool,
 
+    # The number of seconds each master worker reuses the result of a mine.get for the same
+    # target and functions, 0 to not reuse them
+    'mine_get_cache_ttl': int,
+
     # The number of seconds between AES key rotations on the master
     'publish_session': int,
 
@@ -997,6 +1069,14 @@ VALID_OPTS = {
     # The length that the syndic event queue must hit before events are popped off and forwarded
     'syndic_jid_forward_cache_hwm': int,
 
+    # The number of job returns a syndic aggregates for a master before forwarding them without
+    # waiting for syndic_event_forward_timeout, 0 to only forward them on the timeout
+    'syndic_forward_batch_size': int,
+
+    # Halve the number of minions running a batch job at once when one fails, and grow it back
+    # by one for each minion which succeeds
+    'batch_adaptive': bool,
+
     # Salt SSH configuration
     'ssh_passwd': six.string_types,
     'ssh_port': six.string_types,
@@ -1037,6 +1117,10 @@ VALID_OPTS = {
     'con_cache': bool,
     'rotate_aes_key': bool,
 
+    # Have the TCP publisher keep a table of the connected minions for the
+    # other master processes
+    'presence_table': bool,
+
     # Cache ZeroMQ connections. Can greatly improve salt performance.
     'cache_sreqs': bool,
 
@@ -1092,6 +1176,9 @@ VALID_OPTS = {
     # Minion de-dup jid cache max size
     'minion_jid_queue_hwm': int,
 
+    # Keep the minion de-dup jid cache on disk so that it survives a restart
+    'minion_jid_queue_cache': bool,
+
     # Minion data cache driver (one of satl.cache.* modules)
     'cache': six.string_types,
     # Enables a fast in-memory cache booster and sets the expiration time.
@@ -1184,6 +1271,18 @@ VALID_OPTS = {
     # Whether to fire auth events
     'auth_events': bool,
 
+    # The number of seconds over which minions spread their sign ins when they need to sign in
+    # again, e.g. after the AES key was rotated, 0 to sign in again at once
+    'rotate_reauth_window': int,
+
+    # The number of encrypted auth replies each master worker keeps for the current AES key,
+    # 0 to not keep them
+    'auth_payload_cache_size': int,
+
+    # Whether to encrypt the requests of minions which support it with AES-GCM instead of
+    # AES-CBC and HMAC-SHA256
+    'request_channel_aead': bool,
+
     # Whether to fire Minion data cache refresh events
     'minion_data_cache_events': bool,
 
@@ -1244,6 +1343,7 @@ DEFAULT_MINION_OPTS = {
     'renderer': 'jinja|yaml',
     'renderer_whitelist': [],
     'renderer_blacklist': [],
+    'render_profile': False,
     'random_startup_delay': 0,
     'failhard': False,
     'autoload_dynamic_modules': True,
@@ -1370,6 +1470,10 @@ DEFAULT_MINION_OPTS = {
     'mine_interval': 60,
     'ipc_mode': _DFLT_IPC_MODE,
     'ipc_write_buffer': _DFLT_IPC_WBUFFER,
+    'ipc_publisher_queue_size': 0,
+    'ipc_publisher_queue_policy': 'drop_oldest',
+    'ipc_publisher_backlog': 0,
+    'ipc_publisher_backlog_size': 104857600,
     'ipv6': None,
     'file_buffer_size': 262144,
     'tcp_pub_port': 4510,
@@ -1399,6 +1503,10 @@ DEFAULT_MINION_OPTS = {
     'state_auto_order': True,
     'state_events': False,
     'state_aggregate': False,
+    'state_auto_parallel': False,
+    'state_parallel_workers': None,
+    'state_incremental': False,
+    'state_compile_cache': False,
     'snapper_states': False,
     'snapper_states_config': 'root',
     'acceptance_wait_time': 10,
@@ -1482,6 +1590,7 @@ DEFAULT_MINION_OPTS = {
     'proxy_password': '',
     'proxy_port': 0,
     'minion_jid_queue_hwm': 100,
+    'minion_jid_queue_cache': False,
     'ssl': None,
     'multifunc_ordered': False,
     'beacons_before_connect': False,
@@ -1520,6 +1629,9 @@ DEFAULT_MASTER_OPTS = {
     'root_dir': salt.syspaths.ROOT_DIR,
     'pki_dir': os.path.join(salt.syspaths.CONFIG_DIR, 'pki', 'master'),
     'key_cache': '',
+    'pki_index': False,
+    'minion_key_cache_size': 10000,
+    'minion_token_cache_ttl': 300,
     'cachedir': os.path.join(salt.syspaths.CACHE_DIR, 'master'),
     'file_roots': {
         'base': [salt.syspaths.BASE_FILE_ROOTS_DIR,
@@ -1654,6 +1766,7 @@ DEFAULT_MASTER_OPTS = {
     'token_expire': 43200,
     'token_expire_user_override': False,
     'permissive_acl': False,
+    'auth_check_cache_ttl': 0,
     'keep_acl_in_token': False,
     'eauth_acl_module': '',
     'eauth_tokens': 'localfs',
@@ -1678,6 +1791,7 @@ DEFAULT_MASTER_OPTS = {
     'renderer': 'jinja|yaml',
     'renderer_whitelist': [],
     'renderer_blacklist': [],
+    'render_profile': False,
     'failhard': False,
     'state_top': 'top.sls',
     'state_top_saltenv': None,
@@ -1690,13 +1804,19 @@ DEFAULT_MASTER_OPTS = {
     'job_cache_store_endtime': False,
     'minion_data_cache': True,
     'enforce_mine_cache': False,
+    'mine_get_cache_ttl': 0,
     'ipc_mode': _DFLT_IPC_MODE,
     'ipc_write_buffer': _DFLT_IPC_WBUFFER,
+    'ipc_publisher_queue_size': 0,
+    'ipc_publisher_queue_policy': 'drop_oldest',
+    'ipc_publisher_backlog': 0,
+    'ipc_publisher_backlog_size': 104857600,
     'ipv6': None,
     'tcp_master_pub_port': 4512,
     'tcp_master_pull_port': 4513,
     'tcp_master_publish_pull': 4514,
     'tcp_master_workers': 4515,
+    'tcp_publish_batch_size': 1000,
     'log_file': os.path.join(salt.syspaths.LOGS_DIR, 'master'),
     'log_level': 'warning',
     'log_level_logfile': None,
@@ -1718,6 +1838,10 @@ DEFAULT_MASTER_OPTS = {
     'engines': [],
     'event_return': '',
     'event_return_queue': 0,
+    'event_return_queue_max_seconds': 0,
+    'event_return_backlog': 100,
+    'event_return_spool': False,
+    'event_return_spool_size': 1073741824,
     'event_return_whitelist': [],
     'event_return_blacklist': [],
     'event_match_type': 'startswith',
@@ -1730,6 +1854,10 @@ DEFAULT_MASTER_OPTS = {
     'state_auto_order': True,
     'state_events': False,
     'state_aggregate': False,
+    'state_auto_parallel': False,
+    'state_parallel_workers': None,
+    'state_incremental': False,
+    'state_compile_cache': False,
     'search': '',
     'loop_interval': 60,
     'nodegroups': {},
@@ -1773,6 +1901,8 @@ DEFAULT_MASTER_OPTS = {
     'gather_job_timeout': 10,
     'syndic_event_forward_timeout': 0.5,
     'syndic_jid_forward_cache_hwm': 100,
+    'syndic_forward_batch_size': 0,
+    'batch_adaptive': False,
     'regen_thin': False,
     'ssh_passwd': '',
     'ssh_priv_passwd': '',
@@ -1798,6 +1928,7 @@ DEFAULT_MASTER_OPTS = {
     'zmq_filtering': False,
     'zmq_monitor': False,
     'con_cache': False,
+    'presence_table': True,
     'rotate_aes_key': True,
     'cache_sreqs': True,
     'dummy_pub': False,
@@ -1826,6 +1957,9 @@ DEFAULT_MASTER_OPTS = {
     'discovery': False,
     'schedule': {},
     'auth_events': True,
+    'rotate_reauth_window': 0,
+    'auth_payload_cache_size': 0,
+    'request_channel_aead': False,
     'minion_data_cache_events': True,
     'enable_ssh_minions': False,
 }
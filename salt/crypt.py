@@ -11,6 +11,7 @@ from __future__ import absolute_import, print_function
 import os
 import sys
 import copy
+import random
 import time
 import hmac
 import base64
@@ -56,6 +57,12 @@ if not HAS_M2 and not HAS_CDOME:
         # No need for crypt in local mode
         pass
 
+# M2Crypto's EVP API can neither set nor read the tags of AES-GCM
+try:
+    HAS_GCM = not HAS_M2 and hasattr(AES, 'MODE_GCM')
+except NameError:
+    HAS_GCM = False
+
 # Import salt libs
 import salt.defaults.exitcodes
 import salt.payload
@@ -496,6 +503,9 @@ class AsyncAuth(object):
             self.token = Crypticle.generate_key_string()
         else:
             self.token = salt.utils.stringutils.to_bytes(Crypticle.generate_key_string())
+        # The token encrypted with the master's public key, see
+        # minion_sign_in_payload()
+        self.enc_token = None
         self.serial = salt.payload.Serial(self.opts)
         self.pub_path = os.path.join(self.opts['pki_dir'], 'minion.pub')
         self.rsa_path = os.path.join(self.opts['pki_dir'], 'minion.pem')
@@ -541,6 +551,14 @@ class AsyncAuth(object):
     def crypticle(self):
         return self._crypticle
 
+    @property
+    def aead(self):
+        '''
+        True if the master agreed to encrypt the requests of this minion, and
+        its replies to them, with AES-GCM
+        '''
+        return self.creds.get('aead', False)
+
     @property
     def authenticated(self):
         return hasattr(self, '_authenticate_future') and \
@@ -588,6 +606,14 @@ class AsyncAuth(object):
         :rtype: Crypticle
         :returns: A crypticle used for encryption operations
         '''
+        reauth_window = getattr(self, '_creds', None) and self._creds.get('reauth_window')
+        if reauth_window:
+            # The master asks the minions which were already signed in to
+            # spread their sign ins, all of them need to sign in again when it
+            # rotates its AES key
+            delay = random.uniform(0, reauth_window)
+            log.debug('Waiting %s seconds before signing in again', delay)
+            yield tornado.gen.sleep(delay)
         acceptance_wait_time = self.opts['acceptance_wait_time']
         acceptance_wait_time_max = self.opts['acceptance_wait_time_max']
         if not acceptance_wait_time_max:
@@ -761,6 +787,8 @@ class AsyncAuth(object):
                 if salt.utils.crypt.pem_finger(m_pub_fn, sum_type=self.opts['hash_type']) != self.opts['master_finger']:
                     self._finger_fail(self.opts['master_finger'], m_pub_fn)
         auth['publish_port'] = payload['publish_port']
+        auth['reauth_window'] = payload.get('reauth_window', 0)
+        auth['aead'] = HAS_GCM and payload.get('aead', False)
         raise tornado.gen.Return(auth)
 
     def get_keys(self):
@@ -814,16 +842,26 @@ class AsyncAuth(object):
             payload['autosign_grains'] = autosign_grains
         try:
             pubkey_path = os.path.join(self.opts['pki_dir'], self.mpub)
-            pub = get_rsa_pub_key(pubkey_path)
-            if HAS_M2:
-                payload['token'] = pub.public_encrypt(self.token, RSA.pkcs1_oaep_padding)
-            else:
-                cipher = PKCS1_OAEP.new(pub)
-                payload['token'] = cipher.encrypt(self.token)
+            # Send the same encrypted token as long as the master's public key
+            # does not change, so the master can reuse its reply
+            pub_stat = os.stat(pubkey_path)
+            pub_id = (pub_stat.st_ino, pub_stat.st_size, pub_stat.st_mtime)
+            if self.enc_token is None or self.enc_token[0] != pub_id:
+                pub = get_rsa_pub_key(pubkey_path)
+                if HAS_M2:
+                    token = pub.public_encrypt(self.token, RSA.pkcs1_oaep_padding)
+                else:
+                    cipher = PKCS1_OAEP.new(pub)
+                    token = cipher.encrypt(self.token)
+                self.enc_token = (pub_id, token)
+            payload['token'] = self.enc_token[1]
         except Exception:
             pass
         with salt.utils.files.fopen(self.pub_path) as f:
             payload['pub'] = f.read()
+        if HAS_GCM:
+            # Ask the master to encrypt the requests with AES-GCM
+            payload['aead'] = True
         return payload
 
     def decrypt_aes(self, payload, master_pub=True):
@@ -1169,6 +1207,9 @@ class SAuth(AsyncAuth):
             self.token = Crypticle.generate_key_string()
         else:
             self.token = salt.utils.stringutils.to_bytes(Crypticle.generate_key_string())
+        # The token encrypted with the master's public key, see
+        # minion_sign_in_payload()
+        self.enc_token = None
         self.serial = salt.payload.Serial(self.opts)
         self.pub_path = os.path.join(self.opts['pki_dir'], 'minion.pub')
         self.rsa_path = os.path.join(self.opts['pki_dir'], 'minion.pem')
@@ -1338,26 +1379,61 @@ class SAuth(AsyncAuth):
                 if salt.utils.crypt.pem_finger(m_pub_fn, sum_type=self.opts['hash_type']) != self.opts['master_finger']:
                     self._finger_fail(self.opts['master_finger'], m_pub_fn)
         auth['publish_port'] = payload['publish_port']
+        auth['aead'] = HAS_GCM and payload.get('aead', False)
         return auth
 
 
+def _compare_digest(digest_a, digest_b):
+    '''
+    Compare two digests of the same length in constant time
+    '''
+    if hasattr(hmac, 'compare_digest'):
+        return hmac.compare_digest(digest_a, digest_b)
+    result = 0
+    for byte_a, byte_b in zip(bytearray(digest_a), bytearray(digest_b)):
+        result |= byte_a ^ byte_b
+    return result == 0
+
+
 class Crypticle(object):
     '''
     Authenticated encryption class
 
     Encryption algorithm: AES-CBC
     Signing algorithm: HMAC-SHA256
+
+    Messages encrypted with ``aead=True`` use AES-GCM instead, with a key
+    derived from the signing key, if :py:data:`HAS_GCM` is True.
     '''
 
     PICKLE_PAD = b'pickle::'
     AES_BLOCK_SIZE = 16
     SIG_SIZE = hashlib.sha256().digest_size
+    AEAD_NONCE_SIZE = 12
+    AEAD_TAG_SIZE = 16
+
+    # The padding for each pad length, see encrypt()
+    PADS = [bytes(bytearray([pad])) * pad for pad in range(AES_BLOCK_SIZE + 1)]
 
     def __init__(self, opts, key_string, key_size=192):
         self.key_string = key_string
         self.keys = self.extract_keys(self.key_string, key_size)
         self.key_size = key_size
         self.serial = salt.payload.Serial(opts)
+        # Keyed once, copied for every message
+        self._hmac = hmac.new(self.keys[1], digestmod=hashlib.sha256)
+        # The AES-256 key of AES-GCM, not the one used with AES-CBC
+        self.aead_key = hmac.new(self.keys[1], b'aes-gcm', hashlib.sha256).digest()
+
+    def __getstate__(self):
+        # HMAC objects can't be pickled or copied
+        state = self.__dict__.copy()
+        del state['_hmac']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._hmac = hmac.new(self.keys[1], digestmod=hashlib.sha256)
 
     @classmethod
     def generate_key_string(cls, key_size=192):
@@ -1377,16 +1453,15 @@ class Crypticle(object):
         assert len(key) == key_size / 8 + cls.SIG_SIZE, 'invalid key'
         return key[:-cls.SIG_SIZE], key[-cls.SIG_SIZE:]
 
-    def encrypt(self, data):
+    def encrypt(self, data, aead=False):
         '''
-        encrypt data with AES-CBC and sign it with HMAC-SHA256
+        encrypt data with AES-CBC and sign it with HMAC-SHA256, or encrypt it
+        with AES-GCM if aead is True
         '''
-        aes_key, hmac_key = self.keys
-        pad = self.AES_BLOCK_SIZE - len(data) % self.AES_BLOCK_SIZE
-        if six.PY2:
-            data = data + pad * chr(pad)
-        else:
-            data = data + salt.utils.stringutils.to_bytes(pad * chr(pad))
+        if aead:
+            return self._encrypt_aead(data)
+        aes_key = self.keys[0]
+        data = data + self.PADS[self.AES_BLOCK_SIZE - len(data) % self.AES_BLOCK_SIZE]
         iv_bytes = os.urandom(self.AES_BLOCK_SIZE)
         if HAS_M2:
             cypher = EVP.Cipher(alg='aes_192_cbc', key=aes_key, iv=iv_bytes, op=1, padding=False)
@@ -1396,31 +1471,26 @@ class Crypticle(object):
             cypher = AES.new(aes_key, AES.MODE_CBC, iv_bytes)
             encr = cypher.encrypt(data)
         data = iv_bytes + encr
-        sig = hmac.new(hmac_key, data, hashlib.sha256).digest()
-        return data + sig
+        mac = self._hmac.copy()
+        mac.update(data)
+        return data + mac.digest()
 
-    def decrypt(self, data):
+    def decrypt(self, data, aead=False):
         '''
-        verify HMAC-SHA256 signature and decrypt data with AES-CBC
+        verify HMAC-SHA256 signature and decrypt data with AES-CBC, or
+        decrypt data with AES-GCM if aead is True
         '''
-        aes_key, hmac_key = self.keys
+        if aead:
+            return self._decrypt_aead(data)
+        aes_key = self.keys[0]
         sig = data[-self.SIG_SIZE:]
         data = data[:-self.SIG_SIZE]
         if six.PY3 and not isinstance(data, bytes):
             data = salt.utils.stringutils.to_bytes(data)
-        mac_bytes = hmac.new(hmac_key, data, hashlib.sha256).digest()
-        if len(mac_bytes) != len(sig):
-            log.debug('Failed to authenticate message')
-            raise AuthenticationError('message authentication failed')
-        result = 0
-
-        if six.PY2:
-            for zipped_x, zipped_y in zip(mac_bytes, sig):
-                result |= ord(zipped_x) ^ ord(zipped_y)
-        else:
-            for zipped_x, zipped_y in zip(mac_bytes, sig):
-                result |= zipped_x ^ zipped_y
-        if result != 0:
+        mac = self._hmac.copy()
+        mac.update(data)
+        mac_bytes = mac.digest()
+        if len(mac_bytes) != len(sig) or not _compare_digest(mac_bytes, sig):
             log.debug('Failed to authenticate message')
             raise AuthenticationError('message authentication failed')
         iv_bytes = data[:self.AES_BLOCK_SIZE]
@@ -1437,17 +1507,50 @@ class Crypticle(object):
         else:
             return data[:-data[-1]]
 
-    def dumps(self, obj):
+    def _encrypt_aead(self, data):
+        '''
+        encrypt data with AES-GCM, the nonce and the tag enclose the
+        encrypted data
+        '''
+        if not HAS_GCM:
+            raise AuthenticationError('AES-GCM is not available')
+        nonce = os.urandom(self.AEAD_NONCE_SIZE)
+        cypher = AES.new(self.aead_key, AES.MODE_GCM, nonce=nonce)
+        encr, tag = cypher.encrypt_and_digest(data)
+        return nonce + encr + tag
+
+    def _decrypt_aead(self, data):
+        '''
+        verify and decrypt data encrypted with AES-GCM
+        '''
+        if not HAS_GCM:
+            raise AuthenticationError('AES-GCM is not available')
+        if six.PY3 and not isinstance(data, bytes):
+            data = salt.utils.stringutils.to_bytes(data)
+        if len(data) < self.AEAD_NONCE_SIZE + self.AEAD_TAG_SIZE:
+            log.debug('Failed to authenticate message')
+            raise AuthenticationError('message authentication failed')
+        cypher = AES.new(self.aead_key, AES.MODE_GCM,
+                         nonce=data[:self.AEAD_NONCE_SIZE])
+        try:
+            return cypher.decrypt_and_verify(
+                data[self.AEAD_NONCE_SIZE:-self.AEAD_TAG_SIZE],
+                data[-self.AEAD_TAG_SIZE:])
+        except ValueError:
+            log.debug('Failed to authenticate message')
+            raise AuthenticationError('message authentication failed')
+
+    def dumps(self, obj, aead=False):
         '''
         Serialize and encrypt a python object
         '''
-        return self.encrypt(self.PICKLE_PAD + self.serial.dumps(obj))
+        return self.encrypt(self.PICKLE_PAD + self.serial.dumps(obj), aead=aead)
 
-    def loads(self, data, raw=False):
+    def loads(self, data, raw=False, aead=False):
         '''
         Decrypt and un-serialize a python object
         '''
-        data = self.decrypt(data)
+        data = self.decrypt(data, aead=aead)
         # simple integrity check to verify that we got meaningful data
         if not data.startswith(self.PICKLE_PAD):
             return {}
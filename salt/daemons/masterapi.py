@@ -47,6 +47,7 @@ import salt.utils.verify
 import salt.utils.versions
 from salt.defaults import DEFAULT_TARGET_DELIM
 from salt.pillar import git_pillar
+from salt.utils.odict import OrderedDict
 
 # Import 3rd-party libs
 from salt.ext import six
@@ -407,6 +408,9 @@ class RemoteFuncs(object):
     Funcitons made available to minions, this class includes the raw routines
     post validation that make up the minion access to the master
     '''
+    # The number of _mine_get results kept when mine_get_cache_ttl is set
+    mine_get_cache_size = 256
+
     def __init__(self, opts):
         self.opts = opts
         self.event = salt.utils.event.get_event(
@@ -428,6 +432,9 @@ class RemoteFuncs(object):
                 rend=False)
         self.__setup_fileserver()
         self.cache = salt.cache.factory(opts)
+        # Recent _mine_get results:
+        # {(tgt, tgt_type, functions, ret_dict): [expires, ret], ...}
+        self.mine_get_cache = OrderedDict()
 
     def __setup_fileserver(self):
         '''
@@ -599,6 +606,23 @@ class RemoteFuncs(object):
             match_type = 'pillar_exact'
         if match_type.lower() == 'compound':
             match_type = 'compound_pillar_exact'
+
+        cache_ttl = self.opts.get('mine_get_cache_ttl', 0)
+        if cache_ttl > 0:
+            tgt = load['tgt']
+            if isinstance(tgt, list):
+                tgt = tuple(tgt)
+            cache_key = (tgt, match_type, tuple(functions_allowed), _ret_dict)
+            try:
+                expires, ret = self.mine_get_cache.pop(cache_key)
+            except (KeyError, TypeError):
+                pass
+            else:
+                if expires > time.time():
+                    self.mine_get_cache[cache_key] = [expires, ret]
+                    return ret
+                ret = {}
+
         checker = salt.utils.minions.CkMinions(self.opts)
         _res = checker.check_minions(
                 load['tgt'],
@@ -606,8 +630,12 @@ class RemoteFuncs(object):
                 greedy=False
                 )
         minions = _res['minions']
+        # Fetch the mine of all the minions at once, from cache modules which
+        # support it
+        mines = self.cache.fetch_many(
+            ['minions/{0}'.format(minion) for minion in minions], 'mine')
         for minion in minions:
-            fdata = self.cache.fetch('minions/{0}'.format(minion), 'mine')
+            fdata = mines.get('minions/{0}'.format(minion))
 
             if not isinstance(fdata, dict):
                 continue
@@ -618,6 +646,14 @@ class RemoteFuncs(object):
                 for fun in list(set(functions_allowed) & set(fdata.keys())):
                     ret.setdefault(fun, {})[minion] = fdata.get(fun)
 
+        if cache_ttl > 0:
+            try:
+                self.mine_get_cache[cache_key] = [time.time() + cache_ttl, ret]
+            except TypeError:
+                # The target can't be a key
+                pass
+            while len(self.mine_get_cache) > self.mine_get_cache_size:
+                self.mine_get_cache.popitem(last=False)
         return ret
 
     def _mine(self, load, skip_verify=False):
@@ -636,6 +672,7 @@ class RemoteFuncs(object):
                     data.update(load['data'])
                     load['data'] = data
             self.cache.store(cbank, ckey, load['data'])
+            self.mine_get_cache.clear()
         return True
 
     def _mine_delete(self, load):
@@ -654,6 +691,7 @@ class RemoteFuncs(object):
                 if load['fun'] in data:
                     del data[load['fun']]
                     self.cache.store(cbank, ckey, data)
+                    self.mine_get_cache.clear()
             except OSError:
                 return False
         return True
@@ -665,6 +703,7 @@ class RemoteFuncs(object):
         if not skip_verify and 'id' not in load:
             return False
         if self.opts.get('minion_data_cache', False) or self.opts.get('enforce_mine_cache', False):
+            self.mine_get_cache.clear()
             return self.cache.flush('minions/{0}'.format(load['id']), 'mine')
         return True
 
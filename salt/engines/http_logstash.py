@@ -31,13 +31,11 @@ them onto a logstash endpoint via HTTP requests.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-# Import python lib
-import fnmatch
-
 # Import salt libs
 import salt.utils.http
 import salt.utils.event
 import salt.utils.json
+import salt.utils.tagmatch
 
 # ----------------------------------------------------------------------------------------------------------------------
 # module properties
@@ -102,16 +100,14 @@ def start(url, funs=None, tags=None):
                                            sock_dir=__opts__['sock_dir'],
                                            transport=__opts__['transport'],
                                            opts=__opts__)
+    tag_matcher = salt.utils.tagmatch.TagMatcher(
+        tags if isinstance(tags, list) else [])
     while True:
         event = event_bus.get_event(full=True)
         if event:
             publish = True
-            if isinstance(tags, list) and len(tags) > 0:
-                found_match = False
-                for tag in tags:
-                    if fnmatch.fnmatch(event['tag'], tag):
-                        found_match = True
-                publish = found_match
+            if tag_matcher:
+                publish = tag_matcher.match(event['tag'])
             if funs and 'fun' in event['data']:
                 if not event['data']['fun'] in funs:
                     publish = False
@@ -48,6 +48,10 @@ from salt.ext.six.moves.urllib.parse import urlparse, urlunparse
 log = logging.getLogger(__name__)
 MAX_FILENAME_LENGTH = 255
 
+# The lists of the salt:// files fetched inside each running record_fetched()
+# block, by the id of the list
+_FETCHED = {}
+
 
 def get_file_client(opts, pillar=False):
     '''
@@ -64,6 +68,31 @@ def get_file_client(opts, pillar=False):
     }.get(client, RemoteClient)(opts)
 
 
+@contextlib.contextmanager
+def record_fetched():
+    '''
+    Record the salt:// files fetched through any file client while the
+    ``with`` block runs, yields a list of ``(saltenv, path)`` tuples
+    '''
+    fetched = []
+    _FETCHED[id(fetched)] = fetched
+    try:
+        yield fetched
+    finally:
+        _FETCHED.pop(id(fetched), None)
+
+
+def _record_fetch(path, saltenv):
+    '''
+    Add a fetched salt:// file to the running record_fetched() blocks
+    '''
+    if not _FETCHED:
+        return
+    path, senv = salt.utils.url.split_env(path)
+    for fetched in list(_FETCHED.values()):
+        fetched.append((senv or saltenv, path))
+
+
 def decode_dict_keys_to_str(src):
     '''
     Convert top level keys from bytes to strings if possible.
@@ -836,6 +865,7 @@ class PillarClient(Client):
         Copies a file from the local files directory into :param:`dest`
         gzip compression settings are ignored for local files
         '''
+        _record_fetch(path, saltenv)
         path = self._check_proto(path)
         fnd = self._find_file(path, saltenv)
         fnd_path = fnd.get('path')
@@ -1037,6 +1067,7 @@ class RemoteClient(Client):
         path, senv = salt.utils.url.split_env(path)
         if senv:
             saltenv = senv
+        _record_fetch(path, saltenv)
 
         if not salt.utils.platform.is_windows():
             hash_server, stat_server = self.hash_and_stat_file(path, saltenv)
@@ -26,6 +26,7 @@ import salt.utils.files
 import salt.utils.json
 import salt.utils.kinds
 import salt.utils.master
+import salt.utils.pki
 import salt.utils.sdb
 import salt.utils.stringutils
 import salt.utils.user
@@ -528,12 +529,7 @@ class Key(object):
                 continue
             ret[os.path.basename(dir_)] = []
             try:
-                for fn_ in salt.utils.data.sorted_ignorecase(os.listdir(dir_)):
-                    if not fn_.startswith('.'):
-                        if os.path.isfile(os.path.join(dir_, fn_)):
-                            ret[os.path.basename(dir_)].append(
-                                salt.utils.stringutils.to_unicode(fn_)
-                            )
+                ret[os.path.basename(dir_)] = salt.utils.pki.list_keys(self.opts, dir_)
             except (OSError, IOError):
                 # key dir kind is not created yet, just skip
                 continue
@@ -554,29 +550,13 @@ class Key(object):
         acc, pre, rej, den = self._check_minions_directories()
         ret = {}
         if match.startswith('acc'):
-            ret[os.path.basename(acc)] = []
-            for fn_ in salt.utils.data.sorted_ignorecase(os.listdir(acc)):
-                if not fn_.startswith('.'):
-                    if os.path.isfile(os.path.join(acc, fn_)):
-                        ret[os.path.basename(acc)].append(fn_)
+            ret[os.path.basename(acc)] = salt.utils.pki.list_keys(self.opts, acc)
         elif match.startswith('pre') or match.startswith('un'):
-            ret[os.path.basename(pre)] = []
-            for fn_ in salt.utils.data.sorted_ignorecase(os.listdir(pre)):
-                if not fn_.startswith('.'):
-                    if os.path.isfile(os.path.join(pre, fn_)):
-                        ret[os.path.basename(pre)].append(fn_)
+            ret[os.path.basename(pre)] = salt.utils.pki.list_keys(self.opts, pre)
         elif match.startswith('rej'):
-            ret[os.path.basename(rej)] = []
-            for fn_ in salt.utils.data.sorted_ignorecase(os.listdir(rej)):
-                if not fn_.startswith('.'):
-                    if os.path.isfile(os.path.join(rej, fn_)):
-                        ret[os.path.basename(rej)].append(fn_)
+            ret[os.path.basename(rej)] = salt.utils.pki.list_keys(self.opts, rej)
         elif match.startswith('den') and den is not None:
-            ret[os.path.basename(den)] = []
-            for fn_ in salt.utils.data.sorted_ignorecase(os.listdir(den)):
-                if not fn_.startswith('.'):
-                    if os.path.isfile(os.path.join(den, fn_)):
-                        ret[os.path.basename(den)].append(fn_)
+            ret[os.path.basename(den)] = salt.utils.pki.list_keys(self.opts, den)
         elif match.startswith('all'):
             return self.all_keys()
         return ret
@@ -59,6 +59,7 @@ import salt.utils.jid
 import salt.utils.job
 import salt.utils.master
 import salt.utils.minions
+import salt.utils.pki
 import salt.utils.platform
 import salt.utils.process
 import salt.utils.schedule
@@ -248,16 +249,14 @@ class Maintenance(salt.utils.process.SignalHandlingMultiprocessingProcess):
         which contains a list
         '''
         if self.opts['key_cache'] == 'sched':
-            keys = []
             #TODO DRY from CKMinions
             if self.opts['transport'] in ('zeromq', 'tcp'):
                 acc = 'minions'
             else:
                 acc = 'accepted'
 
-            for fn_ in os.listdir(os.path.join(self.opts['pki_dir'], acc)):
-                if not fn_.startswith('.') and os.path.isfile(os.path.join(self.opts['pki_dir'], acc, fn_)):
-                    keys.append(fn_)
+            keys = salt.utils.pki.list_keys(
+                self.opts, os.path.join(self.opts['pki_dir'], acc))
             log.debug('Writing master key cache')
             # Write a temporary file securely
             with salt.utils.atomicfile.atomic_open(os.path.join(self.opts['pki_dir'], acc, '.key_cache')) as cache_file:
@@ -1166,6 +1165,10 @@ class AESFuncs(object):
         )
         self.__setup_fileserver()
         self.masterapi = salt.daemons.masterapi.RemoteFuncs(opts)
+        # The parsed public keys of the minions which sent requests most
+        # recently and their last verified token:
+        # {id: [key file stat, key, token, token verified until], ...}
+        self.minion_keys = OrderedDict()
 
     def __setup_fileserver(self):
         '''
@@ -1199,8 +1202,17 @@ class AESFuncs(object):
             return False
         pub_path = os.path.join(self.opts['pki_dir'], 'minions', id_)
 
+        # The cached key is used as long as the key file is not replaced or
+        # removed, which happens when the key is rejected or deleted
+        entry = self.minion_keys.pop(id_, None)
         try:
-            pub = salt.crypt.get_rsa_pub_key(pub_path)
+            stat = os.stat(pub_path)
+            key_stat = (stat.st_ino, stat.st_size, stat.st_mtime)
+            if entry is None or entry[0] != key_stat:
+                entry = [key_stat,
+                         salt.crypt.get_rsa_pub_key(pub_path),
+                         None,
+                         0]
         except (IOError, OSError):
             log.warning(
                 'Salt minion claiming to be %s attempted to communicate with '
@@ -1210,8 +1222,20 @@ class AESFuncs(object):
             return False
         except (ValueError, IndexError, TypeError) as err:
             log.error('Unable to load public key "%s": %s', pub_path, err)
+            return False
+        cache_size = self.opts.get('minion_key_cache_size', 0)
+        if cache_size > 0:
+            self.minion_keys[id_] = entry
+            while len(self.minion_keys) > cache_size:
+                self.minion_keys.popitem(last=False)
+
+        if entry[2] == token and entry[3] > time.time():
+            # Verified with this key less than minion_token_cache_ttl ago
+            return True
         try:
-            if salt.crypt.public_decrypt(pub, token) == b'salt':
+            if salt.crypt.public_decrypt(entry[1], token) == b'salt':
+                entry[2] = token
+                entry[3] = time.time() + self.opts.get('minion_token_cache_ttl', 0)
                 return True
         except ValueError as err:
             log.error('Unable to decrypt token: %s', err)
@@ -315,6 +315,16 @@ def get_proc_dir(cachedir, **kwargs):
     return fn_
 
 
+def _jid_queue_path(opts):
+    '''
+    Return the path the minion keeps its jid queue in, None if it is only kept
+    in memory
+    '''
+    if not opts.get('minion_jid_queue_cache', False):
+        return None
+    return os.path.join(opts['cachedir'], 'minion_jid_queue.p')
+
+
 def load_args_and_kwargs(func, args, data=None, ignore_invalid=False):
     '''
     Detect the args and kwargs that need to be passed to a function call, and
@@ -948,7 +958,10 @@ class MinionManager(MinionBase):
         self.auth_wait = self.opts['acceptance_wait_time']
         self.max_auth_wait = self.opts['acceptance_wait_time_max']
         self.minions = []
-        self.jid_queue = []
+        self.jid_queue = salt.utils.minion.JidQueue(
+            self.opts['minion_jid_queue_hwm'],
+            path=_jid_queue_path(self.opts),
+            opts=self.opts)
 
         install_zmq()
         self.io_loop = ZMQDefaultLoop.current()
@@ -1129,7 +1142,14 @@ class Minion(MinionBase):
         # Flag meaning minion has finished initialization including first connect to the master.
         # True means the Minion is fully functional and ready to handle events.
         self.ready = False
-        self.jid_queue = [] if jid_queue is None else jid_queue
+        if not isinstance(jid_queue, salt.utils.minion.JidQueue):
+            # A list of jids, or None
+            jid_queue = salt.utils.minion.JidQueue(
+                self.opts['minion_jid_queue_hwm'],
+                jids=jid_queue,
+                path=_jid_queue_path(self.opts) if jid_queue is None else None,
+                opts=self.opts)
+        self.jid_queue = jid_queue
         self.periodic_callbacks = {}
 
         if io_loop is None:
@@ -1505,13 +1525,8 @@ class Minion(MinionBase):
 
         # Don't duplicate jobs
         log.trace('Started JIDs: %s', self.jid_queue)
-        if self.jid_queue is not None:
-            if data['jid'] in self.jid_queue:
-                return
-            else:
-                self.jid_queue.append(data['jid'])
-                if len(self.jid_queue) > self.opts['minion_jid_queue_hwm']:
-                    self.jid_queue.pop(0)
+        if not self.jid_queue.add(data['jid']):
+            return
 
         if isinstance(data['fun'], six.string_types):
             if data['fun'] == 'sys.reload_modules':
@@ -2940,7 +2955,7 @@ class Syndic(Minion):
         opts['loop_interval'] = 1
         super(Syndic, self).__init__(opts, **kwargs)
         self.mminion = salt.minion.MasterMinion(opts)
-        self.jid_forward_cache = set()
+        self.jid_forward_cache = OrderedDict()
         self.jids = {}
         self.raw_events = []
         self.pub_future = None
@@ -3100,7 +3115,8 @@ class SyndicManager(MinionBase):
         self.max_auth_wait = self.opts['acceptance_wait_time_max']
 
         self._has_master = threading.Event()
-        self.jid_forward_cache = set()
+        # The jids whose load was forwarded, oldest first
+        self.jid_forward_cache = OrderedDict()
 
         if io_loop is None:
             install_zmq()
@@ -3112,6 +3128,8 @@ class SyndicManager(MinionBase):
         self.raw_events = []
         # Dict of rets: {master_id: {event_tag: job_ret, ...}, ...}
         self.job_rets = {}
+        # Number of minion returns in job_rets: {master_id: count, ...}
+        self.job_ret_counts = {}
         # List of delayed job_rets which was unable to send for some reason and will be resend to
         # any available master
         self.delayed = []
@@ -3293,6 +3311,7 @@ class SyndicManager(MinionBase):
 
     def _reset_event_aggregation(self):
         self.job_rets = {}
+        self.job_ret_counts = {}
         self.raw_events = []
 
     def reconnect_event_bus(self, something):
@@ -3332,13 +3351,17 @@ class SyndicManager(MinionBase):
 
     def _process_event(self, raw):
         # TODO: cleanup: Move down into event class
-        mtag, data = self.local.event.unpack(raw, self.local.event.serial)
+        mtag, mdata = self.local.event.unpack_tag(raw)
         log.trace('Got event %s', mtag)  # pylint: disable=no-member
 
         tag_parts = mtag.split('/')
-        if len(tag_parts) >= 4 and tag_parts[1] == 'job' and \
-            salt.utils.jid.is_jid(tag_parts[2]) and tag_parts[3] == 'ret' and \
-            'return' in data:
+        is_ret = len(tag_parts) >= 4 and tag_parts[1] == 'job' and \
+            salt.utils.jid.is_jid(tag_parts[2]) and tag_parts[3] == 'ret'
+        if not is_ret and self.syndic_mode != 'sync':
+            # Only job returns are forwarded, don't unpack anything else
+            return
+        data = self.local.event.serial.loads(mdata, encoding='utf-8')
+        if is_ret and 'return' in data:
             if 'jid' not in data:
                 # Not a job return
                 return
@@ -3359,12 +3382,10 @@ class SyndicManager(MinionBase):
                     jdict['__load__'].update(
                         self.mminion.returners[fstr](data['jid'])
                         )
-                    self.jid_forward_cache.add(data['jid'])
+                    self.jid_forward_cache[data['jid']] = True
                     if len(self.jid_forward_cache) > self.opts['syndic_jid_forward_cache_hwm']:
                         # Pop the oldest jid from the cache
-                        tmp = sorted(list(self.jid_forward_cache))
-                        tmp.pop(0)
-                        self.jid_forward_cache = set(tmp)
+                        self.jid_forward_cache.popitem(last=False)
             if master is not None:
                 # __'s to make sure it doesn't print out on the master cli
                 jdict['__master_id__'] = master
@@ -3373,6 +3394,13 @@ class SyndicManager(MinionBase):
                 if key in data:
                     ret[key] = data[key]
             jdict[data['id']] = ret
+            count = self.job_ret_counts.get(master, 0) + 1
+            self.job_ret_counts[master] = count
+            batch_size = self.opts.get('syndic_forward_batch_size', 0)
+            if batch_size and count >= batch_size:
+                # Don't wait for syndic_event_forward_timeout to forward a
+                # full batch
+                self._forward_job_rets(master)
         else:
             # TODO: config to forward these? If so we'll have to keep track of who
             # has seen them
@@ -3399,10 +3427,18 @@ class SyndicManager(MinionBase):
             if res:
                 self.delayed = []
         for master in list(six.iterkeys(self.job_rets)):
-            values = list(six.itervalues(self.job_rets[master]))
-            res = self._return_pub_syndic(values, master_id=master)
-            if res:
-                del self.job_rets[master]
+            self._forward_job_rets(master)
+
+    def _forward_job_rets(self, master):
+        '''
+        Forward the job returns aggregated for a master, they are kept if the
+        master can't take them yet
+        '''
+        values = list(six.itervalues(self.job_rets[master]))
+        res = self._return_pub_syndic(values, master_id=master)
+        if res:
+            del self.job_rets[master]
+            self.job_ret_counts.pop(master, None)
 
 
 class ProxyMinionManager(MinionManager):
@@ -235,6 +235,15 @@ def items(*args, **kwargs):
         Included only for compatibility with
         :conf_minion:`pillarenv_from_saltenv`, and is otherwise ignored.
 
+    render_profile : False
+        Record the time spent rendering each pillar SLS file when the pillar
+        is compiled locally (masterless minions). The report is written as
+        JSON to ``<cachedir>/render_profile/pillar.<minion_id>.json``. Pillar
+        compiled by the master is profiled when the master's
+        :conf_master:`render_profile` option is enabled.
+
+        .. versionadded:: Neon
+
     CLI Example:
 
     .. code-block:: bash
@@ -268,8 +277,12 @@ def items(*args, **kwargs):
                 'Failed to decrypt pillar override: {0}'.format(exc)
             )
 
+    opts = __opts__
+    if kwargs.get('render_profile'):
+        opts = dict(__opts__, render_profile=True)
+
     pillar = salt.pillar.get_pillar(
-        __opts__,
+        opts,
         __grains__,
         __opts__['id'],
         pillar_override=pillar_override,
@@ -34,6 +34,7 @@ import salt.utils.hashutils
 import salt.utils.jid
 import salt.utils.json
 import salt.utils.platform
+import salt.utils.profile
 import salt.utils.state
 import salt.utils.stringutils
 import salt.utils.url
@@ -999,6 +1000,14 @@ def highstate(test=None, queue=False, **kwargs):
 
         .. versionadded:: 2015.8.4
 
+    render_profile : False
+        Record the time spent rendering each SLS file, per renderer, along
+        with the ``salt[...]`` calls made while rendering. The report is
+        written as JSON to ``<cachedir>/render_profile/state.highstate.json``.
+        Also enabled by the :conf_minion:`render_profile` option.
+
+        .. versionadded:: Neon
+
     CLI Examples:
 
     .. code-block:: bash
@@ -1074,13 +1083,14 @@ def highstate(test=None, queue=False, **kwargs):
     orchestration_jid = kwargs.get('orchestration_jid')
     snapper_pre = _snapper_pre(opts, kwargs.get('__pub_jid', 'called localy'))
     try:
-        ret = st_.call_highstate(
-                exclude=kwargs.get('exclude', []),
-                cache=kwargs.get('cache', None),
-                cache_name=kwargs.get('cache_name', 'highstate'),
-                force=kwargs.get('force', False),
-                whitelist=kwargs.get('whitelist'),
-                orchestration_jid=orchestration_jid)
+        with salt.utils.profile.render_profile(opts, 'state.highstate'):
+            ret = st_.call_highstate(
+                    exclude=kwargs.get('exclude', []),
+                    cache=kwargs.get('cache', None),
+                    cache_name=kwargs.get('cache_name', 'highstate'),
+                    force=kwargs.get('force', False),
+                    whitelist=kwargs.get('whitelist'),
+                    orchestration_jid=orchestration_jid)
     finally:
         st_.pop_active()
 
@@ -1324,7 +1334,8 @@ def sls(mods, test=None, exclude=None, queue=False, sync_mods=None, **kwargs):
 
     st_.push_active()
     try:
-        high_, errors = st_.render_highstate({opts['saltenv']: mods})
+        with salt.utils.profile.render_profile(opts, 'state.sls'):
+            high_, errors = st_.render_highstate({opts['saltenv']: mods})
 
         if errors:
             __context__['retcode'] = salt.defaults.exitcodes.EX_STATE_COMPILER_ERROR
@@ -1872,11 +1883,20 @@ def show_sls(mods, test=None, queue=False, **kwargs):
         :conf_minion:`pillarenv` minion config option nor this CLI argument is
         used, all Pillar environments will be merged together.
 
+    render_profile : False
+        Record the time spent rendering each SLS file, per renderer, along
+        with the ``salt[...]`` calls made while rendering. The report is
+        written as JSON to ``<cachedir>/render_profile/state.show_sls.json``.
+        Also enabled by the :conf_minion:`render_profile` option.
+
+        .. versionadded:: Neon
+
     CLI Example:
 
     .. code-block:: bash
 
         salt '*' state.show_sls core,edit.vim saltenv=dev
+        salt '*' state.show_sls core render_profile=True
     '''
     if 'env' in kwargs:
         # "env" is not supported; Use "saltenv".
@@ -1925,7 +1945,8 @@ def show_sls(mods, test=None, queue=False, **kwargs):
     mods = salt.utils.args.split_input(mods)
     st_.push_active()
     try:
-        high_, errors = st_.render_highstate({opts['saltenv']: mods})
+        with salt.utils.profile.render_profile(opts, 'state.show_sls'):
+            high_, errors = st_.render_highstate({opts['saltenv']: mods})
     finally:
         st_.pop_active()
     errors += st_.state.verify_high(high_)
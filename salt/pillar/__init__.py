@@ -26,6 +26,7 @@ import salt.utils.cache
 import salt.utils.crypt
 import salt.utils.data
 import salt.utils.dictupdate
+import salt.utils.profile
 import salt.utils.url
 from salt.exceptions import SaltClientError
 from salt.template import compile_template
@@ -983,6 +984,11 @@ class Pillar(object):
         '''
         Render the pillar data and return
         '''
+        with salt.utils.profile.render_profile(
+                self.opts, 'pillar.{0}'.format(self.minion_id)):
+            return self._compile_pillar(ext=ext)
+
+    def _compile_pillar(self, ext=True):
         top, top_errors = self.get_top()
         if ext:
             if self.opts.get('ext_pillar_first', False):
@@ -7,6 +7,8 @@ Module for sending events using the runner system.
 from __future__ import absolute_import, print_function, unicode_literals
 
 import logging
+import time
+import uuid
 
 import salt.utils.event
 
@@ -78,3 +80,44 @@ def send(tag, data=None):
     event = salt.utils.event.get_master_event(__opts__, __opts__['sock_dir'],
                                               listen=False)
     return event.fire_event(data, tag)
+
+
+def stats(timeout=5):
+    '''
+    .. versionadded:: Neon
+
+    Return the statistics of the master event bus: the number of events and
+    bytes published per tag prefix with their rates over the last 10 seconds,
+    the number of subscribers, the messages queued for each of them and the
+    time from publishing events to writing them to the subscribers.
+
+    :param timeout: the number of seconds to wait for the event publisher
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        salt-run event.stats
+    '''
+    request_id = uuid.uuid4().hex
+    event = salt.utils.event.get_master_event(__opts__, __opts__['sock_dir'],
+                                              listen=True)
+    try:
+        tag = salt.utils.event.EventBusStats.tag
+        event.subscribe(tag)
+        event.fire_event({'id': request_id},
+                         salt.utils.event.EventBusStats.request_tag)
+        end = time.time() + timeout
+        while time.time() < end:
+            ret = event.get_event(wait=end - time.time(), tag=tag, full=True)
+            if ret is None:
+                break
+            if ret['tag'] == tag and ret['data'].get('id') == request_id:
+                data = ret['data']
+                data.pop('id')
+                data.pop('_stamp', None)
+                return data
+    finally:
+        event.destroy()
+    return 'The event publisher did not return its statistics within {0} ' \
+           'seconds'.format(timeout)
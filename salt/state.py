@@ -25,6 +25,7 @@ import traceback
 import re
 import time
 import random
+import multiprocessing
 
 # Import salt libs
 import salt.loader
@@ -40,6 +41,7 @@ import salt.utils.event
 import salt.utils.files
 import salt.utils.hashutils
 import salt.utils.immutabletypes as immutabletypes
+import salt.utils.json
 import salt.utils.platform
 import salt.utils.process
 import salt.utils.url
@@ -114,6 +116,7 @@ STATE_RUNTIME_KEYWORDS = frozenset([
     '__sls__',
     '__id__',
     '__orchestration_jid__',
+    '__auto_order__',
     '__pub_user',
     '__pub_arg',
     '__pub_jid',
@@ -357,6 +360,22 @@ def mock_ret(cdata):
             'result': True}
 
 
+# Types whose values chunks compiled from the same declaration can share
+_IMMUTABLE_LOW_TYPES = six.string_types + six.integer_types + \
+    (six.binary_type, float, bool, type(None))
+
+
+def _copy_low(chunk):
+    '''
+    Return a copy of a low chunk which shares the immutable values, strings,
+    numbers and the like, and holds deep copies of all the others, so that a
+    state mutating its arguments never changes the arguments of another chunk
+    '''
+    return dict(
+        (key, val if isinstance(val, _IMMUTABLE_LOW_TYPES) else copy.deepcopy(val))
+        for key, val in six.iteritems(chunk))
+
+
 class StateError(Exception):
     '''
     Custom exception class.
@@ -757,6 +776,9 @@ class State(object):
         self.instance_id = six.text_type(id(self))
         self.inject_globals = {}
         self.mocked = mocked
+        self._auto_parallel = set()
+        self._parallel_procs = []
+        self._fingerprints = None
 
     def _gather_pillar(self):
         '''
@@ -1349,6 +1371,9 @@ class State(object):
         the individual state executor structures
         '''
         chunks = []
+        # Chunks are kept for the whole run, so store a single copy of the
+        # strings which are repeated across most of them
+        intern_ = {}.setdefault
         for name, body in six.iteritems(high):
             if name.startswith('__'):
                 continue
@@ -1357,18 +1382,18 @@ class State(object):
                 names = []
                 if state.startswith('__'):
                     continue
-                chunk = {'state': state,
-                         'name': name}
+                chunk = {'state': intern_(state, state),
+                         'name': intern_(name, name)}
                 if orchestration_jid is not None:
                     chunk['__orchestration_jid__'] = orchestration_jid
                 if '__sls__' in body:
-                    chunk['__sls__'] = body['__sls__']
+                    chunk['__sls__'] = intern_(body['__sls__'], body['__sls__'])
                 if '__env__' in body:
-                    chunk['__env__'] = body['__env__']
-                chunk['__id__'] = name
+                    chunk['__env__'] = intern_(body['__env__'], body['__env__'])
+                chunk['__id__'] = chunk['name']
                 for arg in run:
                     if isinstance(arg, six.string_types):
-                        funcs.add(arg)
+                        funcs.add(intern_(arg, arg))
                         continue
                     if isinstance(arg, dict):
                         for key, val in six.iteritems(arg):
@@ -1388,7 +1413,7 @@ class State(object):
                 if names:
                     name_order = 1
                     for entry in names:
-                        live = copy.deepcopy(chunk)
+                        live = _copy_low(chunk)
                         if isinstance(entry, dict):
                             low_name = next(six.iterkeys(entry))
                             live['name'] = low_name
@@ -1401,7 +1426,7 @@ class State(object):
                             live['fun'] = fun
                             chunks.append(live)
                 else:
-                    live = copy.deepcopy(chunk)
+                    live = _copy_low(chunk)
                     for fun in funcs:
                         live['fun'] = fun
                         chunks.append(live)
@@ -1799,10 +1824,12 @@ class State(object):
         if not name:
             name = low.get('name', low.get('__id__'))
 
+        self._wait_parallel_slot()
         proc = salt.utils.process.MultiprocessingProcess(
                 target=self._call_parallel_target,
                 args=(name, cdata, low))
         proc.start()
+        self._parallel_procs.append(proc)
         ret = {'name': name,
                 'result': None,
                 'changes': {},
@@ -1810,6 +1837,172 @@ class State(object):
                 'proc': proc}
         return ret
 
+    def _wait_parallel_slot(self):
+        '''
+        Block until fewer than ``state_parallel_workers`` parallel state
+        processes are running
+        '''
+        limit = self.opts.get('state_parallel_workers')
+        if limit is None:
+            limit = multiprocessing.cpu_count()
+        if not limit:
+            return
+        while True:
+            self._parallel_procs = [proc for proc in self._parallel_procs
+                                    if proc.is_alive()]
+            if len(self._parallel_procs) < limit:
+                return
+            # Wake up as soon as the oldest process exits
+            self._parallel_procs[0].join(0.1)
+
+    def _wait_procs(self, running, tags=None):
+        '''
+        Wait for the parallel processes of the given tags, or of every chunk
+        in running if no tags are passed, to exit and collect their returns
+        '''
+        if tags is None:
+            tags = list(running)
+        for tag in tags:
+            ret = running.get(tag)
+            if isinstance(ret, dict) and ret.get('proc'):
+                ret['proc'].join()
+        self.reconcile_procs(running)
+
+    def _auto_parallel_tags(self, chunks):
+        '''
+        Return the tags of the chunks which can run in parallel when
+        ``state_auto_parallel`` is enabled: chunks which neither declare a
+        requisite nor are the target of one, and which do not change the
+        runtime of the states after them
+        '''
+        if not self.opts.get('state_auto_parallel', False) \
+                or self.opts.get('failhard', False) \
+                or self.mocked:
+            return set()
+
+        def _matches(chunk, req_key, req_val):
+            if req_key == 'sls':
+                return fnmatch.fnmatch(chunk['__sls__'], req_val)
+            if req_key != 'id' and chunk['state'] != req_key:
+                return False
+            return (fnmatch.fnmatch(chunk['name'], req_val) or
+                    fnmatch.fnmatch(chunk['__id__'], req_val))
+
+        # Build the requisite edges once, the target of any edge has to keep
+        # running in order
+        targets = []
+        for low in chunks:
+            for r_state in STATE_REQUISITE_KEYWORDS:
+                for req in low.get(r_state) or []:
+                    if isinstance(req, six.string_types):
+                        req = {'id': req}
+                    if not isinstance(req, dict) or not req:
+                        continue
+                    req_key, req_val = next(six.iteritems(trim_req(req)))
+                    if isinstance(req_val, six.string_types):
+                        targets.append((req_key, req_val))
+
+        tags = set()
+        for low in chunks:
+            if any(r_state in low for r_state in STATE_REQUISITE_KEYWORDS):
+                continue
+            if any(low.get(key) for key in ('failhard',
+                                            'reload_modules',
+                                            'reload_pillar',
+                                            'reload_grains')):
+                continue
+            if low.get('parallel') is False:
+                continue
+            if '{0}.mod_aggregate'.format(low['state']) in self.states:
+                continue
+            if any(_matches(low, req_key, req_val) for req_key, req_val in targets):
+                continue
+            tags.add(_gen_tag(low))
+        return tags
+
+    def _fingerprint_path(self):
+        return os.path.join(self.opts['cachedir'], 'state_fingerprints.p')
+
+    def _load_fingerprints(self, chunks):
+        '''
+        Load the input fingerprints recorded by the last incremental runs, by
+        SLS and tag, and forget those of the states which are gone from the
+        SLS files of the given chunks
+        '''
+        self._fingerprints = None
+        if not self.opts.get('state_incremental', False):
+            return
+        fingerprints = {}
+        path = self._fingerprint_path()
+        if os.path.isfile(path):
+            try:
+                with salt.utils.files.fopen(path, 'rb') as fp_:
+                    fingerprints = msgpack_deserialize(fp_.read())
+            except Exception as exc:
+                log.warning('Unable to read state fingerprints from %s: %s', path, exc)
+            if not isinstance(fingerprints, dict):
+                fingerprints = {}
+        tags = {}
+        for low in chunks:
+            tags.setdefault(low.get('__sls__') or '', set()).add(_gen_tag(low))
+        for sls, sls_tags in six.iteritems(tags):
+            recorded = fingerprints.get(sls)
+            if isinstance(recorded, dict):
+                fingerprints[sls] = dict(
+                    (tag, fingerprint)
+                    for tag, fingerprint in six.iteritems(recorded)
+                    if tag in sls_tags)
+            else:
+                fingerprints[sls] = {}
+        self._fingerprints = fingerprints
+
+    def _store_fingerprints(self):
+        '''
+        Persist the input fingerprints of the chunks which succeeded
+        '''
+        if not self.opts.get('state_incremental', False) \
+                or self._fingerprints is None \
+                or self.opts.get('test', False):
+            return
+        path = self._fingerprint_path()
+        try:
+            with salt.utils.files.set_umask(0o077):
+                with salt.utils.files.fopen(path, 'wb+') as fp_:
+                    fp_.write(msgpack_serialize(self._fingerprints))
+        except (IOError, OSError) as exc:
+            log.warning('Unable to write state fingerprints to %s: %s', path, exc)
+
+    def _fingerprint(self, low, cdata):
+        '''
+        Return a hash of the arguments the state function is called with and
+        of the facts returned by the mod_fingerprint function of the state
+        module. Return None if the chunk can not be skipped by an incremental
+        run.
+        '''
+        if not self.opts.get('state_incremental', False) \
+                or self.opts.get('test', False) \
+                or low.get('__prereq__') \
+                or low['fun'] == 'mod_watch':
+            return None
+        if any(key in low for key in ('onlyif', 'unless', 'check_cmd')):
+            return None
+        fp_fun = '{0}.mod_fingerprint'.format(low['state'])
+        if fp_fun not in self.states:
+            return None
+        try:
+            facts = self.states[fp_fun](low)
+        except Exception as exc:
+            log.debug('Failed to fingerprint state %s: %s', _gen_tag(low), exc)
+            return None
+        if facts is None:
+            return None
+        data = {'fun': cdata['full'],
+                'args': cdata['args'],
+                'kwargs': cdata['kwargs'],
+                'facts': facts}
+        return salt.utils.hashutils.sha256_digest(
+            salt.utils.json.dumps(data, sort_keys=True, default=repr))
+
     @salt.utils.decorators.state.OutputUnifier('content_check', 'unify')
     def call(self, low, chunks=None, running=None, retries=1):
         '''
@@ -1865,6 +2058,9 @@ class State(object):
         if 'provider' in low:
             self.load_modules(low)
 
+        tag = _gen_tag(low)
+        fingerprint = None
+        recorded = None
         state_func_name = '{0[state]}.{0[fun]}'.format(low)
         cdata = salt.utils.args.format_call(
             self.states[state_func_name],
@@ -1934,13 +2130,38 @@ class State(object):
                     ret = mock_ret(cdata)
                 else:
                     # Execute the state function
-                    if not low.get('__prereq__') and low.get('parallel'):
+                    if not low.get('__prereq__') and \
+                            (low.get('parallel') or tag in self._auto_parallel):
                         # run the state call in parallel, but only if not in a prereq
                         ret = self.call_parallel(cdata, low)
                     else:
                         self.format_slots(cdata)
-                        ret = self.states[cdata['full']](*cdata['args'],
-                                                         **cdata['kwargs'])
+                        if self._fingerprints is not None:
+                            fingerprint = self._fingerprint(low, cdata)
+                            recorded = self._fingerprints.setdefault(
+                                low.get('__sls__') or '', {})
+                        if fingerprint is not None \
+                                and recorded.get(tag) == fingerprint:
+                            ret = {'result': True,
+                                   'name': low['name'],
+                                   'changes': {},
+                                   'comment': 'State was not run because its '
+                                              'inputs are unchanged since the '
+                                              'last successful run'}
+                        else:
+                            ret = self.states[cdata['full']](*cdata['args'],
+                                                             **cdata['kwargs'])
+                            if fingerprint is not None:
+                                # The facts have to be collected again, they
+                                # should now reflect the result of the state
+                                if ret.get('result') is True:
+                                    fingerprint = self._fingerprint(low, cdata)
+                                else:
+                                    fingerprint = None
+                        if fingerprint is not None:
+                            recorded[tag] = fingerprint
+                        elif recorded is not None:
+                            recorded.pop(tag, None)
                 self.states.inject_globals = {}
             if 'check_cmd' in low and '{0[state]}.mod_run_check_cmd'.format(low) not in self.states:
                 ret.update(self._run_check_cmd(low))
@@ -2154,11 +2375,26 @@ class State(object):
                         chunks.remove(low)
                         break
         running = {}
+        self._load_fingerprints(chunks)
+        self._auto_parallel = self._auto_parallel_tags(chunks)
+        order = None
         for low in chunks:
             if '__FAILHARD__' in running:
                 running.pop('__FAILHARD__')
                 return running
             tag = _gen_tag(low)
+            if self._auto_parallel and isinstance(low.get('order'), (int, float)):
+                # Chunks run in parallel automatically may only overlap with
+                # chunks of the same order. The orders given by
+                # state_auto_order only reflect where a state is declared,
+                # the chunks holding them may all overlap.
+                if low.get('__auto_order__'):
+                    low_order = '__auto_order__'
+                else:
+                    low_order = int(low['order'])
+                if order is not None and low_order != order:
+                    self._wait_procs(running, self._auto_parallel)
+                order = low_order
             if tag not in running:
                 # Check if this low chunk is paused
                 action = self.check_pause(low)
@@ -2168,10 +2404,8 @@ class State(object):
                 if self.check_failhard(low, running):
                     return running
             self.active = set()
-        while True:
-            if self.reconcile_procs(running):
-                break
-            time.sleep(0.01)
+        self._wait_procs(running)
+        self._store_fingerprints()
         ret = dict(list(disabled.items()) + list(running.items()))
         return ret
 
@@ -2373,10 +2607,7 @@ class State(object):
             else:
                 run_dict = running
 
-            while True:
-                if self.reconcile_procs(run_dict):
-                    break
-                time.sleep(0.01)
+            self._wait_procs(run_dict, [_gen_tag(chunk) for chunk in chunks])
 
             for chunk in chunks:
                 tag = _gen_tag(chunk)
@@ -3689,6 +3920,8 @@ class BaseHighState(object):
                         state[name][s_dec].append(
                                 {'order': self.iorder}
                                 )
+                        # Tell the order from one given in the SLS
+                        state[name][s_dec].append({'__auto_order__': True})
                         self.iorder += 1
         return state
 
@@ -3794,10 +4027,31 @@ class BaseHighState(object):
                 errors.append(err)
             state.setdefault('__exclude__', []).extend(exc)
 
-    def render_highstate(self, matches):
+    def render_highstate(self, matches, cache_name='sls'):
         '''
         Gather the state files and render them into a single unified salt
         high data structure.
+
+        With :conf_minion:`state_compile_cache` enabled the result is cached
+        in the compile cache named ``cache_name``, ``highstate`` for the
+        highstate compiled from the top file and ``sls`` for the rest.
+        '''
+        cache_key = self._compile_cache_key(matches)
+        if cache_key is None:
+            return self._render_highstate(matches)
+        high = self._load_compile_cache(cache_name, cache_key)
+        if high is not None:
+            self.building_highstate = high
+            return high, []
+        with salt.fileclient.record_fetched() as fetched:
+            highstate, all_errors = self._render_highstate(matches)
+        if not all_errors:
+            self._store_compile_cache(cache_name, cache_key, highstate, fetched)
+        return highstate, all_errors
+
+    def _render_highstate(self, matches):
+        '''
+        Render the state files of the top file matches
         '''
         highstate = self.building_highstate
         all_errors = []
@@ -3841,6 +4095,89 @@ class BaseHighState(object):
         self.clean_duplicate_extends(highstate)
         return highstate, all_errors
 
+    def _compile_cache_path(self, cache_name):
+        '''
+        Return the path of the file the compiled high data is cached in
+        '''
+        return os.path.join(self.opts['cachedir'],
+                            'state_compile.{0}.cache.p'.format(cache_name))
+
+    def _compile_cache_key(self, matches):
+        '''
+        Return the key the compiled high data for the given top file matches
+        is cached under, or None if the compile cache is disabled. The key
+        covers the matches, the available SLS files, the pillar and the grains;
+        the hashes of the files fetched while rendering are checked separately.
+        '''
+        if not self.opts.get('state_compile_cache', False) \
+                or self.building_highstate:
+            return None
+        data = {'id': self.opts.get('id'),
+                'matches': matches,
+                'avail': self.avail,
+                'renderer': self.state.opts.get('renderer'),
+                'pillar': self.state.opts.get('pillar', {}),
+                'grains': self.opts.get('grains', {})}
+        return salt.utils.hashutils.sha256_digest(
+            salt.utils.json.dumps(data, sort_keys=True, default=repr))
+
+    def _hash_compile_source(self, saltenv, source):
+        '''
+        Return the hash of a file on the fileserver, or None if it is missing
+        '''
+        hash_data = self.client.hash_and_stat_file(source, saltenv)[0]
+        if not isinstance(hash_data, dict):
+            return None
+        return hash_data.get('hsum')
+
+    def _load_compile_cache(self, cache_name, cache_key):
+        '''
+        Return the cached high data if it was compiled for the same key and
+        none of the files fetched while rendering it have changed since
+        '''
+        cfn = self._compile_cache_path(cache_name)
+        if not os.path.isfile(cfn):
+            return None
+        try:
+            with salt.utils.files.fopen(cfn, 'rb') as fp_:
+                cache = self.serial.load(fp_)
+        except Exception as exc:
+            log.debug('Unable to read the state compile cache %s: %s', cfn, exc)
+            return None
+        if not isinstance(cache, dict) or cache.get('key') != cache_key:
+            return None
+        for saltenv, source, hsum in cache.get('sources', []):
+            if self._hash_compile_source(saltenv, source) != hsum:
+                log.debug('File %s in saltenv %s changed, recompiling '
+                          'the highstate', source, saltenv)
+                return None
+        log.debug('Using the cached compiled highstate from %s', cfn)
+        return cache['high']
+
+    def _store_compile_cache(self, cache_name, cache_key, high, fetched):
+        '''
+        Write the compiled high data together with the hashes of the files
+        fetched while rendering it, SLS files, includes and files imported by
+        templates, to the compile cache. Files which were missing are stored
+        without a hash, so that the cache is invalidated when they appear.
+        '''
+        sources = []
+        for saltenv, source in sorted(set(fetched)):
+            sources.append(
+                (saltenv, source, self._hash_compile_source(saltenv, source)))
+        cfn = self._compile_cache_path(cache_name)
+        with salt.utils.files.set_umask(0o077):
+            try:
+                with salt.utils.files.fopen(cfn, 'w+b') as fp_:
+                    self.serial.dump({'key': cache_key,
+                                      'sources': sources,
+                                      'high': high}, fp_)
+            except TypeError:
+                # Can't serialize pydsl
+                pass
+            except (IOError, OSError):
+                log.error('Unable to write to the state compile cache file %s', cfn)
+
     def clean_duplicate_extends(self, highstate):
         if '__extend__' in highstate:
             highext = []
@@ -3956,7 +4293,7 @@ class BaseHighState(object):
             err += ['Pillar failed to render with the following messages:']
             err += self.state.opts['pillar']['_errors']
         else:
-            high, errors = self.render_highstate(matches)
+            high, errors = self.render_highstate(matches, 'highstate')
             if exclude:
                 if isinstance(exclude, six.string_types):
                     exclude = exclude.split(',')
@@ -3996,7 +4333,7 @@ class BaseHighState(object):
         top = self.get_top()
         err += self.verify_tops(top)
         matches = self.top_matches(top)
-        high, errors = self.render_highstate(matches)
+        high, errors = self.render_highstate(matches, 'highstate')
         err += errors
 
         if err:
@@ -4011,7 +4348,7 @@ class BaseHighState(object):
         '''
         top = self.get_top()
         matches = self.top_matches(top)
-        high, errors = self.render_highstate(matches)
+        high, errors = self.render_highstate(matches, 'highstate')
 
         # If there is extension data reconcile it
         high, ext_errors = self.state.reconcile_extend(high)
@@ -7548,6 +7548,70 @@ def mod_run_check_cmd(cmd, filename, **check_cmd_opts):
     return True
 
 
+def _is_literal_hash(source_hash):
+    '''
+    Return True if ``source_hash`` is a hash itself, ``<type>=<hex>`` or a
+    bare hex digest, rather than the location of a file listing hashes
+    '''
+    if not isinstance(source_hash, six.string_types):
+        return False
+    hash_type, sep, hsum = source_hash.strip().partition('=')
+    if not sep:
+        hsum = hash_type
+        hash_type = salt.utils.files.HASHES_REVMAP.get(len(hsum))
+    if salt.utils.files.HASHES.get(hash_type) != len(hsum):
+        return False
+    return re.match(r'^[0-9a-fA-F]+$', hsum) is not None
+
+
+def mod_fingerprint(low):
+    '''
+    Return the facts on the minion which decide the outcome of a
+    ``file.managed`` state, for use by incremental state runs (see
+    :conf_minion:`state_incremental`).
+
+    The facts are the hash and metadata of the managed file, and the hash of
+    each ``salt://`` source on the master. Other sources are only accepted
+    with a literal ``source_hash``. ``None`` is returned for functions and
+    arguments whose outcome can not be verified this way, such as templates,
+    contents taken from pillar or grains, or hashes read from a hash file.
+    '''
+    if low.get('fun') != 'managed':
+        return None
+    for arg in ('template', 'contents_pillar', 'contents_grains'):
+        if low.get(arg):
+            return None
+    name = os.path.expanduser(low['name'])
+    if not os.path.isfile(name):
+        return None
+    fstat = os.stat(name)
+    facts = {'hash': salt.utils.hashutils.get_hash(name, 'sha256'),
+             'mode': fstat.st_mode,
+             'uid': fstat.st_uid,
+             'gid': fstat.st_gid,
+             'sources': []}
+
+    sources = low.get('source')
+    if not sources:
+        return facts
+    if not isinstance(sources, list):
+        sources = [sources]
+    saltenv = low.get('saltenv', __env__)
+    for source in sources:
+        if not isinstance(source, six.string_types):
+            return None
+        if not source.startswith('salt://'):
+            if _is_literal_hash(low.get('source_hash')):
+                # The expected hash is part of the state arguments
+                continue
+            return None
+        source_hash = __salt__['cp.hash_file'](source, saltenv)
+        if not source_hash:
+            return None
+        facts['sources'].append(source_hash)
+    return facts
+
+
 def decode(name,
         encoded_data=None,
         contents_pillar=None,
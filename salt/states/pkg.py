@@ -3205,6 +3205,38 @@ def mod_init(low):
     return False
 
 
+def mod_fingerprint(low):
+    '''
+    Return the installed versions of the packages managed by a
+    ``pkg.installed`` state, for use by incremental state runs (see
+    :conf_minion:`state_incremental`).
+
+    ``None`` is returned when a package is missing, or when the outcome of the
+    state does not depend only on the installed versions, for example when
+    installing from ``sources`` or requesting the ``latest`` version.
+    '''
+    if low.get('fun') != 'installed':
+        return None
+    if low.get('sources') or low.get('version') == 'latest':
+        return None
+    pkgs = low.get('pkgs')
+    if pkgs:
+        names = []
+        for pkg in pkgs:
+            if isinstance(pkg, dict):
+                names.extend(pkg)
+            else:
+                names.append(pkg)
+    else:
+        names = [low['name']]
+    versions = __salt__['pkg.version'](*names)
+    if not isinstance(versions, dict):
+        versions = {names[0]: versions}
+    if not all(versions.values()):
+        return None
+    return {'versions': versions}
+
+
 def mod_aggregate(low, chunks, running):
     '''
     The mod_aggregate function which looks up all packages in the available
@@ -14,6 +14,7 @@ import logging
 # Import Salt libs
 import salt.utils.data
 import salt.utils.files
+import salt.utils.profile
 import salt.utils.stringio
 import salt.utils.versions
 import salt.utils.sanitizers
@@ -89,36 +90,54 @@ def compile_template(template,
 
     windows_newline = '\r\n' in input_data
 
+    profile = salt.utils.profile.active_render_profile()
+    if profile is not None:
+        record = profile.start_template(template, saltenv, sls, input_data)
+
     input_data = StringIO(input_data)
-    for render, argline in render_pipe:
-        if salt.utils.stringio.is_readable(input_data):
-            input_data.seek(0)      # pylint: disable=no-member
-        render_kwargs = dict(renderers=renderers, tmplpath=template)
-        render_kwargs.update(kwargs)
-        if argline:
-            render_kwargs['argline'] = argline
-        start = time.time()
-        ret = render(input_data, saltenv, sls, **render_kwargs)
-        log.profile(
-            'Time (in seconds) to render \'%s\' using \'%s\' renderer: %s',
-            template,
-            render.__module__.split('.')[-1],
-            time.time() - start
-        )
-        if ret is None:
-            # The file is empty or is being written elsewhere
-            time.sleep(0.01)
-            ret = render(input_data, saltenv, sls, **render_kwargs)
-        input_data = ret
-        if log.isEnabledFor(logging.GARBAGE):  # pylint: disable=no-member
-            # If ret is not a StringIO (which means it was rendered using
-            # yaml, mako, or another engine which renders to a data
-            # structure) we don't want to log this.
-            if salt.utils.stringio.is_readable(ret):
-                log.debug('Rendered data from file: %s:\n%s', template,
-                          salt.utils.sanitizers.mask_args_value(salt.utils.data.decode(ret.read()),
-                                                                kwargs.get('mask_value')))  # pylint: disable=no-member
-                ret.seek(0)  # pylint: disable=no-member
+    try:
+        for render, argline in render_pipe:
+            if salt.utils.stringio.is_readable(input_data):
+                input_data.seek(0)      # pylint: disable=no-member
+            render_kwargs = dict(renderers=renderers, tmplpath=template)
+            render_kwargs.update(kwargs)
+            if argline:
+                render_kwargs['argline'] = argline
+            start = time.time()
+            if profile is not None:
+                ret = _profiled_render(profile, render, input_data, saltenv, sls, render_kwargs)
+            else:
+                ret = render(input_data, saltenv, sls, **render_kwargs)
+            elapsed = time.time() - start
+            log.profile(
+                'Time (in seconds) to render \'%s\' using \'%s\' renderer: %s',
+                template,
+                render.__module__.split('.')[-1],
+                elapsed
+            )
+            if ret is None:
+                # The file is empty or is being written elsewhere
+                time.sleep(0.01)
+                ret = render(input_data, saltenv, sls, **render_kwargs)
+            if profile is not None:
+                profile.add_renderer(record,
+                                     render.__module__.split('.')[-1],
+                                     elapsed,
+                                     input_data,
+                                     ret)
+            input_data = ret
+            if log.isEnabledFor(logging.GARBAGE):  # pylint: disable=no-member
+                # If ret is not a StringIO (which means it was rendered using
+                # yaml, mako, or another engine which renders to a data
+                # structure) we don't want to log this.
+                if salt.utils.stringio.is_readable(ret):
+                    log.debug('Rendered data from file: %s:\n%s', template,
+                              salt.utils.sanitizers.mask_args_value(salt.utils.data.decode(ret.read()),
+                                                                    kwargs.get('mask_value')))  # pylint: disable=no-member
+                    ret.seek(0)  # pylint: disable=no-member
+    finally:
+        if profile is not None:
+            profile.end_template(record, ret)
 
     # Preserve newlines from original template
     if windows_newline:
@@ -139,6 +158,22 @@ def compile_template(template,
     return ret
 
 
+def _profiled_render(profile, render, input_data, saltenv, sls, render_kwargs):
+    '''
+    Call a render function with its ``__salt__`` swapped for a wrapper which
+    records the execution functions called during rendering
+    '''
+    render_globals = getattr(render, '__globals__', None)
+    if not isinstance(render_globals, dict) or '__salt__' not in render_globals:
+        return render(input_data, saltenv, sls, **render_kwargs)
+    functions = render_globals['__salt__']
+    render_globals['__salt__'] = profile.wrap_functions(functions)
+    try:
+        return render(input_data, saltenv, sls, **render_kwargs)
+    finally:
+        render_globals['__salt__'] = functions
+
+
 def compile_template_str(template, renderers, default, blacklist, whitelist):
     '''
     Take template as a string and return the high data structure
@@ -2,17 +2,24 @@
 
 '''
 Stores eauth tokens in the filesystem of the master. Location is configured by the master config option 'token_dir'
+
+Each process keeps the data of the tokens it recently read in memory, so that
+a token used for many requests is only read and unpacked again when its file
+changed or was removed.
 '''
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import copy
 import hashlib
 import os
 import logging
+import stat
 
 import salt.utils.files
 import salt.utils.path
 import salt.payload
+from salt.utils.odict import OrderedDict
 
 from salt.ext import six
 
@@ -20,6 +27,18 @@ log = logging.getLogger(__name__)
 
 __virtualname__ = 'localfs'
 
+# The data of the tokens recently read by this process:
+# {path: [[inode, mtime, size], tdata], ...}
+_CACHE = OrderedDict()
+_CACHE_SIZE = 1024
+
+
+def _cache_set(t_path, stamp, tdata):
+    _CACHE.pop(t_path, None)
+    if len(_CACHE) >= _CACHE_SIZE:
+        _CACHE.popitem(last=False)
+    _CACHE[t_path] = [stamp, copy.deepcopy(tdata)]
+
 
 def mk_token(opts, tdata):
     '''
@@ -59,12 +78,24 @@ def get_token(opts, tok):
     :returns: Token data if successful. Empty dict if failed.
     '''
     t_path = os.path.join(opts['token_dir'], tok)
-    if not os.path.isfile(t_path):
+    try:
+        t_stat = os.stat(t_path)
+    except OSError:
+        _CACHE.pop(t_path, None)
+        return {}
+    if not stat.S_ISREG(t_stat.st_mode):
         return {}
+    stamp = [t_stat.st_ino, t_stat.st_mtime, t_stat.st_size]
+    cached = _CACHE.pop(t_path, None)
+    if cached is not None and cached[0] == stamp:
+        _CACHE[t_path] = cached
+        return copy.deepcopy(cached[1])
     serial = salt.payload.Serial(opts)
     try:
         with salt.utils.files.fopen(t_path, 'rb') as fp_:
             tdata = serial.loads(fp_.read())
+            if isinstance(tdata, dict):
+                _cache_set(t_path, stamp, tdata)
             return tdata
     except (IOError, OSError):
         log.warning(
@@ -81,6 +112,7 @@ def rm_token(opts, tok):
     :returns: Empty dict if successful. None if failed.
     '''
     t_path = os.path.join(opts['token_dir'], tok)
+    _CACHE.pop(t_path, None)
     try:
         os.remove(t_path)
         return {}
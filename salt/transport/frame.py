@@ -4,6 +4,9 @@ Helper functions for transport components to handle message framing
 '''
 # Import python libs
 from __future__ import absolute_import, print_function, unicode_literals
+import struct
+
+# Import 3rd-party libs
 import msgpack
 from salt.ext import six
 
@@ -40,6 +43,47 @@ def frame_msg_ipc(body, header=None, raw_body=False):  # pylint: disable=unused-
         return msgpack.dumps(framed_msg, use_bin_type=True)
 
 
+def _raw_header(size):
+    '''
+    Return the msgpack header for a bytes object of the given size, as
+    frame_msg_ipc would pack it
+    '''
+    if six.PY2:
+        # Python 2 packs bytes as raw, without the str 8 type
+        if size < 32:
+            return struct.pack(str('>B'), 0xa0 | size)
+        elif size < 0x10000:
+            return struct.pack(str('>BH'), 0xda, size)
+        return struct.pack(str('>BI'), 0xdb, size)
+    if size < 0x100:
+        return struct.pack(str('>BB'), 0xc4, size)
+    elif size < 0x10000:
+        return struct.pack(str('>BH'), 0xc5, size)
+    return struct.pack(str('>BI'), 0xc6, size)
+
+
+def frame_msg_ipc_parts(body_parts, header=None):
+    '''
+    Frame a bytes body, given as a list of buffers, with our wire protocol for
+    IPC without copying the body into a new string
+
+    Returns a list of buffers, their concatenation is what frame_msg_ipc
+    returns for the concatenated body.
+    '''
+    if header is None:
+        header = {}
+    size = sum(len(part) for part in body_parts)
+    if six.PY2:
+        prefix = [b'\x82', msgpack.dumps('head'), msgpack.dumps(header),
+                  msgpack.dumps('body')]
+    else:
+        prefix = [b'\x82', msgpack.dumps('head', use_bin_type=True),
+                  msgpack.dumps(header, use_bin_type=True),
+                  msgpack.dumps('body', use_bin_type=True)]
+    prefix.append(_raw_header(size))
+    return [b''.join(prefix)] + [part for part in body_parts if len(part)]
+
+
 def _decode_embedded_list(src):
     '''
     Convert enbedded bytes to strings if possible.
@@ -5,6 +5,7 @@ IPC transport classes
 
 # Import Python libs
 from __future__ import absolute_import, print_function, unicode_literals
+import collections
 import logging
 import socket
 import weakref
@@ -24,10 +25,44 @@ from tornado.iostream import IOStream
 # Import Salt libs
 import salt.transport.client
 import salt.transport.frame
+import salt.utils.stringutils
+import salt.utils.tagmatch
 from salt.ext import six
 
 log = logging.getLogger(__name__)
 
+# Event messages start with their tag, followed by this delimiter. Keep in
+# sync with salt.utils.event.TAGEND.
+TAGEND = b'\n\n'
+
+# The match types a subscriber can filter published messages with
+TAG_MATCH_FUNCS = {
+    'startswith': lambda tag, search: tag.startswith(search),
+    'fnmatch': salt.utils.tagmatch.match,
+}
+
+
+def msg_tag(msg):
+    '''
+    Return the tag of an event message without unpacking or copying the rest
+    of it
+    '''
+    tagend = TAGEND.decode() if isinstance(msg, six.text_type) else TAGEND
+    idx = msg.find(tagend)
+    tag = msg if idx == -1 else msg[:idx]
+    return salt.utils.stringutils.to_unicode(tag, errors='replace')
+
+
+def match_tag_filter(tag, tag_filter):
+    '''
+    Return True if the tag matches any of the (tag, match_type) pairs in the
+    filter
+    '''
+    for search, match_type in tag_filter:
+        if TAG_MATCH_FUNCS[match_type](tag, search):
+            return True
+    return False
+
 
 # 'tornado.concurrent.Future' doesn't support
 # remove_done_callback() which we would have called
@@ -425,6 +460,24 @@ class IPCMessageClient(IPCClient):
         pack = salt.transport.frame.frame_msg_ipc(msg, raw_body=True)
         yield self.stream.write(pack)
 
+    @tornado.gen.coroutine
+    def send_parts(self, parts, timeout=None, tries=None):
+        '''
+        Send a bytes message, given as a list of buffers, to an IPC socket.
+        The buffers are written to the socket as they are, without joining
+        them into a single string first.
+
+        If the socket is not currently connected, a connection will be established.
+
+        :param list parts: The buffers of the message to be sent
+        :param int timeout: Timeout when sending message (Currently unimplemented)
+        '''
+        if not self.connected():
+            yield self.connect()
+        for buf in _coalesce(salt.transport.frame.frame_msg_ipc_parts(parts)):
+            future = self.stream.write(buf)
+        yield future
+
 
 class IPCMessageServer(IPCServer):
     '''
@@ -460,6 +513,59 @@ class IPCMessageServer(IPCServer):
     '''
 
 
+# What an IPCMessagePublisher does with a message for a subscriber whose send
+# queue is full
+QUEUE_POLICIES = ('drop_oldest', 'drop_newest', 'disconnect')
+
+
+# Buffers smaller than this are joined before being written to a stream,
+# larger ones are written as they are
+COALESCE_SIZE = 65536
+
+
+def _coalesce(parts, size=COALESCE_SIZE):
+    '''
+    Join runs of small buffers, so that writing a message does not take a
+    write to the socket per buffer, without copying the large ones
+    '''
+    small = []
+    for part in parts:
+        if len(part) < size:
+            small.append(part)
+            continue
+        if small:
+            yield b''.join(small)
+            small = []
+        yield part
+    if small:
+        yield b''.join(small)
+
+
+def _pack_size(pack):
+    '''
+    Return the size of a queued message, a string or a list of buffers
+    '''
+    if isinstance(pack, (list, tuple)):
+        return sum(len(part) for part in pack)
+    return len(pack)
+
+
+class _SendQueue(object):
+    '''
+    The messages an IPCMessagePublisher has not yet written to a subscriber
+    '''
+    __slots__ = ('msgs', 'size', 'writing', 'since', 'held')
+
+    def __init__(self, held=False):
+        self.msgs = collections.deque()
+        self.size = 0
+        self.writing = False
+        # When the oldest queued message was queued
+        self.since = None
+        # Messages are not written while the queue is held
+        self.held = held
+
+
 class IPCMessagePublisher(object):
     '''
     A Tornado IPC Publisher similar to Tornado's TCPServer class
@@ -488,6 +594,37 @@ class IPCMessagePublisher(object):
         self.io_loop = io_loop or IOLoop.current()
         self._closing = False
         self.streams = set()
+        # Tag filters registered by subscribers, keyed by their stream
+        self.tag_filters = {}
+        # Messages waiting to be written, keyed by the subscriber's stream
+        self.queues = {}
+        self.queue_size = opts.get('ipc_publisher_queue_size', 0)
+        self.queue_policy = opts.get('ipc_publisher_queue_policy', 'drop_oldest')
+        if self.queue_policy not in QUEUE_POLICIES:
+            log.error('Invalid ipc_publisher_queue_policy %s, using drop_oldest',
+                      self.queue_policy)
+            self.queue_policy = 'drop_oldest'
+        self.dropped_msgs = 0
+        self.dropped_bytes = 0
+        self.disconnected = 0
+        self.writes = 0
+        self.write_latency = 0.0
+        self.max_write_latency = 0.0
+        # Messages are numbered when a backlog is kept, subscribers can then
+        # ask for the messages they missed while they were disconnected. The
+        # epoch tells subscribers the numbers are from another publisher.
+        self.epoch = int(time.time() * 1000)
+        self.seq = 0
+        self.backlog_len = opts.get('ipc_publisher_backlog', 0)
+        self.backlog_size = opts.get('ipc_publisher_backlog_size', 0)
+        self.backlog = collections.deque() if self.backlog_len > 0 else None
+        self.backlog_bytes = 0
+        # The last message published before a subscriber connected, keyed by
+        # its stream, until the subscriber resumes. The messages published
+        # in between are held in its queue, so that they are written after
+        # the replayed ones.
+        self.connect_seqs = {}
+        self.replayed_msgs = 0
 
     def start(self):
         '''
@@ -515,29 +652,261 @@ class IPCMessagePublisher(object):
         self._started = True
 
     @tornado.gen.coroutine
-    def _write(self, stream, pack):
+    def _write(self, stream, queue):
+        '''
+        Write the queued messages to a subscriber until its queue is empty
+        '''
         try:
-            yield stream.write(pack)
+            while queue.msgs:
+                parts = []
+                for pack in queue.msgs:
+                    if isinstance(pack, (list, tuple)):
+                        parts.extend(pack)
+                    else:
+                        parts.append(pack)
+                since = queue.since
+                queue.msgs.clear()
+                queue.size = 0
+                queue.since = None
+                # IOStream.write copies each buffer into the stream's write
+                # buffer, large bodies are not copied on the way there
+                for buf in _coalesce(parts):
+                    future = stream.write(buf)
+                yield future
+                latency = time.time() - since
+                self.writes += 1
+                self.write_latency += latency
+                if latency > self.max_write_latency:
+                    self.max_write_latency = latency
         except tornado.iostream.StreamClosedError:
             log.trace('Client disconnected from IPC %s', self.socket_path)
-            self.streams.discard(stream)
+            self._discard(stream)
         except Exception as exc:
             log.error('Exception occurred while handling stream: %s', exc)
             if not stream.closed():
                 stream.close()
-            self.streams.discard(stream)
+            self._discard(stream)
+        finally:
+            queue.writing = False
+
+    def _enqueue(self, stream, pack):
+        '''
+        Queue a message, a string or a list of buffers, for a subscriber,
+        applying the queue policy if the subscriber's queue is full. A message
+        is always queued when nothing else is, even if it is larger than the
+        queue, so that large events, like big job returns, are still sent.
+        '''
+        queue = self.queues.get(stream)
+        if queue is None:
+            queue = self.queues[stream] = _SendQueue()
+        size = _pack_size(pack)
+        if self.queue_size and queue.msgs and queue.size + size > self.queue_size:
+            if self.queue_policy == 'disconnect':
+                log.warning('Subscriber on IPC %s is not keeping up with '
+                            '%s queued bytes, disconnecting it',
+                            self.socket_path, queue.size)
+                self.dropped_msgs += len(queue.msgs) + 1
+                self.dropped_bytes += queue.size + size
+                self.disconnected += 1
+                queue.msgs.clear()
+                queue.size = 0
+                stream.close()
+                self._discard(stream)
+                return
+            if self.queue_policy == 'drop_oldest':
+                while queue.msgs and queue.size + size > self.queue_size:
+                    dropped = _pack_size(queue.msgs.popleft())
+                    queue.size -= dropped
+                    if not queue.msgs:
+                        queue.since = None
+                    self.dropped_msgs += 1
+                    self.dropped_bytes += dropped
+            if queue.msgs and queue.size + size > self.queue_size:
+                self.dropped_msgs += 1
+                self.dropped_bytes += size
+                return
+        if not queue.msgs:
+            queue.since = time.time()
+        queue.msgs.append(pack)
+        queue.size += size
+        if not queue.writing and not queue.held:
+            queue.writing = True
+            self.io_loop.spawn_callback(self._write, stream, queue)
+
+    def _discard(self, stream):
+        self.streams.discard(stream)
+        self.tag_filters.pop(stream, None)
+        self.queues.pop(stream, None)
+        self.connect_seqs.pop(stream, None)
+
+    def _resume(self, stream, epoch, seq):
+        '''
+        Send a reconnected subscriber the messages from the backlog it has not
+        seen, the ones after seq and published before it connected, then the
+        messages held since it connected. All of them are sent if the
+        subscriber last saw messages from another publisher, none of them if
+        seq is None.
+        '''
+        last = self.connect_seqs.pop(stream, None)
+        if last is None or self.backlog is None:
+            return
+        queue = self.queues.get(stream)
+        if queue is None:
+            queue = self.queues[stream] = _SendQueue()
+        queue.held = False
+        packs = []
+        if seq is not None:
+            if epoch != self.epoch:
+                seq = 0
+            if self.backlog and self.backlog[0][0] > seq + 1:
+                log.warning('Subscriber on IPC %s resumed after %s messages which '
+                            'are no longer in the backlog', self.socket_path,
+                            self.backlog[0][0] - seq - 1)
+            tag_filter = self.tag_filters.get(stream)
+            packs = [pack for msg_seq, msg, pack in self.backlog
+                     if seq < msg_seq <= last and (
+                         tag_filter is None or
+                         match_tag_filter(msg_tag(msg), tag_filter))]
+        if packs and self.queue_size:
+            # Keep the most recent messages which fit in the queue
+            room = self.queue_size - queue.size
+            for idx in range(len(packs) - 1, -1, -1):
+                room -= _pack_size(packs[idx])
+                if room < 0 and idx == len(packs) - 1 and not queue.msgs:
+                    # Like in _enqueue, an empty queue takes any message
+                    continue
+                if room < 0:
+                    dropped = packs[:idx + 1]
+                    packs = packs[idx + 1:]
+                    self.dropped_msgs += len(dropped)
+                    self.dropped_bytes += sum(_pack_size(pack) for pack in dropped)
+                    break
+        if packs:
+            self.replayed_msgs += len(packs)
+            queue.msgs.extendleft(reversed(packs))
+            queue.size += sum(_pack_size(pack) for pack in packs)
+            queue.since = time.time()
+        if queue.msgs and not queue.writing:
+            queue.writing = True
+            self.io_loop.spawn_callback(self._write, stream, queue)
+
+    def stats(self):
+        '''
+        Return the number of subscribers, the messages and bytes queued for
+        them, the messages and bytes dropped and the time from queueing
+        messages to writing them since the publisher started
+        '''
+        queues = list(self.queues.values())
+        return {
+            'subscribers': len(self.streams),
+            'subscriber_queues': [{'msgs': len(queue.msgs), 'bytes': queue.size}
+                                  for queue in queues],
+            'queued_msgs': sum(len(queue.msgs) for queue in queues),
+            'queued_bytes': sum(queue.size for queue in queues),
+            'max_queued_bytes': max([queue.size for queue in queues] or [0]),
+            'dropped_msgs': self.dropped_msgs,
+            'dropped_bytes': self.dropped_bytes,
+            'disconnected': self.disconnected,
+            'writes': self.writes,
+            'mean_write_latency': self.write_latency / self.writes if self.writes else 0.0,
+            'max_write_latency': self.max_write_latency,
+            'seq': self.seq,
+            'backlog_msgs': len(self.backlog) if self.backlog is not None else 0,
+            'backlog_bytes': self.backlog_bytes,
+            'replayed_msgs': self.replayed_msgs,
+        }
+
+    @tornado.gen.coroutine
+    def _read_requests(self, stream):
+        '''
+        Read the tag filters and resume requests a subscriber sends.
 
-    def publish(self, msg):
+        A filter is a list of (tag, match_type) pairs, messages whose tag
+        matches none of them are not sent to the subscriber. A filter of None
+        removes the filter. A resume request is the epoch and sequence number
+        of the last message the subscriber saw.
+        '''
+        if six.PY2:
+            encoding = None
+        else:
+            encoding = 'utf-8'
+        unpacker = msgpack.Unpacker(encoding=encoding)
+        while not stream.closed():
+            try:
+                wire_bytes = yield stream.read_bytes(4096, partial=True)
+            except tornado.iostream.StreamClosedError:
+                break
+            unpacker.feed(wire_bytes)
+            for framed_msg in unpacker:
+                body = framed_msg['body']
+                if not isinstance(body, dict):
+                    continue
+                if 'resume' in body:
+                    try:
+                        epoch, seq = body['resume']
+                        self._resume(stream, epoch, seq)
+                    except (TypeError, ValueError):
+                        log.error('Invalid resume request received on IPC %s: %s',
+                                  self.socket_path, body['resume'])
+                    continue
+                if 'tags' not in body:
+                    continue
+                tag_filter = body['tags']
+                if tag_filter is None:
+                    self.tag_filters.pop(stream, None)
+                    continue
+                try:
+                    self.tag_filters[stream] = [
+                        (search, match_type) for search, match_type in tag_filter
+                        if match_type in TAG_MATCH_FUNCS]
+                except (TypeError, ValueError):
+                    log.error('Invalid tag filter received on IPC %s: %s',
+                              self.socket_path, tag_filter)
+
+    def publish(self, msg, tag=None):
         '''
         Send message to all connected sockets
+
+        The tag of the message, as returned by :py:func:`msg_tag`, can be
+        passed if the caller has already looked it up.
         '''
-        if not len(self.streams):
+        if not len(self.streams) and self.backlog is None:
             return
 
-        pack = salt.transport.frame.frame_msg_ipc(msg, raw_body=True)
+        header = None
+        if self.backlog is not None:
+            self.seq += 1
+            header = {'epoch': self.epoch, 'seq': self.seq}
 
-        for stream in self.streams:
-            self.io_loop.spawn_callback(self._write, stream, pack)
+        if isinstance(msg, six.binary_type):
+            # Frame the event once for all subscribers, without copying it
+            pack = salt.transport.frame.frame_msg_ipc_parts([msg], header=header)
+        else:
+            pack = salt.transport.frame.frame_msg_ipc(msg, header=header, raw_body=True)
+        if self.backlog is not None:
+            self._add_backlog(msg, pack)
+
+        for stream in list(self.streams):
+            tag_filter = self.tag_filters.get(stream)
+            if tag_filter is not None:
+                if tag is None:
+                    tag = msg_tag(msg)
+                if not match_tag_filter(tag, tag_filter):
+                    continue
+            self._enqueue(stream, pack)
+
+    def _add_backlog(self, msg, pack):
+        '''
+        Add a message to the backlog, dropping the oldest messages when it
+        holds more messages or bytes than allowed. The newest message is kept
+        even if it is larger than the size limit.
+        '''
+        self.backlog.append((self.seq, msg, pack))
+        self.backlog_bytes += _pack_size(pack)
+        while len(self.backlog) > self.backlog_len or (
+                self.backlog_size and len(self.backlog) > 1 and
+                self.backlog_bytes > self.backlog_size):
+            self.backlog_bytes -= _pack_size(self.backlog.popleft()[2])
 
     def handle_connection(self, connection, address):
         log.trace('IPCServer: Handling connection to address: %s', address)
@@ -554,9 +923,15 @@ class IPCMessagePublisher(object):
             self.streams.add(stream)
 
             def discard_after_closed():
-                self.streams.discard(stream)
+                self._discard(stream)
 
             stream.set_close_callback(discard_after_closed)
+            if self.backlog is not None:
+                # Hold the messages for the subscriber until it tells what it
+                # wants replayed from the backlog
+                self.connect_seqs[stream] = self.seq
+                self.queues[stream] = _SendQueue(held=True)
+            self.io_loop.spawn_callback(self._read_requests, stream)
         except Exception as exc:
             log.error('IPC streaming error: %s', exc)
 
@@ -572,6 +947,9 @@ class IPCMessagePublisher(object):
         for stream in self.streams:
             stream.close()
         self.streams.clear()
+        self.tag_filters.clear()
+        self.queues.clear()
+        self.connect_seqs.clear()
         if hasattr(self.sock, 'close'):
             self.sock.close()
 
@@ -620,6 +998,76 @@ class IPCMessageSubscriber(IPCClient):
         self._sync_ioloop_running = False
         self.saved_data = []
         self._sync_read_in_progress = Semaphore()
+        self._tag_filter = None
+        # The epoch and sequence number of the last message received from a
+        # publisher which keeps a backlog
+        self.epoch = None
+        self.seq = None
+
+    @tornado.gen.coroutine
+    def _connect(self, timeout=None):
+        yield super(IPCMessageSubscriber, self)._connect(timeout=timeout)
+        if self._tag_filter is not None and self.connected():
+            yield self._write_tag_filter()
+        if self.connected():
+            # A publisher keeping a backlog holds the messages for new
+            # subscribers until they send this, with a seq of None if there
+            # is nothing to resume from
+            yield self._write_resume()
+
+    @tornado.gen.coroutine
+    def _write_resume(self):
+        pack = salt.transport.frame.frame_msg_ipc({'resume': [self.epoch, self.seq]})
+        try:
+            yield self.stream.write(pack)
+        except tornado.iostream.StreamClosedError:
+            log.trace('Subscriber disconnected from IPC %s', self.socket_path)
+
+    def resume_from(self, epoch, seq):
+        '''
+        Ask the publisher, when connecting, for the messages in its backlog
+        published after the message with the given epoch and sequence number
+        '''
+        self.epoch = epoch
+        self.seq = seq
+
+    def _track(self, head):
+        '''
+        Remember the sequence number of a received message
+        '''
+        seq = head.get('seq') if isinstance(head, dict) else None
+        if seq is None:
+            return
+        epoch = head.get('epoch')
+        if epoch != self.epoch or self.seq is None or seq > self.seq:
+            self.epoch = epoch
+            self.seq = seq
+
+    @tornado.gen.coroutine
+    def _write_tag_filter(self):
+        pack = salt.transport.frame.frame_msg_ipc({'tags': self._tag_filter})
+        try:
+            yield self.stream.write(pack)
+        except tornado.iostream.StreamClosedError:
+            log.trace('Subscriber disconnected from IPC %s', self.socket_path)
+
+    @tornado.gen.coroutine
+    def set_tag_filter(self, tag_filter):
+        '''
+        Ask the publisher to only send messages whose tag matches the filter,
+        a list of (tag, match_type) pairs where match_type is ``startswith``
+        or ``fnmatch``. Pass None to receive all messages again. The filter is
+        sent again when the subscriber reconnects.
+        '''
+        if tag_filter is not None:
+            tag_filter = [[search, match_type] for search, match_type in tag_filter]
+            for _, match_type in tag_filter:
+                if match_type not in TAG_MATCH_FUNCS:
+                    raise ValueError(
+                        'Unsupported tag filter match type: {0}'.format(match_type))
+        self._tag_filter = tag_filter
+        if self.connected():
+            yield self._write_tag_filter()
 
     @tornado.gen.coroutine
     def _read_sync(self, timeout):
@@ -649,6 +1097,7 @@ class IPCMessageSubscriber(IPCClient):
                 self.unpacker.feed(wire_bytes)
                 first = True
                 for framed_msg in self.unpacker:
+                    self._track(framed_msg['head'])
                     if first:
                         ret = framed_msg['body']
                         first = False
@@ -711,6 +1160,7 @@ class IPCMessageSubscriber(IPCClient):
                 self._read_stream_future = None
                 self.unpacker.feed(wire_bytes)
                 for framed_msg in self.unpacker:
+                    self._track(framed_msg['head'])
                     body = framed_msg['body']
                     self.io_loop.spawn_callback(callback, body)
             except tornado.iostream.StreamClosedError:
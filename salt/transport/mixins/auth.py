@@ -21,6 +21,7 @@ import salt.utils.minions
 import salt.utils.stringutils
 import salt.utils.verify
 from salt.utils.cache import CacheCli
+from salt.utils.odict import OrderedDict
 
 # Import Third Party Libs
 from salt.ext import six
@@ -107,9 +108,17 @@ class AESReqServerMixin(object):
 
         self.master_key = salt.crypt.MasterKeys(self.opts)
 
-    def _encrypt_private(self, ret, dictkey, target):
+        # The AES key the cached auth replies were made for, the signature of
+        # that key and the encrypted parts of the replies:
+        # {(id, pub, token): {'aes': ..., 'token': ...}, ...}
+        self.auth_aes = None
+        self.auth_sig = None
+        self.auth_payloads = OrderedDict()
+
+    def _encrypt_private(self, ret, dictkey, target, aead=False):
         '''
-        The server equivalent of ReqChannel.crypted_transfer_decode_dictentry
+        The server equivalent of ReqChannel.crypted_transfer_decode_dictentry,
+        with AES-GCM if aead is True
         '''
         # encrypt with a specific AES key
         pubfn = os.path.join(self.opts['pki_dir'],
@@ -122,7 +131,7 @@ class AESReqServerMixin(object):
         try:
             pub = salt.crypt.get_rsa_pub_key(pubfn)
         except (ValueError, IndexError, TypeError):
-            return self.crypticle.dumps({})
+            return self.crypticle.dumps({}, aead=aead)
         except IOError:
             log.error('AES key not found')
             return {'error': 'AES key not found'}
@@ -136,8 +145,11 @@ class AESReqServerMixin(object):
             cipher = PKCS1_OAEP.new(pub)
             pret['key'] = cipher.encrypt(key)
         pret[dictkey] = pcrypt.dumps(
-            ret if ret is not False else {}
+            ret if ret is not False else {},
+            aead=aead
         )
+        if aead:
+            pret['aead'] = True
         return pret
 
     def _update_aes(self):
@@ -150,15 +162,50 @@ class AESReqServerMixin(object):
             return True
         return False
 
+    def _auth_cache_check(self, aes):
+        '''
+        Forget the cached auth replies if the AES key changed since they were
+        made
+        '''
+        if aes != self.auth_aes:
+            self.auth_aes = aes
+            self.auth_sig = None
+            self.auth_payloads.clear()
+
+    def _auth_payload_get(self, load):
+        '''
+        Return the cached encrypted parts of the auth reply to this sign in
+        request, or None
+        '''
+        key = (load['id'], load['pub'], load.get('token'))
+        try:
+            payload = self.auth_payloads.pop(key)
+        except KeyError:
+            return None
+        self.auth_payloads[key] = payload
+        return payload
+
+    def _auth_payload_set(self, load, payload):
+        '''
+        Cache the encrypted parts of the auth reply to this sign in request
+        '''
+        cache_size = self.opts.get('auth_payload_cache_size', 0)
+        if cache_size <= 0:
+            return
+        while len(self.auth_payloads) >= cache_size:
+            self.auth_payloads.popitem(last=False)
+        self.auth_payloads[(load['id'], load['pub'], load.get('token'))] = payload
+
     def _decode_payload(self, payload):
         # we need to decrypt it
         if payload['enc'] == 'aes':
+            aead = payload.get('aead', False)
             try:
-                payload['load'] = self.crypticle.loads(payload['load'])
+                payload['load'] = self.crypticle.loads(payload['load'], aead=aead)
             except salt.crypt.AuthenticationError:
                 if not self._update_aes():
                     raise
-                payload['load'] = self.crypticle.loads(payload['load'])
+                payload['load'] = self.crypticle.loads(payload['load'], aead=aead)
         return payload
 
     def _auth(self, load):
@@ -488,29 +535,48 @@ class AESReqServerMixin(object):
             else:
                 ret['aes'] = cipher.encrypt(aes)
         else:
-            if 'token' in load:
-                try:
-                    if HAS_M2:
-                        mtoken = self.master_key.key.private_decrypt(load['token'],
-                                                                     RSA.pkcs1_oaep_padding)
-                        ret['token'] = pub.public_encrypt(mtoken, RSA.pkcs1_oaep_padding)
-                    else:
-                        mtoken = mcipher.decrypt(load['token'])
-                        ret['token'] = cipher.encrypt(mtoken)
-                except Exception:
-                    # Token failed to decrypt, send back the salty bacon to
-                    # support older minions
-                    pass
-
             aes = salt.master.SMaster.secrets['aes']['secret'].value
-            if HAS_M2:
-                ret['aes'] = pub.public_encrypt(aes,
-                                                RSA.pkcs1_oaep_padding)
-            else:
-                ret['aes'] = cipher.encrypt(aes)
+            self._auth_cache_check(aes)
+            payload = self._auth_payload_get(load)
+            if payload is None:
+                payload = {}
+                if 'token' in load:
+                    try:
+                        if HAS_M2:
+                            mtoken = self.master_key.key.private_decrypt(load['token'],
+                                                                         RSA.pkcs1_oaep_padding)
+                            payload['token'] = pub.public_encrypt(mtoken, RSA.pkcs1_oaep_padding)
+                        else:
+                            mtoken = mcipher.decrypt(load['token'])
+                            payload['token'] = cipher.encrypt(mtoken)
+                    except Exception:
+                        # Token failed to decrypt, send back the salty bacon to
+                        # support older minions
+                        pass
+
+                if HAS_M2:
+                    payload['aes'] = pub.public_encrypt(aes,
+                                                        RSA.pkcs1_oaep_padding)
+                else:
+                    payload['aes'] = cipher.encrypt(aes)
+                self._auth_payload_set(load, payload)
+            ret.update(payload)
         # Be aggressive about the signature
-        digest = salt.utils.stringutils.to_bytes(hashlib.sha256(aes).hexdigest())
-        ret['sig'] = salt.crypt.private_encrypt(self.master_key.key, digest)
+        if self.opts['auth_mode'] >= 2:
+            digest = salt.utils.stringutils.to_bytes(hashlib.sha256(aes).hexdigest())
+            ret['sig'] = salt.crypt.private_encrypt(self.master_key.key, digest)
+        else:
+            # The signature only depends on the AES key, sign it once
+            if self.auth_sig is None:
+                digest = salt.utils.stringutils.to_bytes(hashlib.sha256(aes).hexdigest())
+                self.auth_sig = salt.crypt.private_encrypt(self.master_key.key, digest)
+            ret['sig'] = self.auth_sig
+        if self.opts.get('rotate_reauth_window'):
+            ret['reauth_window'] = self.opts['rotate_reauth_window']
+        if load.get('aead') and salt.crypt.HAS_GCM and \
+                self.opts.get('request_channel_aead', False):
+            # Encrypt the requests of this minion with AES-GCM
+            ret['aead'] = True
         eload = {'result': True,
                  'act': 'accept',
                  'id': load['id'],
@@ -23,6 +23,7 @@ import salt.utils.asynchronous
 import salt.utils.event
 import salt.utils.files
 import salt.utils.platform
+import salt.utils.presence
 import salt.utils.process
 import salt.utils.verify
 import salt.payload
@@ -44,6 +45,7 @@ import tornado.gen
 import tornado.concurrent
 import tornado.tcpclient
 import tornado.netutil
+import tornado.locks
 
 # pylint: disable=import-error,no-name-in-module
 if six.PY2:
@@ -294,17 +296,24 @@ class AsyncTCPReqChannel(salt.transport.client.ReqChannel):
     def __del__(self):
         self.close()
 
-    def _package_load(self, load):
-        return {
+    def _package_load(self, load, aead=False):
+        ret = {
             'enc': self.crypt,
             'load': load,
         }
+        if aead:
+            # The load is encrypted with AES-GCM
+            ret['aead'] = True
+        return ret
 
     @tornado.gen.coroutine
     def crypted_transfer_decode_dictentry(self, load, dictkey=None, tries=3, timeout=60):
         if not self.auth.authenticated:
             yield self.auth.authenticate()
-        ret = yield self.message_client.send(self._package_load(self.auth.crypticle.dumps(load)), timeout=timeout)
+        aead = self.auth.aead
+        ret = yield self.message_client.send(
+            self._package_load(self.auth.crypticle.dumps(load, aead=aead), aead=aead),
+            timeout=timeout)
         key = self.auth.get_keys()
         if HAS_M2:
             aes = key.private_decrypt(ret['key'], RSA.pkcs1_oaep_padding)
@@ -312,7 +321,7 @@ class AsyncTCPReqChannel(salt.transport.client.ReqChannel):
             cipher = PKCS1_OAEP.new(key)
             aes = cipher.decrypt(ret['key'])
         pcrypt = salt.crypt.Crypticle(self.opts, aes)
-        data = pcrypt.loads(ret[dictkey])
+        data = pcrypt.loads(ret[dictkey], aead=ret.get('aead', False))
         if six.PY3:
             data = salt.transport.frame.decode_embedded_strs(data)
         raise tornado.gen.Return(data)
@@ -327,15 +336,18 @@ class AsyncTCPReqChannel(salt.transport.client.ReqChannel):
         '''
         @tornado.gen.coroutine
         def _do_transfer():
-            data = yield self.message_client.send(self._package_load(self.auth.crypticle.dumps(load)),
-                                                  timeout=timeout,
-                                                  )
+            # The master replies in the mode of the request
+            aead = self.auth.aead
+            data = yield self.message_client.send(
+                self._package_load(self.auth.crypticle.dumps(load, aead=aead), aead=aead),
+                timeout=timeout,
+            )
             # we may not have always data
             # as for example for saltcall ret submission, this is a blind
             # communication, we do not subscribe to return events, we just
             # upload the results to the master
             if data:
-                data = self.auth.crypticle.loads(data)
+                data = self.auth.crypticle.loads(data, aead=aead)
                 if six.PY3:
                     data = salt.transport.frame.decode_embedded_strs(data)
             raise tornado.gen.Return(data)
@@ -668,6 +680,8 @@ class TCPReqServerChannel(salt.transport.mixins.auth.AESReqServerMixin, salt.tra
                     self._auth(payload['load']), header=header))
                 raise tornado.gen.Return()
 
+            # Reply in the mode of the request
+            aead = payload.get('aead', False)
             # TODO: test
             try:
                 ret, req_opts = yield self.payload_handler(payload)
@@ -682,11 +696,12 @@ class TCPReqServerChannel(salt.transport.mixins.auth.AESReqServerMixin, salt.tra
             if req_fun == 'send_clear':
                 stream.write(salt.transport.frame.frame_msg(ret, header=header))
             elif req_fun == 'send':
-                stream.write(salt.transport.frame.frame_msg(self.crypticle.dumps(ret), header=header))
+                stream.write(salt.transport.frame.frame_msg(self.crypticle.dumps(ret, aead=aead), header=header))
             elif req_fun == 'send_private':
                 stream.write(salt.transport.frame.frame_msg(self._encrypt_private(ret,
                                                              req_opts['key'],
                                                              req_opts['tgt'],
+                                                             aead=aead,
                                                              ), header=header))
             else:
                 log.error('Unknown req_fun %s', req_fun)
@@ -1194,6 +1209,12 @@ class PubServer(tornado.tcpserver.TCPServer, object):
         self.aes_funcs = salt.master.AESFuncs(self.opts)
         self.present = {}
         self.presence_events = False
+        # The number of clients a payload is written to before letting the
+        # ioloop handle other work
+        self.publish_batch_size = self.opts.get('tcp_publish_batch_size', 1000)
+        # Payloads are published one at a time, so that a minion receives
+        # them in order even though publishing one yields to the ioloop
+        self._publish_lock = tornado.locks.Lock()
         if self.opts.get('presence_events', False):
             tcp_only = True
             for transport, _ in iter_transport_opts(self.opts):
@@ -1212,10 +1233,40 @@ class PubServer(tornado.tcpserver.TCPServer, object):
                 listen=False
             )
 
+        self.presence_table = salt.utils.presence.enabled(self.opts)
+        self._presence_scheduled = False
+        if self.presence_table:
+            # Replace the table left behind by a previous publisher
+            salt.utils.presence.write(self.opts, {})
+
     def close(self):
-        if self._closing:
+        # __init__ may not have finished
+        if getattr(self, '_closing', True):
             return
         self._closing = True
+        if getattr(self, 'presence_table', False):
+            salt.utils.presence.remove(self.opts)
+
+    def _presence_changed(self):
+        '''
+        Schedule writing the presence table, at most once a second so that
+        many minions (re)connecting at once do not rewrite it every time
+        '''
+        if not self.presence_table or self._presence_scheduled:
+            return
+        self._presence_scheduled = True
+        self.io_loop.call_later(1, self._write_presence)
+
+    def _write_presence(self):
+        self._presence_scheduled = False
+        if self._closing:
+            return
+        present = {}
+        for id_, clients in six.iteritems(self.present):
+            for client in clients:
+                present[id_] = client.address[0]
+                break
+        salt.utils.presence.write(self.opts, present)
 
     def __del__(self):
         self.close()
@@ -1227,6 +1278,7 @@ class PubServer(tornado.tcpserver.TCPServer, object):
             clients.add(client)
         else:
             self.present[id_] = {client}
+            self._presence_changed()
             if self.presence_events:
                 data = {'new': [id_],
                         'lost': []}
@@ -1258,6 +1310,7 @@ class PubServer(tornado.tcpserver.TCPServer, object):
         clients.remove(client)
         if len(clients) == 0:
             del self.present[id_]
+            self._presence_changed()
             if self.presence_events:
                 data = {'new': [],
                         'lost': [id_]}
@@ -1312,44 +1365,55 @@ class PubServer(tornado.tcpserver.TCPServer, object):
         self.clients.add(client)
         self.io_loop.spawn_callback(self._stream_read, client)
 
+    def _publish_clients(self, package):
+        '''
+        Return the clients to publish a package to
+        '''
+        if 'topic_lst' not in package:
+            return list(self.clients)
+        clients = []
+        for topic in package['topic_lst']:
+            if topic in self.present:
+                # This will rarely be a list of more than 1 item. It will
+                # be more than 1 item if the minion disconnects from the
+                # master in an unclean manner (eg cable yank), then
+                # restarts and the master is yet to detect the disconnect
+                # via TCP keep-alive.
+                clients.extend(self.present[topic])
+            else:
+                log.debug('Publish target %s not connected', topic)
+        return clients
+
     # TODO: ACK the publish through IPC
     @tornado.gen.coroutine
     def publish_payload(self, package, _):
         log.debug('TCP PubServer sending payload: %s', package)
+        # Frame the payload once, the same string is written to every client
         payload = salt.transport.frame.frame_msg(package['payload'])
 
-        to_remove = []
-        if 'topic_lst' in package:
-            topic_lst = package['topic_lst']
-            for topic in topic_lst:
-                if topic in self.present:
-                    # This will rarely be a list of more than 1 item. It will
-                    # be more than 1 item if the minion disconnects from the
-                    # master in an unclean manner (eg cable yank), then
-                    # restarts and the master is yet to detect the disconnect
-                    # via TCP keep-alive.
-                    for client in self.present[topic]:
-                        try:
-                            # Write the packed str
-                            f = client.stream.write(payload)
-                            self.io_loop.add_future(f, lambda f: True)
-                        except tornado.iostream.StreamClosedError:
-                            to_remove.append(client)
-                else:
-                    log.debug('Publish target %s not connected', topic)
-        else:
-            for client in self.clients:
+        with (yield self._publish_lock.acquire()):
+            clients = self._publish_clients(package)
+            to_remove = []
+            for idx, client in enumerate(clients):
+                if self.publish_batch_size and idx and \
+                        idx % self.publish_batch_size == 0:
+                    # Let the ioloop flush the writes and handle the other
+                    # connections before writing to the next batch
+                    yield tornado.gen.moment
+                if client not in self.clients:
+                    # Disconnected while yielding
+                    continue
                 try:
                     # Write the packed str
                     f = client.stream.write(payload)
                     self.io_loop.add_future(f, lambda f: True)
                 except tornado.iostream.StreamClosedError:
                     to_remove.append(client)
-        for client in to_remove:
-            log.debug('Subscriber at %s has disconnected from publisher', client.address)
-            client.close()
-            self._remove_client_present(client)
-            self.clients.discard(client)
+            for client in to_remove:
+                log.debug('Subscriber at %s has disconnected from publisher', client.address)
+                client.close()
+                self._remove_client_present(client)
+                self.clients.discard(client)
         log.trace('TCP PubServer finished publishing payload')
 
 
@@ -1422,6 +1486,7 @@ class TCPPubServerChannel(salt.transport.server.PubServerChannel):
         try:
             self.io_loop.start()
         except (KeyboardInterrupt, SystemExit):
+            pub_server.close()
             salt.log.setup.shutdown_multiprocessing_logging()
 
     def pre_fork(self, process_manager, kwargs=None):
@@ -216,11 +216,15 @@ class AsyncZeroMQReqChannel(salt.transport.client.ReqChannel):
                                    source_port=self.opts.get('source_ret_port'))
         return self.opts['master_uri']
 
-    def _package_load(self, load):
-        return {
+    def _package_load(self, load, aead=False):
+        ret = {
             'enc': self.crypt,
             'load': load,
         }
+        if aead:
+            # The load is encrypted with AES-GCM
+            ret['aead'] = True
+        return ret
 
     @tornado.gen.coroutine
     def crypted_transfer_decode_dictentry(self, load, dictkey=None, tries=3, timeout=60):
@@ -228,8 +232,9 @@ class AsyncZeroMQReqChannel(salt.transport.client.ReqChannel):
             # Return control back to the caller, continue when authentication succeeds
             yield self.auth.authenticate()
         # Return control to the caller. When send() completes, resume by populating ret with the Future.result
+        aead = self.auth.aead
         ret = yield self.message_client.send(
-            self._package_load(self.auth.crypticle.dumps(load)),
+            self._package_load(self.auth.crypticle.dumps(load, aead=aead), aead=aead),
             timeout=timeout,
             tries=tries,
         )
@@ -237,8 +242,9 @@ class AsyncZeroMQReqChannel(salt.transport.client.ReqChannel):
         if 'key' not in ret:
             # Reauth in the case our key is deleted on the master side.
             yield self.auth.authenticate()
+            aead = self.auth.aead
             ret = yield self.message_client.send(
-                self._package_load(self.auth.crypticle.dumps(load)),
+                self._package_load(self.auth.crypticle.dumps(load, aead=aead), aead=aead),
                 timeout=timeout,
                 tries=tries,
             )
@@ -249,7 +255,7 @@ class AsyncZeroMQReqChannel(salt.transport.client.ReqChannel):
             cipher = PKCS1_OAEP.new(key)
             aes = cipher.decrypt(ret['key'])
         pcrypt = salt.crypt.Crypticle(self.opts, aes)
-        data = pcrypt.loads(ret[dictkey])
+        data = pcrypt.loads(ret[dictkey], aead=ret.get('aead', False))
         if six.PY3:
             data = salt.transport.frame.decode_embedded_strs(data)
         raise tornado.gen.Return(data)
@@ -272,8 +278,10 @@ class AsyncZeroMQReqChannel(salt.transport.client.ReqChannel):
         @tornado.gen.coroutine
         def _do_transfer():
             # Yield control to the caller. When send() completes, resume by populating data with the Future.result
+            # The master replies in the mode of the request
+            aead = self.auth.aead
             data = yield self.message_client.send(
-                self._package_load(self.auth.crypticle.dumps(load)),
+                self._package_load(self.auth.crypticle.dumps(load, aead=aead), aead=aead),
                 timeout=timeout,
                 tries=tries,
             )
@@ -282,7 +290,7 @@ class AsyncZeroMQReqChannel(salt.transport.client.ReqChannel):
             # communication, we do not subscribe to return events, we just
             # upload the results to the master
             if data:
-                data = self.auth.crypticle.loads(data, raw)
+                data = self.auth.crypticle.loads(data, raw, aead=aead)
             if six.PY3 and not raw:
                 data = salt.transport.frame.decode_embedded_strs(data)
             raise tornado.gen.Return(data)
@@ -692,6 +700,8 @@ class ZeroMQReqServerChannel(salt.transport.mixins.auth.AESReqServerMixin,
             stream.send(self.serial.dumps(self._auth(payload['load'])))
             raise tornado.gen.Return()
 
+        # Reply in the mode of the request
+        aead = payload.get('aead', False)
         # TODO: test
         try:
             # Take the payload_handler function that was registered when we created the channel
@@ -707,11 +717,12 @@ class ZeroMQReqServerChannel(salt.transport.mixins.auth.AESReqServerMixin,
         if req_fun == 'send_clear':
             stream.send(self.serial.dumps(ret))
         elif req_fun == 'send':
-            stream.send(self.serial.dumps(self.crypticle.dumps(ret)))
+            stream.send(self.serial.dumps(self.crypticle.dumps(ret, aead=aead)))
         elif req_fun == 'send_private':
             stream.send(self.serial.dumps(self._encrypt_private(ret,
                                                                 req_opts['key'],
                                                                 req_opts['tgt'],
+                                                                aead=aead,
                                                                 )))
         else:
             log.error('Unknown req_fun %s', req_fun)
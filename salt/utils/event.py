@@ -55,11 +55,12 @@ from __future__ import absolute_import, unicode_literals, print_function
 # Import python libs
 import os
 import time
-import fnmatch
 import hashlib
 import logging
 import datetime
+import signal
 import sys
+import threading
 
 try:
     from collections.abc import MutableMapping
@@ -68,6 +69,7 @@ except ImportError:
 
 from multiprocessing.util import Finalize
 from salt.ext.six.moves import range
+from salt.ext.six.moves import queue
 
 # Import third party libs
 from salt.ext import six
@@ -84,6 +86,7 @@ import salt.utils.files
 import salt.utils.platform
 import salt.utils.process
 import salt.utils.stringutils
+import salt.utils.tagmatch
 import salt.utils.zeromq
 import salt.log.setup
 import salt.defaults.exitcodes
@@ -278,6 +281,9 @@ class SaltEvent(object):
         self.puburi, self.pulluri = self.__load_uri(sock_dir, node)
         self.pending_tags = []
         self.pending_events = []
+        self.tag_filter = None
+        # Where to resume the event stream when reconnecting to the publisher
+        self.resume_pos = None
         self.__load_cache_regex()
         if listen and not self.cpub:
             # Only connect to the publisher at initialization time if
@@ -372,6 +378,39 @@ class SaltEvent(object):
             if any(pmatch_func(evt['tag'], ptag) for ptag, pmatch_func in self.pending_tags):
                 self.pending_events.append(evt)
 
+    def set_tag_filter(self, tags=None, match_type=None):
+        '''
+        Ask the event publisher to only send events whose tag matches one of
+        the passed tags, events with other tags are never written to this
+        listener's connection. Pass None to receive all events again.
+
+        The filter has to cover every tag passed to get_event and subscribe,
+        events are still matched against those once received.
+
+        match_type
+            ``startswith`` or ``fnmatch``. Default is
+            opts['event_match_type'].
+
+        .. versionadded:: Neon
+        '''
+        if tags is None:
+            self.tag_filter = None
+        else:
+            if match_type is None:
+                match_type = self.opts['event_match_type']
+            if isinstance(tags, six.string_types):
+                tags = [tags]
+            self.tag_filter = [[tag, match_type] for tag in tags]
+        if self.subscriber is None:
+            return
+        if self._run_io_loop_sync:
+            with salt.utils.asynchronous.current_ioloop(self.io_loop):
+                self.io_loop.run_sync(
+                    lambda: self.subscriber.set_tag_filter(self.tag_filter))
+        else:
+            self.io_loop.spawn_callback(
+                self.subscriber.set_tag_filter, self.tag_filter)
+
     def connect_pub(self, timeout=None):
         '''
         Establish the publish connection
@@ -386,6 +425,12 @@ class SaltEvent(object):
                     self.puburi,
                     io_loop=self.io_loop
                 )
+                if self.tag_filter is not None:
+                    self.io_loop.run_sync(
+                        lambda: self.subscriber.set_tag_filter(self.tag_filter))
+                if self.resume_pos is not None:
+                    self.subscriber.resume_from(*self.resume_pos)
+                    self.resume_pos = None
                 try:
                     self.io_loop.run_sync(
                         lambda: self.subscriber.connect(timeout=timeout))
@@ -398,6 +443,12 @@ class SaltEvent(object):
                 self.puburi,
                 io_loop=self.io_loop
             )
+            if self.tag_filter is not None:
+                self.io_loop.spawn_callback(
+                    self.subscriber.set_tag_filter, self.tag_filter)
+            if self.resume_pos is not None:
+                self.subscriber.resume_from(*self.resume_pos)
+                self.resume_pos = None
 
             # For the asynchronous case, the connect will be defered to when
             # set_event_handler() is invoked.
@@ -449,17 +500,69 @@ class SaltEvent(object):
         return self.cpush
 
     @classmethod
-    def unpack(cls, raw, serial=None):
+    def unpack_tag(cls, raw):
+        '''
+        Split the tag from a raw event, return the tag and the still packed
+        event data
+        '''
+        if six.PY2:
+            mtag, sep, mdata = raw.partition(TAGEND)  # split tag from data
+        else:
+            # Return the data as a view on the raw event, so that large
+            # events are not copied before being unpacked
+            tagend = salt.utils.stringutils.to_bytes(TAGEND)
+            idx = raw.find(tagend)
+            if idx == -1:
+                mtag, mdata = raw, b''
+            else:
+                mtag = raw[:idx]
+                mdata = memoryview(raw)[idx + len(tagend):]
+            mtag = salt.utils.stringutils.to_str(mtag)
+        return mtag, mdata
+
+    @classmethod
+    def pack(cls, tag, data, serial=None, max_size=None):
+        '''
+        Pack an event, trimming the data to max_size bytes if passed
+        '''
+        return b''.join(cls.pack_parts(tag, data, serial, max_size))
+
+    @classmethod
+    def pack_parts(cls, tag, data, serial=None, max_size=None):
+        '''
+        Pack an event like pack() does, but return the tag and the packed data
+        as separate strings instead of joining them
+        '''
         if serial is None:
             serial = salt.payload.Serial({'serial': 'msgpack'})
 
         if six.PY2:
-            mtag, sep, mdata = raw.partition(TAGEND)  # split tag from data
-            data = serial.loads(mdata, encoding='utf-8')
+            dump_data = serial.dumps(data)
         else:
-            mtag, sep, mdata = raw.partition(salt.utils.stringutils.to_bytes(TAGEND))  # split tag from data
-            mtag = salt.utils.stringutils.to_str(mtag)
-            data = serial.loads(mdata, encoding='utf-8')
+            # Since the pack / unpack logic here is for local events only,
+            # it is safe to change the wire protocol. The mechanism
+            # that sends events from minion to master is outside this
+            # file.
+            dump_data = serial.dumps(data, use_bin_type=True)
+
+        if max_size is not None:
+            dump_data = salt.utils.dicttrim.trim_dict(
+                dump_data,
+                max_size,
+                is_msgpacked=True,
+                use_bin_type=six.PY3
+            )
+        return [salt.utils.stringutils.to_bytes(tag) +
+                salt.utils.stringutils.to_bytes(TAGEND),
+                salt.utils.stringutils.to_bytes(dump_data, 'utf-8')]
+
+    @classmethod
+    def unpack(cls, raw, serial=None):
+        if serial is None:
+            serial = salt.payload.Serial({'serial': 'msgpack'})
+
+        mtag, mdata = cls.unpack_tag(raw)
+        data = serial.loads(mdata, encoding='utf-8')
         return mtag, data
 
     def _get_match_func(self, match_type=None):
@@ -535,7 +638,7 @@ class SaltEvent(object):
         Uses fnmatch to check.
         Return True (matches) or False (no match)
         '''
-        return fnmatch.fnmatch(event_tag, search_tag)
+        return salt.utils.tagmatch.match(event_tag, search_tag)
 
     def _get_event(self, wait, tag, match_func=None, no_block=False):
         if match_func is None:
@@ -564,8 +667,7 @@ class SaltEvent(object):
                 raw = self.subscriber.read_sync(timeout=wait)
                 if raw is None:
                     break
-                mtag, data = self.unpack(raw, self.serial)
-                ret = {'data': data, 'tag': mtag}
+                mtag, mdata = self.unpack_tag(raw)
             except KeyboardInterrupt:
                 return {'tag': 'salt/event/exit', 'data': {}}
             except tornado.iostream.StreamClosedError:
@@ -576,15 +678,18 @@ class SaltEvent(object):
             except RuntimeError:
                 return None
 
-            if not match_func(ret['tag'], tag):
-                # tag not match
-                if any(pmatch_func(ret['tag'], ptag) for ptag, pmatch_func in self.pending_tags):
+            if not match_func(mtag, tag):
+                # tag not match, only unpack the data if the event is cached
+                if any(pmatch_func(mtag, ptag) for ptag, pmatch_func in self.pending_tags):
+                    ret = {'data': self.serial.loads(mdata, encoding='utf-8'),
+                           'tag': mtag}
                     log.trace('get_event() caching unwanted event = %s', ret)
                     self.pending_events.append(ret)
                 if wait:  # only update the wait timeout if we had one
                     wait = timeout_at - time.time()
                 continue
 
+            ret = {'data': self.serial.loads(mdata, encoding='utf-8'), 'tag': mtag}
             log.trace('get_event() received = %s', ret)
             return ret
         log.trace('_get_event() waited %s seconds and received nothing', wait)
@@ -657,6 +762,11 @@ class SaltEvent(object):
                             ret = self._get_event(wait, tag, match_func, no_block)
                             break
                         except tornado.iostream.StreamClosedError:
+                            # Ask the publisher for the events fired while
+                            # reconnecting, if it keeps a backlog
+                            if self.subscriber.seq is not None:
+                                self.resume_pos = (self.subscriber.epoch,
+                                                   self.subscriber.seq)
                             self.close_pub()
                             self.connect_pub(timeout=wait)
                             continue
@@ -736,37 +846,19 @@ class SaltEvent(object):
 
         data['_stamp'] = datetime.datetime.utcnow().isoformat()
 
-        tagend = TAGEND
-        if six.PY2:
-            dump_data = self.serial.dumps(data)
-        else:
-            # Since the pack / unpack logic here is for local events only,
-            # it is safe to change the wire protocol. The mechanism
-            # that sends events from minion to master is outside this
-            # file.
-            dump_data = self.serial.dumps(data, use_bin_type=True)
-
-        serialized_data = salt.utils.dicttrim.trim_dict(
-            dump_data,
-            self.opts['max_event_size'],
-            is_msgpacked=True,
-            use_bin_type=six.PY3
-        )
         log.debug('Sending event: tag = %s; data = %s', tag, data)
-        event = b''.join([
-            salt.utils.stringutils.to_bytes(tag),
-            salt.utils.stringutils.to_bytes(tagend),
-            serialized_data])
-        msg = salt.utils.stringutils.to_bytes(event, 'utf-8')
+        # The tag and the packed data are framed and written to the socket
+        # without joining them, large events are not copied on the way
+        parts = self.pack_parts(tag, data, self.serial, self.opts['max_event_size'])
         if self._run_io_loop_sync:
             with salt.utils.asynchronous.current_ioloop(self.io_loop):
                 try:
-                    self.io_loop.run_sync(lambda: self.pusher.send(msg))
+                    self.io_loop.run_sync(lambda: self.pusher.send_parts(parts))
                 except Exception as ex:
                     log.debug(ex)
                     raise
         else:
-            self.io_loop.spawn_callback(self.pusher.send, msg)
+            self.io_loop.spawn_callback(self.pusher.send_parts, parts)
         return True
 
     def fire_master(self, data, tag, timeout=1000):
@@ -957,6 +1049,119 @@ class MinionEvent(SaltEvent):
             raise_errors=raise_errors)
 
 
+class EventBusStats(object):
+    '''
+    Count the events an event publisher sends per tag prefix, and answer
+    requests for these statistics sent over the event bus
+    '''
+    # Events are counted per prefix of this many tag parts
+    depth = 2
+    # The maximum number of prefixes counted separately. Events with tags
+    # which are not paths, like the bare jids the master fires for every
+    # publish, and the events of any further prefixes are counted as 'other'.
+    max_prefixes = 256
+    other = 'other'
+    # Seconds over which the event and byte rates are calculated
+    window = 10
+    # The tag of the statistics events, and of the events requesting them
+    tag = 'salt/event/stats'
+    request_tag = 'salt/event/stats/request'
+
+    def __init__(self, publisher):
+        self.publisher = publisher
+        self.start = self.window_start = time.time()
+        # Events and bytes per tag prefix
+        self.counts = {}
+        # The counts when the current window started
+        self.window_counts = {}
+        # The rates over the last complete window
+        self.rates = None
+
+    def add(self, package, tag=None):
+        '''
+        Count a published event and answer it if it requests statistics. The
+        tag of the event can be passed if it has already been looked up.
+        '''
+        if tag is None:
+            tag = salt.transport.ipc.msg_tag(package)
+        if TAGPARTER in tag:
+            prefix = TAGPARTER.join(tag.split(TAGPARTER, self.depth)[:self.depth])
+        else:
+            prefix = self.other
+        counts = self.counts.get(prefix)
+        if counts is None:
+            if len(self.counts) >= self.max_prefixes:
+                prefix = self.other
+            counts = self.counts.setdefault(prefix, [0, 0])
+        counts[0] += 1
+        counts[1] += len(package)
+        if tag == self.request_tag:
+            try:
+                data = SaltEvent.unpack(package)[1]
+            except Exception:
+                data = {}
+            self.fire(data.get('id'))
+        if time.time() - self.window_start >= self.window:
+            self.roll()
+
+    def _rates(self, now):
+        elapsed = now - self.window_start
+        rates = {}
+        for prefix, counts in six.iteritems(self.counts):
+            events, size = self.window_counts.get(prefix, (0, 0))
+            rates[prefix] = ((counts[0] - events) / elapsed,
+                             (counts[1] - size) / elapsed)
+        return rates
+
+    def roll(self):
+        '''
+        Calculate the rates over the window which ends now and start the next
+        '''
+        now = time.time()
+        if now <= self.window_start:
+            return
+        self.rates = self._rates(now)
+        self.window_counts = dict(
+            (prefix, tuple(counts)) for prefix, counts in six.iteritems(self.counts))
+        self.window_start = now
+
+    def report(self, publisher=True):
+        '''
+        Return the statistics of the event bus, with those of the publisher's
+        subscribers unless publisher is False
+        '''
+        now = time.time()
+        rates = self.rates
+        if rates is None:
+            # No complete window yet
+            rates = self._rates(now) if now > self.window_start else {}
+        tags = {}
+        for prefix, counts in six.iteritems(self.counts):
+            events_per_sec, bytes_per_sec = rates.get(prefix, (0.0, 0.0))
+            tags[prefix] = {'events': counts[0],
+                            'bytes': counts[1],
+                            'events_per_sec': events_per_sec,
+                            'bytes_per_sec': bytes_per_sec}
+        ret = {'uptime': now - self.start,
+               'events': sum(counts[0] for counts in six.itervalues(self.counts)),
+               'bytes': sum(counts[1] for counts in six.itervalues(self.counts)),
+               'tags': tags}
+        if publisher:
+            ret['publisher'] = self.publisher.stats()
+        return ret
+
+    def fire(self, request_id=None):
+        '''
+        Publish the statistics as an event, with the id of the request it
+        answers if any
+        '''
+        data = self.report()
+        if request_id is not None:
+            data['id'] = request_id
+        data['_stamp'] = datetime.datetime.utcnow().isoformat()
+        self.publisher.publish(SaltEvent.pack(self.tag, data))
+
+
 class AsyncEventPublisher(object):
     '''
     An event publisher class intended to run in an ioloop (within a single process)
@@ -1045,12 +1250,16 @@ class AsyncEventPublisher(object):
             self.publisher.start()
             self.puller.start()
 
+        self.bus_stats = EventBusStats(self.publisher)
+
     def handle_publish(self, package, _):
         '''
         Get something from epull, publish it out epub, and return the package (or None)
         '''
         try:
-            self.publisher.publish(package)
+            tag = salt.transport.ipc.msg_tag(package)
+            self.publisher.publish(package, tag=tag)
+            self.bus_stats.add(package, tag=tag)
             return package
         # Add an extra fallback in case a forked process leeks through
         except Exception:
@@ -1142,18 +1351,40 @@ class EventPublisher(salt.utils.process.SignalHandlingMultiprocessingProcess):
                     os.chmod(os.path.join(
                         self.opts['sock_dir'], 'master_event_pub.ipc'), 0o666)
 
+            self.bus_stats = EventBusStats(self.publisher)
+
+            if self.opts['master_stats']:
+                self.event = get_master_event(
+                    self.opts, self.opts['sock_dir'], listen=False,
+                    io_loop=self.io_loop)
+                self.stats_callback = tornado.ioloop.PeriodicCallback(
+                    self._post_stats,
+                    self.opts['master_stats_event_iter'] * 1000)
+                self.stats_callback.start()
+
             # Make sure the IO loop and respective sockets are closed and
             # destroyed
             Finalize(self, self.close, exitpriority=15)
 
             self.io_loop.start()
 
+    def _post_stats(self):
+        '''
+        Fire an event with the subscriber queue statistics of the publisher
+        and the statistics of the events it published
+        '''
+        self.event.fire_event({'stats': self.publisher.stats(),
+                               'bus': self.bus_stats.report(publisher=False)},
+                              tagify(self.__class__.__name__, 'stats'))
+
     def handle_publish(self, package, _):
         '''
         Get something from epull, publish it out epub, and return the package (or None)
         '''
         try:
-            self.publisher.publish(package)
+            tag = salt.transport.ipc.msg_tag(package)
+            self.publisher.publish(package, tag=tag)
+            self.bus_stats.add(package, tag=tag)
             return package
         # Add an extra fallback in case a forked process leeks through
         except Exception:
@@ -1165,6 +1396,10 @@ class EventPublisher(salt.utils.process.SignalHandlingMultiprocessingProcess):
         if self._closing:
             return
         self._closing = True
+        if hasattr(self, 'stats_callback'):
+            self.stats_callback.stop()
+        if hasattr(self, 'event'):
+            self.event.destroy()
         if hasattr(self, 'publisher'):
             self.publisher.close()
         if hasattr(self, 'puller'):
@@ -1184,7 +1419,16 @@ class EventReturn(salt.utils.process.SignalHandlingMultiprocessingProcess):
     '''
     A dedicated process which listens to the master event bus and queues
     and forwards events to the specified returner.
+
+    Batches of events are handed to a flush thread, so a slow returner does
+    not hold up reading events. Batches a returner fails to store are spooled
+    to disk if event_return_spool is set, and passed to the returner again in
+    order once it recovers. With the spool, batches which do not fit in the
+    event_return_backlog are spooled right away instead of being dropped.
     '''
+    # Seconds between attempts to replay spooled batches while idle
+    spool_retry_interval = 10
+
     def __new__(cls, *args, **kwargs):
         if sys.platform.startswith('win'):
             # This is required for Windows.  On Linux, when a process is
@@ -1205,10 +1449,46 @@ class EventReturn(salt.utils.process.SignalHandlingMultiprocessingProcess):
 
         self.opts = opts
         self.event_return_queue = self.opts['event_return_queue']
+        self.event_return_queue_max_seconds = self.opts.get(
+            'event_return_queue_max_seconds', 0)
         local_minion_opts = self.opts.copy()
         local_minion_opts['file_client'] = 'local'
         self.minion = salt.minion.MasterMinion(local_minion_opts)
+        self.serial = salt.payload.Serial(self.opts)
         self.event_queue = []
+        self.batch_start = None
+        self.flush_queue = None
+        self.flush_thread = None
+        self.spool_dir = None
+        if self.opts.get('event_return_spool', False):
+            self.spool_dir = os.path.join(
+                self.opts['cachedir'], 'event_return_spool')
+        # When to next pass spooled batches to a failing returner
+        self._retry_at = {}
+        # Batches are numbered in order, spooled batches are named after
+        # their number. Both the event loop and the flush thread spool.
+        self.batch_seq = 0
+        self._spool_lock = threading.Lock()
+        self.whitelist = salt.utils.tagmatch.TagMatcher(
+            self.opts['event_return_whitelist'])
+        self.blacklist = salt.utils.tagmatch.TagMatcher(
+            self.opts['event_return_blacklist'])
+        self.stats = {
+            'flushed_events': 0,
+            'failed_events': 0,
+            'dropped_events': 0,
+            'spooled_events': 0,
+            'flushes': 0,
+            'flush_time': 0.0,
+            'max_flush_time': 0.0,
+        }
+        if self.spool_dir is not None:
+            # Batches spooled before a restart are still to be stored
+            for event_return in self._returners():
+                for fn_ in self._spooled(event_return):
+                    self.stats['spooled_events'] += self._spooled_events(fn_)
+                    self.batch_seq = max(self.batch_seq, self._spooled_seq(fn_) + 1)
+        self.stat_clock = time.time()
         self.stop = False
 
     # __setstate__ and __getstate__ are only used on Windows.
@@ -1230,44 +1510,278 @@ class EventReturn(salt.utils.process.SignalHandlingMultiprocessingProcess):
         }
 
     def _handle_signals(self, signum, sigframe):
-        # Flush and terminate
-        if self.event_queue:
-            self.flush_events()
+        # Stop reading events, run() then stores the queued events and waits
+        # for the flush thread before the process exits
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        log.debug('%s received signal %s. Exiting',
+                  self.__class__.__name__, signum)
         self.stop = True
-        super(EventReturn, self)._handle_signals(signum, sigframe)
 
-    def flush_events(self):
+    def _returners(self):
+        '''
+        Return the names of the event_return functions of the configured
+        returners
+        '''
         if isinstance(self.opts['event_return'], list):
             # Multiple event returners
-            for r in self.opts['event_return']:
-                log.debug('Calling event returner {0}, one of many.'.format(r))
-                event_return = '{0}.event_return'.format(r)
-                self._flush_event_single(event_return)
+            returners = self.opts['event_return']
         else:
             # Only a single event returner
-            log.debug('Calling event returner {0}, only one '
-                      'configured.'.format(self.opts['event_return']))
-            event_return = '{0}.event_return'.format(
-                self.opts['event_return']
-                )
-            self._flush_event_single(event_return)
-        del self.event_queue[:]
+            returners = [self.opts['event_return']]
+        return ['{0}.event_return'.format(r) for r in returners]
 
-    def _flush_event_single(self, event_return):
-        if event_return in self.minion.returners:
-            try:
-                self.minion.returners[event_return](self.event_queue)
-            except Exception as exc:
-                log.error('Could not store events - returner \'{0}\' raised '
-                          'exception: {1}'.format(event_return, exc))
-                # don't waste processing power unnecessarily on converting a
-                # potentially huge dataset to a string
-                if log.level <= logging.DEBUG:
-                    log.debug('Event data that caused an exception: {0}'.format(
-                        self.event_queue))
-        else:
+    def flush_events(self):
+        '''
+        Hand the queued events to the flush thread, or store them right away
+        if the flush thread is not running
+        '''
+        events = self.event_queue
+        self.event_queue = []
+        self.batch_start = None
+        seq = self.batch_seq
+        self.batch_seq += 1
+        if self.flush_thread is None or not self.flush_thread.is_alive():
+            self._flush_batch(events, seq)
+            return
+        try:
+            self.flush_queue.put_nowait((seq, events))
+        except queue.Full:
+            if self.spool_dir is None:
+                log.error('The event returner backlog is full, dropping '
+                          '%s events', len(events))
+                self.stats['dropped_events'] += len(events)
+                return
+            # Do not wait for the flush thread, it passes the batch on to the
+            # returners after the older batches it holds
+            log.warning('The event returner backlog is full, spooling '
+                        '%s events', len(events))
+            for event_return in self._returners():
+                if event_return in self.minion.returners:
+                    self._spool(event_return, events, seq)
+
+    def _flush_batch(self, events, seq=None):
+        if seq is None:
+            seq = self.batch_seq
+            self.batch_seq += 1
+        for event_return in self._returners():
+            log.debug('Calling event returner %s', event_return)
+            self._flush_event_single(event_return, events, seq)
+
+    def _flush_event_single(self, event_return, events, seq):
+        if event_return not in self.minion.returners:
             log.error('Could not store return for event(s) - returner '
                       '\'%s\' not found.', event_return)
+            return
+        if self.spool_dir is not None and not self._replay_spool(event_return, seq):
+            # Keep the order of the events, spool behind the older batches
+            self._spool(event_return, events, seq)
+            return
+        if not self._call_returner(event_return, events):
+            if self.spool_dir is not None:
+                self._retry_at[event_return] = time.time() + self.spool_retry_interval
+                self._spool(event_return, events, seq)
+            else:
+                self.stats['failed_events'] += len(events)
+
+    def _call_returner(self, event_return, events):
+        '''
+        Pass a batch of events to a returner, return True if it stored them
+        '''
+        start = time.time()
+        try:
+            self.minion.returners[event_return](events)
+        except Exception as exc:
+            log.error('Could not store events - returner \'{0}\' raised '
+                      'exception: {1}'.format(event_return, exc))
+            # don't waste processing power unnecessarily on converting a
+            # potentially huge dataset to a string
+            if log.level <= logging.DEBUG:
+                log.debug('Event data that caused an exception: {0}'.format(
+                    events))
+            return False
+        duration = time.time() - start
+        self.stats['flushed_events'] += len(events)
+        self.stats['flushes'] += 1
+        self.stats['flush_time'] += duration
+        self.stats['max_flush_time'] = max(self.stats['max_flush_time'], duration)
+        return True
+
+    def _spool_path(self, event_return):
+        return os.path.join(self.spool_dir, event_return.split('.')[0])
+
+    def _spooled(self, event_return):
+        '''
+        Return the spooled batch files of a returner, oldest first
+        '''
+        path = self._spool_path(event_return)
+        if not os.path.isdir(path):
+            return []
+        return sorted(fn_ for fn_ in os.listdir(path) if fn_.endswith('.p'))
+
+    @staticmethod
+    def _spooled_seq(fn_):
+        '''
+        Return the number of the batch in a spooled batch file
+        '''
+        return int(fn_[:20])
+
+    @staticmethod
+    def _spooled_events(fn_):
+        '''
+        Return the number of events in a spooled batch file, which is part of
+        its name
+        '''
+        try:
+            return int(fn_[:-2].split('-')[1])
+        except (IndexError, ValueError):
+            return 0
+
+    def _spool(self, event_return, events, seq):
+        '''
+        Write a batch of events a returner has not stored to its spool
+        '''
+        path = self._spool_path(event_return)
+        with self._spool_lock:
+            try:
+                if not os.path.isdir(path):
+                    os.makedirs(path)
+                with salt.utils.files.set_umask(0o077):
+                    with salt.utils.files.fopen(
+                            os.path.join(path, '{0:020d}-{1}.p'.format(seq, len(events))),
+                            'w+b') as fp_:
+                        self.serial.dump(events, fp_)
+            except (IOError, OSError) as exc:
+                log.error('Could not spool events for returner %s: %s',
+                          event_return, exc)
+                self.stats['failed_events'] += len(events)
+                return
+            self.stats['spooled_events'] += len(events)
+            self._trim_spool(event_return)
+
+    def _trim_spool(self, event_return):
+        '''
+        Drop the oldest spooled batches of a returner while its spool is
+        larger than event_return_spool_size, the newest batch is always kept
+        '''
+        max_size = self.opts.get('event_return_spool_size', 0)
+        if not max_size:
+            return
+        path = self._spool_path(event_return)
+        spooled = []
+        for fn_ in self._spooled(event_return):
+            try:
+                spooled.append((fn_, os.path.getsize(os.path.join(path, fn_))))
+            except OSError:
+                continue
+        size = sum(fn_size for _, fn_size in spooled)
+        dropped = 0
+        for fn_, fn_size in spooled[:-1]:
+            if size <= max_size:
+                break
+            try:
+                os.remove(os.path.join(path, fn_))
+            except OSError:
+                continue
+            size -= fn_size
+            dropped += self._spooled_events(fn_)
+        if dropped:
+            log.error('The spool of event returner %s is full, dropped the '
+                      '%s oldest spooled events', event_return, dropped)
+            self.stats['spooled_events'] -= dropped
+            self.stats['dropped_events'] += dropped
+
+    def _replay_spool(self, event_return, seq=None):
+        '''
+        Pass the spooled batches of a returner older than the batch numbered
+        seq, or all of them, to it in order, return True once none of them
+        are left in the spool
+        '''
+        with self._spool_lock:
+            spooled = [fn_ for fn_ in self._spooled(event_return)
+                       if seq is None or self._spooled_seq(fn_) < seq]
+        if spooled and time.time() < self._retry_at.get(event_return, 0):
+            return False
+        path = self._spool_path(event_return)
+        for fn_ in spooled:
+            spool_file = os.path.join(path, fn_)
+            with self._spool_lock:
+                if not os.path.isfile(spool_file):
+                    # Dropped by _trim_spool
+                    continue
+                try:
+                    with salt.utils.files.fopen(spool_file, 'rb') as fp_:
+                        events = self.serial.load(fp_)
+                except Exception as exc:
+                    log.error('Could not read spooled events from %s: %s',
+                              spool_file, exc)
+                    os.remove(spool_file)
+                    self.stats['spooled_events'] -= self._spooled_events(fn_)
+                    self.stats['failed_events'] += self._spooled_events(fn_)
+                    continue
+            if not self._call_returner(event_return, events):
+                self._retry_at[event_return] = time.time() + self.spool_retry_interval
+                return False
+            with self._spool_lock:
+                if os.path.isfile(spool_file):
+                    os.remove(spool_file)
+                    self.stats['spooled_events'] -= len(events)
+        return True
+
+    def _replay_spools(self):
+        for event_return in self._returners():
+            if event_return in self.minion.returners:
+                self._replay_spool(event_return)
+
+    def _flush_loop(self):
+        '''
+        Store the batches handed over by the event loop until stopped
+        '''
+        while True:
+            try:
+                batch = self.flush_queue.get(timeout=self.spool_retry_interval)
+            except queue.Empty:
+                if self.spool_dir is not None:
+                    self._replay_spools()
+                continue
+            if batch is None:
+                break
+            seq, events = batch
+            self._flush_batch(events, seq)
+
+    def _start_flush_thread(self):
+        self.flush_queue = queue.Queue(
+            maxsize=self.opts.get('event_return_backlog', 0))
+        self.flush_thread = threading.Thread(
+            target=self._flush_loop, name='EventReturnFlush')
+        self.flush_thread.daemon = True
+        self.flush_thread.start()
+
+    def _stop_flush_thread(self):
+        '''
+        Wait until the flush thread stored all handed over batches
+        '''
+        if self.flush_thread is None or not self.flush_thread.is_alive():
+            return
+        self.flush_queue.put(None)
+        self.flush_thread.join()
+
+    def _post_stats(self):
+        '''
+        Fire an event with the event returner statistics if it's time
+        '''
+        end_time = time.time()
+        if end_time - self.stat_clock > self.opts['master_stats_event_iter']:
+            stats = dict(self.stats)
+            stats['backlog'] = self.flush_queue.qsize() if self.flush_queue else 0
+            if self.spool_dir is not None:
+                stats['spooled_batches'] = sum(
+                    len(self._spooled(r)) for r in self._returners())
+            if stats['flushes']:
+                stats['mean_flush_time'] = stats['flush_time'] / stats['flushes']
+            self.event.fire_event({'time': end_time - self.stat_clock, 'stats': stats},
+                                  tagify(self.__class__.__name__, 'stats'))
+            self.stat_clock = end_time
 
     def run(self):
         '''
@@ -1275,21 +1789,35 @@ class EventReturn(salt.utils.process.SignalHandlingMultiprocessingProcess):
         '''
         salt.utils.process.appendproctitle(self.__class__.__name__)
         self.event = get_event('master', opts=self.opts, listen=True)
-        events = self.event.iter_events(full=True)
+        if self.opts['event_return_whitelist']:
+            # Events which are not whitelisted are not stored, do not let
+            # the publisher send them
+            self.event.set_tag_filter(
+                self.opts['event_return_whitelist'] + ['salt/event/exit'],
+                'fnmatch')
+        self._start_flush_thread()
         self.event.fire_event({}, 'salt/event_listen/start')
         try:
-            for event in events:
-                if event['tag'] == 'salt/event/exit':
-                    self.stop = True
-                if self._filter(event):
-                    self.event_queue.append(event)
-                if len(self.event_queue) >= self.event_return_queue:
+            while not self.stop:
+                event = self.event.get_event(wait=1, full=True, auto_reconnect=True)
+                if event is not None:
+                    if event['tag'] == 'salt/event/exit':
+                        self.stop = True
+                    if self._filter(event):
+                        if not self.event_queue:
+                            self.batch_start = time.time()
+                        self.event_queue.append(event)
+                if self.event_queue and (
+                        len(self.event_queue) >= self.event_return_queue or
+                        self.event_return_queue_max_seconds and
+                        time.time() - self.batch_start >= self.event_return_queue_max_seconds):
                     self.flush_events()
-                if self.stop:
-                    break
+                if self.opts['master_stats']:
+                    self._post_stats()
         finally:  # flush all we have at this moment
             if self.event_queue:
                 self.flush_events()
+            self._stop_flush_thread()
 
     def _filter(self, event):
         '''
@@ -1298,19 +1826,9 @@ class EventReturn(salt.utils.process.SignalHandlingMultiprocessingProcess):
         Returns True if event should be stored, else False
         '''
         tag = event['tag']
-        if self.opts['event_return_whitelist']:
-            ret = False
-        else:
-            ret = True
-        for whitelist_match in self.opts['event_return_whitelist']:
-            if fnmatch.fnmatch(tag, whitelist_match):
-                ret = True
-                break
-        for blacklist_match in self.opts['event_return_blacklist']:
-            if fnmatch.fnmatch(tag, blacklist_match):
-                ret = False
-                break
-        return ret
+        if self.whitelist and not self.whitelist.match(tag):
+            return False
+        return not self.blacklist.match(tag)
 
 
 class StateFire(object):
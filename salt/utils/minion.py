@@ -11,13 +11,89 @@ import threading
 
 # Import Salt Libs
 import salt.payload
+import salt.utils.atomicfile
 import salt.utils.files
 import salt.utils.platform
 import salt.utils.process
 
+from salt.utils.odict import OrderedDict
+
 log = logging.getLogger(__name__)
 
 
+class JidQueue(object):
+    '''
+    The jids of the jobs a minion started most recently, oldest first, used
+    to not run a job published by several masters more than once
+
+    If a path is passed, the jids are also written to it and read back when
+    the minion restarts.
+    '''
+    def __init__(self, hwm=100, jids=None, path=None, opts=None):
+        self.hwm = hwm
+        self.path = path
+        self.serial = salt.payload.Serial(opts or {})
+        self.jids = OrderedDict()
+        if jids is None and path is not None:
+            jids = self._load()
+        for jid in jids or []:
+            self.jids[jid] = True
+
+    def _load(self):
+        try:
+            with salt.utils.files.fopen(self.path, 'rb') as fp_:
+                return self.serial.load(fp_)
+        except (IOError, OSError):
+            return []
+        except Exception as exc:
+            log.warning('Unable to read the jid queue from %s: %s', self.path, exc)
+            return []
+
+    def _save(self):
+        try:
+            with salt.utils.atomicfile.atomic_open(self.path, 'wb') as fp_:
+                self.serial.dump(list(self.jids), fp_)
+        except (IOError, OSError) as exc:
+            log.warning('Unable to write the jid queue to %s: %s', self.path, exc)
+
+    def add(self, jid):
+        '''
+        Add a jid, return False if it is already in the queue. The oldest jids
+        are dropped when there are more than hwm of them.
+        '''
+        if jid in self.jids:
+            return False
+        self.jids[jid] = True
+        while len(self.jids) > self.hwm:
+            self.jids.popitem(last=False)
+        if self.path is not None:
+            self._save()
+        return True
+
+    def __contains__(self, jid):
+        return jid in self.jids
+
+    def __len__(self):
+        return len(self.jids)
+
+    def __iter__(self):
+        return iter(self.jids)
+
+    def __eq__(self, other):
+        if isinstance(other, (JidQueue, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        ret = self.__eq__(other)
+        if ret is NotImplemented:
+            return ret
+        return not ret
+
+    def __repr__(self):
+        return repr(list(self.jids))
+
+
 def running(opts):
     '''
     Return the running jobs on this minion
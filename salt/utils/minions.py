@@ -10,6 +10,8 @@ import os
 import fnmatch
 import re
 import logging
+import threading
+import time
 
 # Import salt libs
 import salt.payload
@@ -17,6 +19,8 @@ import salt.roster
 import salt.utils.data
 import salt.utils.files
 import salt.utils.network
+import salt.utils.pki
+import salt.utils.presence
 import salt.utils.stringutils
 import salt.utils.versions
 from salt.defaults import DEFAULT_TARGET_DELIM
@@ -24,6 +28,7 @@ from salt.exceptions import CommandExecutionError, SaltCacheError
 import salt.auth.ldap
 import salt.cache
 from salt.ext import six
+from salt.utils.odict import OrderedDict
 
 # Import 3rd-party libs
 from salt._compat import ipaddress
@@ -188,10 +193,15 @@ class CkMinions(object):
     the list may be a subset-- but we err on the side of too-many minions in this
     class.
     '''
+    # The number of auth_check results kept when auth_check_cache_ttl is set
+    auth_check_cache_size = 1024
+
     def __init__(self, opts):
         self.opts = opts
         self.serial = salt.payload.Serial(opts)
         self.cache = salt.cache.factory(opts)
+        # Recent auth_check results: {repr(arguments): [expires, ret], ...}
+        self.auth_check_cache = OrderedDict()
         # TODO: this is actually an *auth* check
         if self.opts.get('transport', 'zeromq') in ('zeromq', 'tcp'):
             self.acc = 'minions'
@@ -248,9 +258,8 @@ class CkMinions(object):
                 with salt.utils.files.fopen(pki_cache_fn) as fn_:
                     return self.serial.load(fn_)
             else:
-                for fn_ in salt.utils.data.sorted_ignorecase(os.listdir(os.path.join(self.opts['pki_dir'], self.acc))):
-                    if not fn_.startswith('.') and os.path.isfile(os.path.join(self.opts['pki_dir'], self.acc, fn_)):
-                        minions.append(fn_)
+                minions = salt.utils.pki.list_keys(
+                    self.opts, os.path.join(self.opts['pki_dir'], self.acc))
             return minions
         except OSError as exc:
             log.error(
@@ -277,10 +286,8 @@ class CkMinions(object):
             return self.cache.list('minions')
 
         if greedy:
-            minions = []
-            for fn_ in salt.utils.data.sorted_ignorecase(os.listdir(os.path.join(self.opts['pki_dir'], self.acc))):
-                if not fn_.startswith('.') and os.path.isfile(os.path.join(self.opts['pki_dir'], self.acc, fn_)):
-                    minions.append(fn_)
+            minions = salt.utils.pki.list_keys(
+                self.opts, os.path.join(self.opts['pki_dir'], self.acc))
         elif cache_enabled:
             minions = list_cached_minions()
         else:
@@ -434,10 +441,8 @@ class CkMinions(object):
             )
             cache_enabled = self.opts.get('minion_data_cache', False)
             if greedy:
-                mlist = []
-                for fn_ in salt.utils.data.sorted_ignorecase(os.listdir(os.path.join(self.opts['pki_dir'], self.acc))):
-                    if not fn_.startswith('.') and os.path.isfile(os.path.join(self.opts['pki_dir'], self.acc, fn_)):
-                        mlist.append(fn_)
+                mlist = salt.utils.pki.list_keys(
+                    self.opts, os.path.join(self.opts['pki_dir'], self.acc))
                 return {'minions': mlist,
                         'missing': []}
             elif cache_enabled:
@@ -632,6 +637,19 @@ class CkMinions(object):
                 'minions.'
             )
         minions = set()
+        present = salt.utils.presence.read(self.opts)
+        if present is not None:
+            # The publisher knows which minions are connected
+            if subset:
+                ids = [id_ for id_ in subset if id_ in present]
+            else:
+                ids = present
+            for id_ in ids:
+                if show_ip:
+                    minions.add((id_, present[id_]))
+                else:
+                    minions.add(id_)
+            return minions
         if self.opts.get('minion_data_cache', False):
             search = self.cache.list('minions')
             if search is None:
@@ -647,15 +665,7 @@ class CkMinions(object):
                 addrs.update(set(salt.utils.network.ip_addrs6(include_loopback=False)))
             if subset:
                 search = subset
-            for id_ in search:
-                try:
-                    mdata = self.cache.fetch('minions/{0}'.format(id_), 'data')
-                except SaltCacheError:
-                    # If a SaltCacheError is explicitly raised during the fetch operation,
-                    # permission was denied to open the cached data.p file. Continue on as
-                    # in the releases <= 2016.3. (An explicit error raise was added in PR
-                    # #35388. See issue #36867 for more information.
-                    continue
+            for id_, mdata in self._fetch_minion_data(search):
                 if mdata is None:
                     continue
                 grains = mdata.get('grains', {})
@@ -675,14 +685,36 @@ class CkMinions(object):
                         break
         return minions
 
+    def _fetch_minion_data(self, ids):
+        '''
+        Yield the ids and the cached data of the minions, fetched in bulk
+        '''
+        ids = list(ids)
+        banks = ['minions/{0}'.format(id_) for id_ in ids]
+        try:
+            datas = self.cache.fetch_many(banks, 'data')
+        except SaltCacheError:
+            # Fetch them one by one to skip the unreadable ones only
+            datas = None
+        for id_, bank in zip(ids, banks):
+            if datas is not None:
+                yield id_, datas.get(bank)
+                continue
+            try:
+                yield id_, self.cache.fetch(bank, 'data')
+            except SaltCacheError:
+                # If a SaltCacheError is explicitly raised during the fetch operation,
+                # permission was denied to open the cached data.p file. Continue on as
+                # in the releases <= 2016.3. (An explicit error raise was added in PR
+                # #35388. See issue #36867 for more information.
+                continue
+
     def _all_minions(self, expr=None):
         '''
         Return a list of all minions that have auth'd
         '''
-        mlist = []
-        for fn_ in salt.utils.data.sorted_ignorecase(os.listdir(os.path.join(self.opts['pki_dir'], self.acc))):
-            if not fn_.startswith('.') and os.path.isfile(os.path.join(self.opts['pki_dir'], self.acc, fn_)):
-                mlist.append(fn_)
+        mlist = salt.utils.pki.list_keys(
+            self.opts, os.path.join(self.opts['pki_dir'], self.acc))
         return {'minions': mlist, 'missing': []}
 
     def check_minions(self,
@@ -772,9 +804,10 @@ class CkMinions(object):
         vals = []
         if isinstance(fun, six.string_types):
             fun = [fun]
+        compiled = _compile_regex(regex)
         for func in fun:
             try:
-                if re.match(regex, func):
+                if compiled.match(func):
                     vals.append(True)
                 else:
                     vals.append(False)
@@ -935,7 +968,41 @@ class CkMinions(object):
         Returns a bool which defines if the requested function is authorized.
         Used to evaluate the standard structure under external master
         authentication interfaces, like eauth, peer, peer_run, etc.
+
+        When :conf_master:`auth_check_cache_ttl` is set, the result is reused
+        for the same permissions, functions, arguments and target.
         '''
+        cache_ttl = self.opts.get('auth_check_cache_ttl', 0)
+        if cache_ttl <= 0:
+            return self._auth_check(auth_list, funs, args, tgt, tgt_type,
+                                    groups, publish_validate, minions, whitelist)
+        cache_key = repr((auth_list, funs, args, tgt, tgt_type, groups,
+                          publish_validate, minions, whitelist))
+        try:
+            expires, ret = self.auth_check_cache.pop(cache_key)
+        except KeyError:
+            pass
+        else:
+            if expires > time.time():
+                self.auth_check_cache[cache_key] = [expires, ret]
+                return ret
+        ret = self._auth_check(auth_list, funs, args, tgt, tgt_type,
+                               groups, publish_validate, minions, whitelist)
+        self.auth_check_cache[cache_key] = [time.time() + cache_ttl, ret]
+        while len(self.auth_check_cache) > self.auth_check_cache_size:
+            self.auth_check_cache.popitem(last=False)
+        return ret
+
+    def _auth_check(self,
+                    auth_list,
+                    funs,
+                    args,
+                    tgt,
+                    tgt_type='glob',
+                    groups=None,
+                    publish_validate=False,
+                    minions=None,
+                    whitelist=None):
         if self.opts.get('auth.enable_expanded_auth_matching', False):
             return self.auth_check_expanded(auth_list, funs, args, tgt, tgt_type, groups, publish_validate)
         if publish_validate:
@@ -960,6 +1027,9 @@ class CkMinions(object):
         if not isinstance(funs, list):
             funs = [funs]
             args = [args]
+        # Whether the target is within each of the ACL targets, they are
+        # only matched once for all the functions
+        valid_tgts = {}
         try:
             for num, fun in enumerate(funs):
                 if whitelist and fun in whitelist:
@@ -975,11 +1045,16 @@ class CkMinions(object):
                             continue
                         valid = next(six.iterkeys(ind))
                         # Check if minions are allowed
-                        if self.validate_tgt(
-                            valid,
-                            tgt,
-                            tgt_type,
-                            minions=minions):
+                        if valid not in valid_tgts:
+                            if minions is None:
+                                _res = self.check_minions(tgt, tgt_type)
+                                minions = set(_res['minions'])
+                            valid_tgts[valid] = self.validate_tgt(
+                                valid,
+                                tgt,
+                                tgt_type,
+                                minions=minions)
+                        if valid_tgts[valid]:
                             # Minions are allowed, verify function in allowed list
                             fun_args = args[num]
                             fun_kwargs = fun_args[-1] if fun_args else None
@@ -1143,6 +1218,34 @@ class CkMinions(object):
         return False
 
 
+# The regular expressions of the ACLs compiled by match_check
+_REGEXES = OrderedDict()
+_REGEXES_SIZE = 1024
+_REGEXES_LOCK = threading.Lock()
+
+
+def _compile_regex(regex):
+    '''
+    Return the compiled regular expression, reusing the most recently
+    compiled ones. The regex is returned as is if it cannot be compiled.
+    '''
+    with _REGEXES_LOCK:
+        try:
+            ret = _REGEXES.pop(regex)
+        except KeyError:
+            try:
+                ret = re.compile(regex)
+            except Exception:
+                ret = regex
+            if len(_REGEXES) >= _REGEXES_SIZE:
+                _REGEXES.popitem(last=False)
+        except TypeError:
+            # Not hashable, so not a regex either
+            return regex
+        _REGEXES[regex] = ret
+    return ret
+
+
 def mine_get(tgt, fun, tgt_type='glob', opts=None):
     '''
     Gathers the data from the specified minions' mine, pass in the target,
@@ -2074,6 +2074,15 @@ class SaltCMDOptionParser(six.with_metaclass(OptionParserMeta,
             help=('Wait the specified time in seconds after each job is done '
                   'before freeing the slot in the batch for the next one.')
         )
+        self.add_option(
+            '--batch-adaptive',
+            default=False,
+            dest='batch_adaptive',
+            action='store_true',
+            help=('Halve the number of minions running the job in batch mode '
+                  'when a minion fails, and grow it back by one for each '
+                  'minion which succeeds.')
+        )
         self.add_option(
             '--batch-safe-limit',
             default=0,
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+'''
+Index of the minion keys in the master's pki_dir
+
+Listing a key directory (``minions``, ``minions_pre``, ...) means reading the
+directory and checking every entry in it, which gets slow with many thousands
+of keys. When :conf_master:`pki_index` is enabled the list of keys is kept in
+memory and in a snapshot file next to the directory, and the directory is only
+read again when it changed since.
+
+.. versionadded:: Neon
+'''
+# Import Python libs
+from __future__ import absolute_import, print_function, unicode_literals
+import logging
+import os
+import time
+
+# Import Salt libs
+import salt.payload
+import salt.utils.atomicfile
+import salt.utils.data
+import salt.utils.files
+import salt.utils.stringutils
+
+log = logging.getLogger(__name__)
+
+# The keys of the directories listed by this process:
+# {path: [[inode, mtime], listed, keys], ...}
+_INDEX = {}
+
+
+def _stamp(path):
+    '''
+    Return what changes when a key is added to or removed from the directory
+    '''
+    stat = os.stat(path)
+    return [stat.st_ino, stat.st_mtime]
+
+
+def _snapshot_path(path):
+    return os.path.join(
+        os.path.dirname(path),
+        '.{0}.index'.format(os.path.basename(path)))
+
+
+def _valid(entry, stamp):
+    '''
+    Return True if the entry lists the keys of the directory. A directory
+    changed within a second before it was listed is listed again, as its
+    mtime may not change on the next change.
+    '''
+    return entry is not None and entry[0] == stamp and entry[1] - stamp[1] >= 1
+
+
+def _read_snapshot(opts, path):
+    try:
+        with salt.utils.files.fopen(_snapshot_path(path), 'rb') as fp_:
+            entry = salt.payload.Serial(opts).load(fp_)
+    except Exception:
+        return None
+    if not isinstance(entry, list) or len(entry) != 3:
+        return None
+    return entry
+
+
+def _write_snapshot(opts, path, entry):
+    try:
+        with salt.utils.atomicfile.atomic_open(_snapshot_path(path), 'wb') as fp_:
+            salt.payload.Serial(opts).dump(entry, fp_)
+    except (IOError, OSError) as exc:
+        log.debug('Unable to write the key index of %s: %s', path, exc)
+
+
+def _list(path):
+    keys = []
+    for fn_ in salt.utils.data.sorted_ignorecase(os.listdir(path)):
+        if not fn_.startswith('.') and os.path.isfile(os.path.join(path, fn_)):
+            keys.append(salt.utils.stringutils.to_unicode(fn_))
+    return keys
+
+
+def list_keys(opts, path):
+    '''
+    Return the sorted names of the keys in a key directory, e.g.
+    ``/etc/salt/pki/master/minions``
+
+    :raises OSError: if the directory cannot be read
+    '''
+    if not opts.get('pki_index', False):
+        return _list(path)
+    stamp = _stamp(path)
+    entry = _INDEX.get(path)
+    if not _valid(entry, stamp):
+        entry = _read_snapshot(opts, path)
+        if not _valid(entry, stamp):
+            entry = [stamp, time.time(), _list(path)]
+            _write_snapshot(opts, path, entry)
+        _INDEX[path] = entry
+    return list(entry[2])
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+'''
+Table of the minions connected to the master's publisher
+
+The TCP publisher knows which minion is behind each of its connections. When
+:conf_master:`presence_table` is enabled it keeps a table of the connected
+minion ids and their addresses in the ``sock_dir``, so that the other master
+processes can list the connected minions without matching the addresses
+connected to the publish port against the grains of every minion in the
+minion data cache.
+
+.. versionadded:: Neon
+'''
+# Import Python libs
+from __future__ import absolute_import, print_function, unicode_literals
+import logging
+import os
+
+# Import Salt libs
+import salt.payload
+import salt.utils.atomicfile
+import salt.utils.files
+from salt.transport import iter_transport_opts
+
+log = logging.getLogger(__name__)
+
+# The last table read by this process: [[inode, mtime, size], table]
+_TABLE = [None, None]
+
+
+def _path(opts):
+    return os.path.join(opts['sock_dir'], 'presence.p')
+
+
+def enabled(opts):
+    '''
+    Return True if the publisher keeps the presence table, which is only
+    possible when all the configured transports are TCP
+    '''
+    if not opts.get('presence_table', False):
+        return False
+    for transport, _ in iter_transport_opts(opts):
+        if transport != 'tcp':
+            return False
+    return True
+
+
+def write(opts, present):
+    '''
+    Replace the presence table, ``present`` maps the connected minion ids to
+    their addresses
+    '''
+    try:
+        with salt.utils.files.set_umask(0o177):
+            with salt.utils.atomicfile.atomic_open(_path(opts), 'wb') as fp_:
+                salt.payload.Serial(opts).dump(present, fp_)
+    except (IOError, OSError) as exc:
+        log.error('Unable to write the presence table: %s', exc)
+
+
+def remove(opts):
+    '''
+    Remove the presence table, when the publisher stops
+    '''
+    try:
+        os.remove(_path(opts))
+    except OSError:
+        pass
+
+
+def read(opts):
+    '''
+    Return a dict mapping the ids of the connected minions to their
+    addresses, or None when the presence table is not available
+    '''
+    if not enabled(opts):
+        return None
+    path = _path(opts)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    stamp = [stat.st_ino, stat.st_mtime, stat.st_size]
+    if _TABLE[0] != stamp:
+        try:
+            with salt.utils.files.fopen(path, 'rb') as fp_:
+                table = salt.payload.Serial(opts).load(fp_)
+        except Exception as exc:
+            log.debug('Unable to read the presence table: %s', exc)
+            return None
+        if not isinstance(table, dict):
+            return None
+        _TABLE[:] = [stamp, table]
+    return _TABLE[1]
@@ -6,18 +6,26 @@ Decorator and functions to profile Salt using cProfile
 from __future__ import absolute_import, print_function, unicode_literals
 
 # Import Python libs
+import contextlib
 import datetime
 import logging
 import os
 import pstats
 import subprocess
+import threading
+import time
 
 # Import Salt libs
 import salt.utils.files
 import salt.utils.hashutils
+import salt.utils.json
 import salt.utils.path
+import salt.utils.stringio
 import salt.utils.stringutils
 
+# Import 3rd-party libs
+from salt.ext import six
+
 log = logging.getLogger(__name__)
 
 try:
@@ -101,3 +109,248 @@ def output_profile(pr, stats_path='/tmp/stats', stop=False, id_=None):
             if not stop:
                 pr.enable()
     return pr
+
+
+_RENDER_PROFILES = threading.local()
+
+
+def active_render_profile():
+    '''
+    Return the innermost :class:`RenderProfile` which is currently collecting
+    data in this thread, or ``None`` if render profiling is not active.
+    '''
+    stack = getattr(_RENDER_PROFILES, 'stack', None)
+    if stack:
+        return stack[-1]
+    return None
+
+
+def _text_size(data):
+    '''
+    Return the size in bytes of rendered text, or ``None`` if the renderer
+    produced a data structure instead of text.
+    '''
+    if salt.utils.stringio.is_readable(data):
+        data = data.getvalue()
+    if isinstance(data, six.string_types):
+        return len(salt.utils.stringutils.to_bytes(data))
+    return None
+
+
+def _add_timing(stats, key, elapsed, **counters):
+    entry = stats.setdefault(key, {'count': 0, 'time': 0.0})
+    entry['count'] += 1
+    entry['time'] += elapsed
+    for name, value in six.iteritems(counters):
+        if value is not None:
+            entry[name] = entry.get(name, 0) + value
+
+
+class _ProfiledModule(object):
+    '''
+    Attribute access to the functions of one module (``salt.cmd.run``), with
+    every call recorded by the owning profile
+    '''
+    def __init__(self, profile, mod_name, funcs):
+        self._profile = profile
+        self._mod_name = mod_name
+        self._funcs = funcs
+
+    def __getitem__(self, fun):
+        return self._profile.wrap_call(
+            '{0}.{1}'.format(self._mod_name, fun),
+            self._funcs[fun])
+
+    def __getattr__(self, fun):
+        try:
+            return self[fun]
+        except KeyError:
+            raise AttributeError(fun)
+
+
+class _ProfiledFunctions(object):
+    '''
+    Stand-in for ``__salt__`` inside renderers which records every execution
+    function called while a template is rendered
+    '''
+    def __init__(self, profile, functions):
+        self._profile = profile
+        self._functions = functions
+
+    def __getitem__(self, key):
+        return self._profile.wrap_call(key, self._functions[key])
+
+    def __contains__(self, key):
+        return key in self._functions
+
+    def __iter__(self):
+        return iter(self._functions)
+
+    def __len__(self):
+        return len(self._functions)
+
+    def get(self, key, default=None):
+        if key in self._functions:
+            return self[key]
+        return default
+
+    def __getattr__(self, mod_name):
+        if mod_name.startswith('__'):
+            raise AttributeError(mod_name)
+        return _ProfiledModule(self._profile,
+                               mod_name,
+                               getattr(self._functions, mod_name))
+
+
+class RenderProfile(object):
+    '''
+    Collect wall time, input/output size and ``salt[...]`` calls for every
+    template rendered through :func:`salt.template.compile_template` while
+    the profile is active.
+
+    Use as a context manager; :meth:`report` returns a JSON-serializable
+    structure with stable key names so reports can be diffed across runs.
+    '''
+    def __init__(self, name=None):
+        self.name = name
+        self.templates = []
+        self._current = []
+        self._start = None
+        self._total = 0.0
+
+    def __enter__(self):
+        if not hasattr(_RENDER_PROFILES, 'stack'):
+            _RENDER_PROFILES.stack = []
+        _RENDER_PROFILES.stack.append(self)
+        self._start = time.time()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._total += time.time() - self._start
+        _RENDER_PROFILES.stack.remove(self)
+
+    def start_template(self, template, saltenv, sls, input_data):
+        '''
+        Begin recording a template render, returns the record to pass to the
+        other ``*_template`` methods
+        '''
+        record = {'template': template,
+                  'saltenv': saltenv,
+                  'sls': sls,
+                  'bytes_in': _text_size(input_data),
+                  'bytes_out': None,
+                  'time': 0.0,
+                  'renderers': [],
+                  'salt_calls': {},
+                  '_start': time.time()}
+        self.templates.append(record)
+        self._current.append(record)
+        return record
+
+    def add_renderer(self, record, renderer, elapsed, input_data, output):
+        '''
+        Record a single step of the render pipe
+        '''
+        record['renderers'].append({'renderer': renderer,
+                                    'time': elapsed,
+                                    'bytes_in': _text_size(input_data),
+                                    'bytes_out': _text_size(output)})
+
+    def end_template(self, record, output):
+        '''
+        Finish recording a template render
+        '''
+        record['time'] = time.time() - record.pop('_start')
+        record['bytes_out'] = _text_size(output)
+        if record in self._current:
+            self._current.remove(record)
+
+    def wrap_functions(self, functions):
+        '''
+        Return a ``__salt__`` replacement which records calls into
+        ``functions``
+        '''
+        return _ProfiledFunctions(self, functions)
+
+    def wrap_call(self, key, func):
+        '''
+        Wrap an execution function so that its calls are attributed to the
+        template currently being rendered
+        '''
+        if not callable(func):
+            return func
+
+        def _profiled(*args, **kwargs):
+            start = time.time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if self._current:
+                    _add_timing(self._current[-1]['salt_calls'],
+                                key,
+                                time.time() - start)
+        return _profiled
+
+    def report(self):
+        '''
+        Return the collected data, with per-template records followed by
+        totals per renderer and per execution function
+        '''
+        renderers = {}
+        salt_calls = {}
+        templates = []
+        for record in self.templates:
+            record = dict(record)
+            record.pop('_start', None)
+            templates.append(record)
+            for step in record['renderers']:
+                _add_timing(renderers,
+                            step['renderer'],
+                            step['time'],
+                            bytes_in=step['bytes_in'],
+                            bytes_out=step['bytes_out'])
+            for key, stats in six.iteritems(record['salt_calls']):
+                entry = salt_calls.setdefault(key, {'count': 0, 'time': 0.0})
+                entry['count'] += stats['count']
+                entry['time'] += stats['time']
+        return {'name': self.name,
+                'time': self._total,
+                'templates': templates,
+                'renderers': renderers,
+                'salt_calls': salt_calls}
+
+    def write(self, path):
+        '''
+        Write the report to ``path`` as JSON
+        '''
+        dirname = os.path.dirname(path)
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        with salt.utils.files.fopen(path, 'w') as fp_:
+            salt.utils.json.dump(self.report(), fp_, indent=2, sort_keys=True)
+        log.info('Render profile for %s written to %s', self.name, path)
+
+
+@contextlib.contextmanager
+def render_profile(opts, name):
+    '''
+    Profile all template renders inside the ``with`` block when the
+    ``render_profile`` option is enabled, and write the report to
+    ``<cachedir>/render_profile/<name>.json`` when the block exits.
+
+    Yields the :class:`RenderProfile`, or ``None`` when profiling is disabled.
+    '''
+    if not opts.get('render_profile', False):
+        yield None
+        return
+    profile = RenderProfile(name)
+    try:
+        with profile:
+            yield profile
+    finally:
+        try:
+            profile.write(os.path.join(opts['cachedir'],
+                                       'render_profile',
+                                       '{0}.json'.format(name)))
+        except (IOError, OSError) as exc:
+            log.error('Unable to write render profile for %s: %s', name, exc)
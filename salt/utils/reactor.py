@@ -201,6 +201,20 @@ class Reactor(salt.utils.process.SignalHandlingMultiprocessingProcess, salt.stat
 
         return {'status': False, 'comment': 'Reactor does not exists.'}
 
+    def _set_tag_filter(self):
+        '''
+        Only let the event publisher send the events a reactor is configured
+        for, and the events managing the reactors
+        '''
+        if isinstance(self.opts['reactor'], six.string_types):
+            # The reactor map is read again for every event
+            return
+        tags = ['*salt/reactors/manage/*']
+        for ropt in self.opts['reactor']:
+            if isinstance(ropt, dict) and len(ropt) == 1:
+                tags.append(next(six.iterkeys(ropt)))
+        self.event.set_tag_filter(tags, 'fnmatch')
+
     def resolve_aliases(self, chunks):
         '''
         Preserve backward compatibility by rewriting the 'state' key in the low
@@ -258,6 +272,7 @@ class Reactor(salt.utils.process.SignalHandlingMultiprocessingProcess, salt.stat
                 opts=self.opts,
                 listen=True)
         self.wrap = ReactWrap(self.opts)
+        self._set_tag_filter()
 
         for data in self.event.iter_events(full=True):
             # skip all events fired by ourselves
@@ -267,12 +282,14 @@ class Reactor(salt.utils.process.SignalHandlingMultiprocessingProcess, salt.stat
             if data['tag'].endswith('salt/reactors/manage/add'):
                 _data = data['data']
                 res = self.add_reactor(_data['event'], _data['reactors'])
+                self._set_tag_filter()
                 self.event.fire_event({'reactors': self.list_all(),
                                        'result': res},
                                       'salt/reactors/manage/add-complete')
             elif data['tag'].endswith('salt/reactors/manage/delete'):
                 _data = data['data']
                 res = self.delete_reactor(_data['event'])
+                self._set_tag_filter()
                 self.event.fire_event({'reactors': self.list_all(),
                                        'result': res},
                                       'salt/reactors/manage/delete-complete')
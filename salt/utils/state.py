@@ -242,4 +242,10 @@ def get_sls_opts(opts, **kwargs):
         else:
             opts['pillarenv'] = pillarenv
 
+    if kwargs.get('render_profile'):
+        opts['render_profile'] = True
+
+    if kwargs.get('incremental'):
+        opts['state_incremental'] = True
+
     return opts
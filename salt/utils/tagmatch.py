@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+'''
+Match event tags against glob patterns
+
+Code which checks every event against a list of ``fnmatch`` patterns should
+create a :py:class:`TagMatcher` once, instead of calling ``fnmatch.fnmatch``
+for every pattern and every event.
+
+.. versionadded:: Neon
+'''
+# Import Python libs
+from __future__ import absolute_import, print_function, unicode_literals
+import fnmatch
+import re
+import threading
+
+# Import Salt libs
+from salt.ext import six
+from salt.utils.odict import OrderedDict
+
+
+def _is_literal(pattern):
+    '''
+    Return True if the pattern holds no glob special characters
+    '''
+    return not any(char in pattern for char in '*?[')
+
+
+class TagMatcher(object):
+    '''
+    Match tags against a set of glob patterns, compiled into a single regular
+    expression. The results for the most recently matched tags are cached,
+    unless all patterns are plain strings, which are looked up in a set.
+    Matchers can be shared between threads.
+
+    Patterns are matched case sensitively, like ``fnmatch.fnmatch`` does on
+    POSIX platforms.
+    '''
+    def __init__(self, patterns, cache_size=1024):
+        if isinstance(patterns, six.string_types):
+            patterns = [patterns]
+        self.patterns = list(patterns)
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.literals = None
+        self.regex = None
+        if all(_is_literal(pattern) for pattern in self.patterns):
+            self.literals = frozenset(self.patterns)
+        else:
+            self.regex = re.compile('|'.join(
+                '(?:{0})'.format(fnmatch.translate(pattern))
+                for pattern in self.patterns))
+
+    def __bool__(self):
+        return bool(self.patterns)
+
+    __nonzero__ = __bool__
+
+    def match(self, tag):
+        '''
+        Return True if the tag matches any of the patterns
+        '''
+        if self.literals is not None:
+            return tag in self.literals
+        with self._lock:
+            try:
+                ret = self.cache.pop(tag)
+            except KeyError:
+                ret = self.regex.match(tag) is not None
+                if len(self.cache) >= self.cache_size:
+                    self.cache.popitem(last=False)
+            self.cache[tag] = ret
+        return ret
+
+    __call__ = match
+
+
+# TagMatchers for single glob patterns, see match()
+_MATCHERS = OrderedDict()
+_MATCHERS_SIZE = 256
+_MATCHERS_LOCK = threading.Lock()
+
+
+def match(tag, pattern):
+    '''
+    Return True if the tag matches the glob pattern, reusing the compiled
+    pattern and the cached results of earlier calls
+    '''
+    if _is_literal(pattern):
+        return tag == pattern
+    with _MATCHERS_LOCK:
+        try:
+            matcher = _MATCHERS.pop(pattern)
+        except KeyError:
+            matcher = TagMatcher([pattern])
+            if len(_MATCHERS) >= _MATCHERS_SIZE:
+                _MATCHERS.popitem(last=False)
+        _MATCHERS[pattern] = matcher
+    return matcher.match(tag)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+'''
+Simple script to time the encryption and decryption of messages with
+salt.crypt.Crypticle, with AES-CBC and HMAC-SHA256 and, if available, with
+AES-GCM
+
+Usage: python tests/cryptbench.py [messages] [size]
+'''
+# Import python libs
+from __future__ import absolute_import, print_function
+import os
+import sys
+import timeit
+
+# Import salt libs
+import salt.crypt
+
+
+def bench(count=10000, size=256):
+    '''
+    Print the time taken to encrypt and decrypt ``count`` messages of
+    ``size`` bytes
+    '''
+    crypticle = salt.crypt.Crypticle({}, salt.crypt.Crypticle.generate_key_string())
+    datas = [os.urandom(size) for _ in range(count)]
+    modes = [('cbc', False)]
+    if salt.crypt.HAS_GCM:
+        modes.append(('gcm', True))
+    print('{0} messages of {1} bytes'.format(count, size))
+    for mode, aead in modes:
+        encrypted = [crypticle.encrypt(data, aead=aead) for data in datas]
+        tests = (
+            ('encrypt', lambda: [crypticle.encrypt(data, aead=aead) for data in datas]),
+            ('decrypt', lambda: [crypticle.decrypt(data, aead=aead) for data in encrypted]),
+        )
+        for name, func in tests:
+            best = min(timeit.repeat(func, number=1, repeat=3))
+            print('{0:>11}: {1:.3f}s, {2:.0f} messages/s'.format(
+                '{0} {1}'.format(mode, name), best, count / best))
+
+if __name__ == '__main__':
+    bench(*[int(arg) for arg in sys.argv[1:3]])
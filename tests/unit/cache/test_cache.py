@@ -12,6 +12,7 @@ from tests.support.unit import skipIf, TestCase
 from tests.support.mock import (
     NO_MOCK,
     NO_MOCK_REASON,
+    MagicMock,
     patch,
 )
 
@@ -91,6 +92,50 @@ class MemCacheTest(TestCase):
         cache_fetch_mock.assert_called_once_with('bank', 'key')
         cache_fetch_mock.reset_mock()
 
+    def test_fetch_many_fallback(self):
+        # Drivers without fetch_many are asked for each bank in turn
+        fetch_mock = MagicMock(side_effect=lambda bank, key: bank + '_data')
+        with patch('salt.loader.cache',
+                   return_value={'fake_driver.fetch': fetch_mock}):
+            cache = salt.cache.Cache(self.opts)
+            ret = cache.fetch_many(['bank1', 'bank2'], 'key')
+        self.assertDictEqual(ret, {'bank1': 'bank1_data',
+                                   'bank2': 'bank2_data'})
+        self.assertEqual(fetch_mock.call_count, 2)
+
+    def test_fetch_many_driver(self):
+        fetch_many_mock = MagicMock(return_value={'bank1': 'fake_data'})
+        with patch('salt.loader.cache',
+                   return_value={'fake_driver.fetch_many': fetch_many_mock}):
+            cache = salt.cache.Cache(self.opts)
+            ret = cache.fetch_many(['bank1'], 'key')
+        self.assertDictEqual(ret, {'bank1': 'fake_data'})
+        fetch_many_mock.assert_called_once_with(['bank1'], 'key')
+
+    @patch('salt.cache.Cache.fetch_many',
+           return_value={'bank2': 'fake_data2'})
+    @patch('salt.cache.Cache.fetch', return_value='fake_data')
+    @patch('salt.loader.cache', return_value={})
+    def test_fetch_many(self, loader_mock, cache_fetch_mock,
+                        cache_fetch_many_mock):
+        # Fill the cache for bank1
+        with patch('time.time', return_value=0):
+            self.cache.fetch('bank1', 'key')
+        cache_fetch_mock.reset_mock()
+
+        # Only the missing bank is fetched from the driver
+        with patch('time.time', return_value=1):
+            ret = self.cache.fetch_many(['bank1', 'bank2'], 'key')
+        self.assertDictEqual(ret, {'bank1': 'fake_data',
+                                   'bank2': 'fake_data2'})
+        cache_fetch_mock.assert_not_called()
+        cache_fetch_many_mock.assert_called_once_with(['bank2'], 'key')
+        self.assertDictEqual(salt.cache.MemCache.data, {
+            'fake_driver': {
+                ('bank1', 'key'): [1, 'fake_data'],
+                ('bank2', 'key'): [1, 'fake_data2'],
+                }})
+
     @patch('salt.cache.Cache.store')
     @patch('salt.loader.cache', return_value={})
     def test_store(self, loader_mock, cache_store_mock):
@@ -65,3 +65,38 @@ class BatchTestCase(TestCase):
         '''
         ret = Batch.get_bnum(self.batch)
         self.assertEqual(ret, None)
+
+    # run tests
+
+    def _run(self, **opts):
+        '''
+        Run a batch of 4 minions, 2 at a time, where a, c and d fail
+        '''
+        self.batch.opts = {'batch': '2', 'fun': 'test.ping', 'arg': [],
+                           'timeout': 5, 'gather_job_timeout': 5}
+        self.batch.opts.update(opts)
+        self.batch.minions = ['a', 'b', 'c', 'd']
+        self.batch.ping_gen = iter([])
+        started = []
+
+        def cmd_iter_no_block(minions, *args, **kwargs):
+            started.append(list(minions))
+            for minion in list(minions):
+                retcode = 0 if minion == 'b' else 1
+                yield {minion: {'ret': retcode == 0, 'retcode': retcode}}
+
+        self.batch.local.cmd_iter_no_block.side_effect = cmd_iter_no_block
+        rets = {}
+        for ret in self.batch.run():
+            rets.update(ret)
+        self.assertEqual(rets, {'a': False, 'b': True, 'c': False, 'd': False})
+        return started
+
+    def test_run(self):
+        self.assertEqual(self._run(), [['d', 'c'], ['b', 'a']])
+
+    def test_run_adaptive(self):
+        '''
+        Tests that failing minions lower the number of minions run at once
+        '''
+        self.assertEqual(self._run(batch_adaptive=True), [['d', 'c'], ['b'], ['a']])
@@ -6,6 +6,7 @@ from functools import wraps
 import os
 import io
 import stat
+import time
 
 # Import Salt libs
 import salt.config
@@ -563,6 +564,9 @@ class FakeCache(object):
     def fetch(self, bank, key):
         return self.data[bank, key]
 
+    def fetch_many(self, banks, key):
+        return dict((bank, self.data.get((bank, key), {})) for bank in banks)
+
 
 class RemoteFuncsTestCase(TestCase):
     '''
@@ -658,3 +662,39 @@ class RemoteFuncsTestCase(TestCase):
                 }
             )
         self.assertDictEqual(ret, dict(ip_addr=dict(webserver='2001:db8::1:3'), ip4_addr=dict(webserver='127.0.0.1')))
+
+    def test_mine_get_cache_ttl(self):
+        '''
+        Asserts that ``mine_get`` results are reused while
+        ``mine_get_cache_ttl`` has not expired, and dropped when a minion
+        updates its mine.
+        '''
+        self.funcs.opts['mine_get_cache_ttl'] = 60
+        self.funcs.cache.store('minions/webserver', 'mine',
+                               dict(ip_addr='2001:db8::1:3'))
+        load = {
+            'id': 'requester_minion',
+            'tgt': 'G@roles:web',
+            'fun': 'ip_addr',
+            'tgt_type': 'compound',
+        }
+        check_mock = MagicMock(return_value=dict(minions=['webserver'],
+                                                 missing=[]))
+        with patch('salt.utils.minions.CkMinions._check_compound_minions',
+                   check_mock):
+            ret = self.funcs._mine_get(dict(load))
+            self.assertDictEqual(ret, dict(webserver='2001:db8::1:3'))
+            ret = self.funcs._mine_get(dict(load))
+            self.assertDictEqual(ret, dict(webserver='2001:db8::1:3'))
+            self.assertEqual(check_mock.call_count, 1)
+
+            self.funcs.opts['minion_data_cache'] = True
+            self.funcs._mine({'id': 'webserver',
+                              'data': dict(ip_addr='2001:db8::1:4')})
+            ret = self.funcs._mine_get(dict(load))
+            self.assertDictEqual(ret, dict(webserver='2001:db8::1:4'))
+            self.assertEqual(check_mock.call_count, 2)
+
+            with patch('time.time', MagicMock(return_value=time.time() + 61)):
+                self.funcs._mine_get(dict(load))
+            self.assertEqual(check_mock.call_count, 3)
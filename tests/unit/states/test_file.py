@@ -17,6 +17,7 @@ NO_DATEUTIL_REASON = 'python-dateutil is not installed'
 
 # Import Salt Testing libs
 from tests.support.mixins import LoaderModuleMockMixin
+from tests.support.paths import TMP
 from tests.support.unit import skipIf, TestCase
 from tests.support.mock import (
     NO_MOCK,
@@ -1857,6 +1858,30 @@ class TestFileState(TestCase, LoaderModuleMockMixin):
         run_checks(strptime_format=fake_strptime_format)
         run_checks(strptime_format=fake_strptime_format, test=True)
 
+    def test_mod_fingerprint(self):
+        '''
+        Test that file.managed is only fingerprinted when all its sources can
+        be verified
+        '''
+        name = os.path.join(TMP, 'fingerprinted')
+        with salt.utils.files.fopen(name, 'w') as fp_:
+            fp_.write('data')
+        self.addCleanup(os.remove, name)
+        low = {'fun': 'managed', 'name': name,
+               'source': 'http://example.com/fingerprinted'}
+        sha256 = 'a' * 64
+        for source_hash in ('sha256=' + sha256, sha256, 'md5=' + 'b' * 32):
+            facts = filestate.mod_fingerprint(dict(low, source_hash=source_hash))
+            self.assertEqual(facts['sources'], [])
+
+        # Hash files and mismatched hashes can change without the arguments
+        for source_hash in (None,
+                            'http://example.com/SHA256SUMS',
+                            'sha256=' + 'b' * 32,
+                            'sha256=' + 'z' * 64):
+            self.assertIsNone(
+                filestate.mod_fingerprint(dict(low, source_hash=source_hash)))
+
 
 class TestFindKeepFiles(TestCase):
 
@@ -235,3 +235,24 @@ class PkgTestCase(TestCase, LoaderModuleMockMixin):
         for installed_versions, operator, version, expected_result in test_parameters:
             msg = "installed_versions: {}, operator: {}, version: {}, expected_result: {}".format(installed_versions, operator, version, expected_result)
             self.assertEqual(expected_result, pkg._fulfills_version_spec(installed_versions, operator, version), msg)
+
+    def test_mod_fingerprint(self):
+        '''
+        Test that pkg.installed is fingerprinted by the installed versions
+        '''
+        version = MagicMock(return_value={'pkga': '1.0.1', 'pkgb': '1.0.2'})
+        with patch.dict(pkg.__salt__, {'pkg.version': version}):
+            facts = pkg.mod_fingerprint({'fun': 'installed',
+                                         'name': 'pkgs',
+                                         'pkgs': ['pkga', {'pkgb': '1.0.2'}]})
+            version.assert_called_once_with('pkga', 'pkgb')
+            self.assertEqual(facts,
+                             {'versions': {'pkga': '1.0.1', 'pkgb': '1.0.2'}})
+
+        # A missing package can not be verified
+        version = MagicMock(return_value='')
+        with patch.dict(pkg.__salt__, {'pkg.version': version}):
+            self.assertIsNone(pkg.mod_fingerprint({'fun': 'installed',
+                                                   'name': 'pkga'}))
+        self.assertIsNone(pkg.mod_fingerprint({'fun': 'removed',
+                                               'name': 'pkga'}))
@@ -9,7 +9,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 # Import Salt Testing libs
 import tests.integration as integration
 from tests.support.unit import TestCase, skipIf
-from tests.support.mock import patch, NO_MOCK, NO_MOCK_REASON
+from tests.support.mock import MagicMock, patch, NO_MOCK, NO_MOCK_REASON
 
 # Import Salt libs
 from salt import client
@@ -81,6 +81,40 @@ class LocalClientTestCase(TestCase,
                                                     ret='')
 
     @skipIf(salt.utils.platform.is_windows(), 'Not supported on Windows')
+    def test_get_iter_returns_find_job(self):
+        '''
+        Only the minions which did not return and did not report that they
+        are still running the job in time are asked about it again
+        '''
+        events = {
+            'salt/job/1234': [{'tag': 'salt/job/1234/ret/m1',
+                               'data': {'id': 'm1', 'return': True, 'retcode': 0}}],
+            'salt/job/5678': [{'tag': 'salt/job/5678/ret/m2',
+                               'data': {'id': 'm2', 'retcode': 0,
+                                        'return': {'jid': '1234', 'fun': 'test.sleep'}}}],
+        }
+
+        def get_event(**kwargs):
+            tag_events = events.get(kwargs['tag'])
+            return tag_events.pop(0) if tag_events else None
+
+        event_mock = MagicMock()
+        event_mock.get_event.side_effect = get_event
+        jinfo = [{'jid': '5678'}]
+        with patch.object(self.client, 'event', event_mock), \
+                patch.object(self.client, 'returners',
+                             {'{0}.get_load'.format(self.client.opts['master_job_cache']):
+                              MagicMock(return_value={'jid': '1234'})}), \
+                patch.object(self.client, 'gather_job_info',
+                             MagicMock(side_effect=lambda *args, **kwargs: jinfo.pop() if jinfo else {})) as gather_mock, \
+                patch.dict(self.client.opts, {'order_masters': False}):
+            rets = list(self.client.get_iter_returns('1234', ['m1', 'm2', 'm3'],
+                                                     timeout=0.2,
+                                                     gather_job_timeout=0.1))
+        self.assertEqual(rets, [{'m1': {'ret': True, 'retcode': 0}}])
+        pinged = [sorted(call[0][1]) for call in gather_mock.call_args_list]
+        self.assertEqual(pinged[:2], [['m2', 'm3'], ['m3']])
+
     def test_pub(self):
         '''
         Tests that the client cleanly returns when the publisher is not running
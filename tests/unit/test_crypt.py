@@ -2,6 +2,7 @@
 
 # python libs
 from __future__ import absolute_import
+import copy
 import os
 import tempfile
 import shutil
@@ -313,3 +314,92 @@ class TestM2CryptoRegression47124(TestCase):
         with patch('salt.crypt.get_rsa_key', return_value=key):
             signature = salt.crypt.sign_message('/keydir/keyname.pem', message, passphrase='password')
         self.assertEqual(signature, self.SIGNATURE)
+
+
+@skipIf(NO_MOCK, NO_MOCK_REASON)
+class SignInPayloadTestCase(TestCase):
+    '''
+    Test the payload minions sign in to the master with
+    '''
+    def setUp(self):
+        self.pki_dir = tempfile.mkdtemp()
+        for name in ('minion.pub', 'minion_master.pub'):
+            with salt.utils.files.fopen(os.path.join(self.pki_dir, name), 'w') as fd:
+                fd.write(PUBKEY_DATA)
+        self.auth = object.__new__(crypt.AsyncAuth)
+        self.auth.opts = {'id': 'minion', 'pki_dir': self.pki_dir}
+        self.auth.token = b'token'
+        self.auth.enc_token = None
+        self.auth.mpub = 'minion_master.pub'
+        self.auth.pub_path = os.path.join(self.pki_dir, 'minion.pub')
+
+    def tearDown(self):
+        shutil.rmtree(self.pki_dir)
+
+    def test_token_reused(self):
+        '''
+        The token is only encrypted again when the master's key changes
+        '''
+        pub = MagicMock()
+        pub.public_encrypt.side_effect = [b'enc1', b'enc2']
+        with patch('salt.crypt.HAS_M2', True), \
+                patch('salt.crypt.RSA', create=True), \
+                patch('salt.crypt.get_rsa_pub_key', return_value=pub):
+            self.assertEqual(self.auth.minion_sign_in_payload()['token'], b'enc1')
+            self.assertEqual(self.auth.minion_sign_in_payload()['token'], b'enc1')
+            self.assertEqual(pub.public_encrypt.call_count, 1)
+
+            master_pub = os.path.join(self.pki_dir, 'minion_master.pub')
+            with salt.utils.files.fopen(master_pub, 'a') as fd:
+                fd.write('\n')
+            self.assertEqual(self.auth.minion_sign_in_payload()['token'], b'enc2')
+
+    def test_aead(self):
+        '''
+        AES-GCM is only asked for if it is available
+        '''
+        with patch('salt.crypt.get_rsa_pub_key', side_effect=IOError):
+            with patch('salt.crypt.HAS_GCM', True):
+                self.assertTrue(self.auth.minion_sign_in_payload()['aead'])
+            with patch('salt.crypt.HAS_GCM', False):
+                self.assertNotIn('aead', self.auth.minion_sign_in_payload())
+
+
+@skipIf(not HAS_M2 and not HAS_PYCRYPTO_RSA, 'No crypto library installed')
+class CrypticleTestCase(TestCase):
+    def setUp(self):
+        self.crypticle = crypt.Crypticle({}, crypt.Crypticle.generate_key_string())
+
+    def test_encrypt_decrypt(self):
+        for size in (0, 1, 15, 16, 17, 1000):
+            data = os.urandom(size)
+            self.assertEqual(self.crypticle.decrypt(self.crypticle.encrypt(data)), data)
+
+    def test_decrypt_bad_signature(self):
+        data = self.crypticle.encrypt(b'salt')
+        data = data[:-1] + (b'\x00' if data[-1:] != b'\x00' else b'\x01')
+        self.assertRaises(crypt.AuthenticationError, self.crypticle.decrypt, data)
+
+    def test_deepcopy(self):
+        crypticle = copy.deepcopy(self.crypticle)
+        self.assertEqual(crypticle.loads(self.crypticle.dumps({'a': 1})), {'a': 1})
+
+    @skipIf(not crypt.HAS_GCM, 'AES-GCM is not available')
+    def test_encrypt_decrypt_aead(self):
+        for size in (0, 1, 16, 1000):
+            data = os.urandom(size)
+            encr = self.crypticle.encrypt(data, aead=True)
+            self.assertEqual(len(encr), size + 28)
+            self.assertEqual(self.crypticle.decrypt(encr, aead=True), data)
+        self.assertEqual(
+            self.crypticle.loads(self.crypticle.dumps({'a': 1}, aead=True), aead=True),
+            {'a': 1})
+
+    @skipIf(not crypt.HAS_GCM, 'AES-GCM is not available')
+    def test_decrypt_aead_bad_tag(self):
+        data = self.crypticle.encrypt(b'salt', aead=True)
+        for bad in (data[:-1] + (b'\x00' if data[-1:] != b'\x00' else b'\x01'),
+                    data[:10],
+                    self.crypticle.encrypt(b'salt')):
+            self.assertRaises(crypt.AuthenticationError,
+                              self.crypticle.decrypt, bad, aead=True)
@@ -2,12 +2,18 @@
 
 # Import Python libs
 from __future__ import absolute_import
+import os
+import shutil
+import tempfile
 
 # Import Salt libs
 import salt.config
 import salt.master
+import salt.utils.files
+from salt.utils.odict import OrderedDict
 
 # Import Salt Testing Libs
+from tests.support.paths import TMP
 from tests.support.unit import TestCase
 from tests.support.mock import (
     patch,
@@ -331,3 +337,54 @@ class ClearFuncsTestCase(TestCase):
                 patch('salt.utils.master.get_values_of_matching_keys', MagicMock(return_value=['test'])), \
                 patch('salt.utils.minions.CkMinions.auth_check', MagicMock(return_value=False)):
             self.assertEqual(mock_ret, self.clear_funcs.publish(load))
+
+
+class AESFuncsTestCase(TestCase):
+    '''
+    TestCase for salt.master.AESFuncs class
+    '''
+
+    def setUp(self):
+        self.pki_dir = tempfile.mkdtemp(dir=TMP)
+        os.makedirs(os.path.join(self.pki_dir, 'minions'))
+        self.pub_path = os.path.join(self.pki_dir, 'minions', 'minion1')
+        with salt.utils.files.fopen(self.pub_path, 'w') as fp_:
+            fp_.write('key')
+        opts = salt.config.master_config(None)
+        opts['pki_dir'] = self.pki_dir
+        # Creating an AESFuncs starts a lot of things verify_minion doesn't need
+        self.aes_funcs = salt.master.AESFuncs.__new__(salt.master.AESFuncs)
+        self.aes_funcs.opts = opts
+        self.aes_funcs.minion_keys = OrderedDict()
+
+    def tearDown(self):
+        shutil.rmtree(self.pki_dir, ignore_errors=True)
+
+    def test_verify_minion_cache(self):
+        '''
+        Asserts that the key of a minion is only parsed and its token only
+        verified once, until the key file is removed
+        '''
+        get_key = MagicMock(return_value='pub')
+        decrypt = MagicMock(return_value=b'salt')
+        with patch('salt.crypt.get_rsa_pub_key', get_key), \
+                patch('salt.crypt.public_decrypt', decrypt):
+            self.assertTrue(self.aes_funcs.verify_minion('minion1', 'token'))
+            self.assertTrue(self.aes_funcs.verify_minion('minion1', 'token'))
+            self.assertEqual(get_key.call_count, 1)
+            self.assertEqual(decrypt.call_count, 1)
+
+            os.remove(self.pub_path)
+            self.assertFalse(self.aes_funcs.verify_minion('minion1', 'token'))
+            self.assertNotIn('minion1', self.aes_funcs.minion_keys)
+
+    def test_verify_minion_bad_token(self):
+        '''
+        Asserts that a token which doesn't verify is not cached
+        '''
+        decrypt = MagicMock(return_value=b'')
+        with patch('salt.crypt.get_rsa_pub_key', MagicMock(return_value='pub')), \
+                patch('salt.crypt.public_decrypt', decrypt):
+            self.assertFalse(self.aes_funcs.verify_minion('minion1', 'token'))
+            self.assertFalse(self.aes_funcs.verify_minion('minion1', 'token'))
+            self.assertEqual(decrypt.call_count, 2)
@@ -185,6 +185,31 @@ class MinionTestCase(TestCase, AdaptedConfigurationTestCaseMixin):
             finally:
                 minion.destroy()
 
+    def test_proxy_handle_decoded_payload(self):
+        '''
+        Tests that a proxy minion runs a payload and adds its jid to the jid_queue, dropping the oldest
+        jid when minion_jid_queue_hwm is hit.
+        '''
+        with patch('salt.minion.Minion.ctx', MagicMock(return_value={})), \
+                patch('salt.utils.process.SignalHandlingMultiprocessingProcess.start', MagicMock(return_value=True)) as start_mock, \
+                patch('salt.utils.process.SignalHandlingMultiprocessingProcess.join', MagicMock(return_value=True)):
+            mock_opts = copy.deepcopy(salt.config.DEFAULT_MINION_OPTS)
+            mock_opts['minion_jid_queue_hwm'] = 2
+            mock_data = {'fun': 'foo.bar',
+                         'jid': 789}
+            proxy_minion = salt.minion.ProxyMinion(mock_opts, jid_queue=[123, 456], io_loop=tornado.ioloop.IOLoop())
+            try:
+                proxy_minion._handle_decoded_payload(mock_data).result()
+                self.assertEqual(proxy_minion.jid_queue, [456, 789])
+                self.assertEqual(start_mock.call_count, 1)
+
+                # A duplicate jid is not run again
+                proxy_minion._handle_decoded_payload(mock_data).result()
+                self.assertEqual(proxy_minion.jid_queue, [456, 789])
+                self.assertEqual(start_mock.call_count, 1)
+            finally:
+                proxy_minion.destroy()
+
     def test_process_count_max(self):
         '''
         Tests that the _handle_decoded_payload function does not spawn more than the configured amount of processes,
@@ -410,3 +435,52 @@ class MinionAsyncTestCase(TestCase, AdaptedConfigurationTestCaseMixin, tornado.t
             except SaltSystemExit:
                 result = False
         self.assertTrue(result)
+
+
+@skipIf(NO_MOCK, NO_MOCK_REASON)
+class SyndicManagerTestCase(TestCase):
+    def _syndic_manager(self, **opts):
+        mock_opts = salt.config.DEFAULT_MINION_OPTS.copy()
+        mock_opts.update({'master_job_cache': 'local_cache',
+                          'syndic_jid_forward_cache_hwm': 100})
+        mock_opts.update(opts)
+        with patch('salt.minion.MasterMinion', MagicMock()):
+            syndic = salt.minion.SyndicManager(mock_opts, io_loop=MagicMock())
+        syndic.local = MagicMock()
+        syndic.local.event = event.SaltEvent('minion', listen=False)
+        syndic.mminion.returners = {'local_cache.get_load': MagicMock(return_value={'fun': 'test.ping'})}
+        syndic._return_pub_syndic = MagicMock(return_value=True)
+        return syndic
+
+    def _ret(self, syndic, jid, minion):
+        tag = 'salt/job/{0}/ret/{1}'.format(jid, minion)
+        syndic._process_event(event.SaltEvent.pack(
+            tag, {'jid': jid, 'id': minion, 'fun': 'test.ping', 'return': True}))
+
+    def test_process_event_jid_forward_cache(self):
+        '''
+        Tests that the syndic forwards the load of a job once and drops the
+        oldest jids from the cache when syndic_jid_forward_cache_hwm is hit
+        '''
+        syndic = self._syndic_manager(syndic_jid_forward_cache_hwm=2)
+        for jid, minion in (('20190101000000000001', 'minion1'),
+                            ('20190101000000000002', 'minion1'),
+                            ('20190101000000000003', 'minion1'),
+                            ('20190101000000000003', 'minion2')):
+            self._ret(syndic, jid, minion)
+        self.assertEqual(list(syndic.jid_forward_cache),
+                         ['20190101000000000002', '20190101000000000003'])
+        self.assertEqual(syndic.mminion.returners['local_cache.get_load'].call_count, 3)
+
+    def test_process_event_forward_batch(self):
+        '''
+        Tests that the syndic forwards the returns once syndic_forward_batch_size
+        returns are aggregated
+        '''
+        syndic = self._syndic_manager(syndic_forward_batch_size=2)
+        self._ret(syndic, '20190101000000000001', 'minion1')
+        syndic._return_pub_syndic.assert_not_called()
+        self._ret(syndic, '20190101000000000001', 'minion2')
+        syndic._return_pub_syndic.assert_called_once()
+        self.assertEqual(syndic.job_rets, {})
+        self.assertEqual(syndic.job_ret_counts, {})
@@ -23,6 +23,7 @@ from tests.support.paths import BASE_FILES
 # Import Salt libs
 import salt.exceptions
 import salt.state
+import salt.utils.files
 from salt.utils.odict import OrderedDict
 from salt.utils.decorators import state as statedecorators
 
@@ -227,6 +228,71 @@ class HighStateTestCase(TestCase, AdaptedConfigurationTestCaseMixin):
         ret = salt.state.find_sls_ids('issue-47182.stateA.newer', high)
         self.assertEqual(ret, [('somestuff', 'cmd')])
 
+    def test_render_highstate_compile_cache(self):
+        sls_path = os.path.join(self.state_tree_dir, 'cached.sls')
+        with salt.utils.files.fopen(sls_path, 'w') as fp_:
+            fp_.write('first:\n  test.succeed_without_changes\n')
+        self.highstate.opts['state_compile_cache'] = True
+        matches = {'base': ['cached']}
+        high, errors = self.highstate.render_highstate(matches)
+        self.assertEqual(errors, [])
+        self.assertIn('first', high)
+
+        # Nothing changed, the SLS file is not rendered again
+        self.highstate.building_highstate = OrderedDict()
+        with patch.object(self.highstate, 'render_state') as render_state:
+            high, errors = self.highstate.render_highstate(matches)
+        render_state.assert_not_called()
+        self.assertIn('first', high)
+
+        # A changed SLS file invalidates the cache
+        with salt.utils.files.fopen(sls_path, 'w') as fp_:
+            fp_.write('second:\n  test.succeed_without_changes\n')
+        self.highstate.building_highstate = OrderedDict()
+        high, errors = self.highstate.render_highstate(matches)
+        self.assertIn('second', high)
+        self.assertNotIn('first', high)
+
+    def test_render_highstate_compile_cache_imports(self):
+        sls_path = os.path.join(self.state_tree_dir, 'imported.sls')
+        map_path = os.path.join(self.state_tree_dir, 'map.jinja')
+        with salt.utils.files.fopen(sls_path, 'w') as fp_:
+            fp_.write('{% from "map.jinja" import name %}\n'
+                      '{{ name }}:\n  test.succeed_without_changes\n')
+        with salt.utils.files.fopen(map_path, 'w') as fp_:
+            fp_.write('{% set name = "first" %}\n')
+        self.highstate.opts['state_compile_cache'] = True
+        matches = {'base': ['imported']}
+        high, errors = self.highstate.render_highstate(matches)
+        self.assertIn('first', high)
+
+        # A changed imported file invalidates the cache
+        with salt.utils.files.fopen(map_path, 'w') as fp_:
+            fp_.write('{% set name = "second" %}\n')
+        self.highstate.building_highstate = OrderedDict()
+        high, errors = self.highstate.render_highstate(matches)
+        self.assertEqual(errors, [])
+        self.assertIn('second', high)
+        self.assertNotIn('first', high)
+
+    def test_render_highstate_compile_cache_names(self):
+        for sls in ('one', 'two'):
+            with salt.utils.files.fopen(
+                    os.path.join(self.state_tree_dir, sls + '.sls'), 'w') as fp_:
+                fp_.write('{0}:\n  test.succeed_without_changes\n'.format(sls))
+        self.highstate.opts['state_compile_cache'] = True
+        self.highstate.render_highstate({'base': ['one']}, 'highstate')
+        self.highstate.building_highstate = OrderedDict()
+        self.highstate.render_highstate({'base': ['two']})
+
+        # Rendering other SLS files does not replace the cached highstate
+        self.highstate.building_highstate = OrderedDict()
+        with patch.object(self.highstate, 'render_state') as render_state:
+            high, errors = self.highstate.render_highstate(
+                {'base': ['one']}, 'highstate')
+        render_state.assert_not_called()
+        self.assertIn('one', high)
+
 
 @skipIf(NO_MOCK, NO_MOCK_REASON)
 @skipIf(pytest is None, 'PyTest is missing')
@@ -416,3 +482,229 @@ class StateFormatSlotsTestCase(TestCase, AdaptedConfigurationTestCaseMixin):
             self.state_obj.format_slots(cdata)
         mock.assert_not_called()
         self.assertEqual(cdata, sls_data)
+
+
+class CopyLowTestCase(TestCase, AdaptedConfigurationTestCaseMixin):
+    '''
+    TestCase for the copies of low chunks compiled from one declaration
+    '''
+    def test_copy_low(self):
+        '''
+        Test that immutable values are shared and all others are copied
+        '''
+        template = {'state': 'file', 'order': 1, 'makedirs': True,
+                    'require': [{'pkg': 'foo'}], 'defaults': {'a': [1]}}
+        chunk = salt.state._copy_low(template)
+        self.assertIs(type(chunk), dict)
+        self.assertEqual(chunk, template)
+        self.assertIs(chunk['state'], template['state'])
+        self.assertIsNot(chunk['require'], template['require'])
+        self.assertIsNot(chunk['defaults']['a'], template['defaults']['a'])
+
+    def test_compile_high_data_names(self):
+        '''
+        Test that chunks compiled from ``names`` hold their own argument values.
+        '''
+        high = {'foo': {'__sls__': 'foo',
+                        '__env__': 'base',
+                        'cmd': ['run',
+                                {'names': ['one', 'two']},
+                                {'env': [{'FOO': 'bar'}]}]}}
+        with patch('salt.state.State._gather_pillar'):
+            state_obj = salt.state.State(self.get_temp_config('minion'))
+        chunks = state_obj.compile_high_data(high)
+        self.assertEqual([chunk['name'] for chunk in chunks], ['one', 'two'])
+        self.assertIs(chunks[0]['__sls__'], chunks[1]['__sls__'])
+        chunks[0]['env'].append({'BAZ': 'qux'})
+        self.assertEqual(chunks[1]['env'], [{'FOO': 'bar'}])
+
+
+class StateAutoParallelTestCase(TestCase, AdaptedConfigurationTestCaseMixin):
+    '''
+    TestCase for selecting the chunks run in parallel automatically
+    '''
+    def setUp(self):
+        with patch('salt.state.State._gather_pillar'):
+            minion_opts = self.get_temp_config('minion')
+            minion_opts['state_auto_parallel'] = True
+            self.state_obj = salt.state.State(minion_opts)
+
+    def _chunk(self, id_, **kwargs):
+        chunk = {'state': 'test', 'fun': 'nop', 'name': id_,
+                 '__id__': id_, '__sls__': 'foo', 'order': 10000}
+        chunk.update(kwargs)
+        return chunk
+
+    def test_auto_parallel_tags(self):
+        '''
+        Test that only chunks outside of any requisite relationship are
+        selected.
+        '''
+        chunks = [self._chunk('independent'),
+                  self._chunk('required'),
+                  self._chunk('requires', require=[{'test': 'required'}]),
+                  self._chunk('watched_by_sls'),
+                  self._chunk('onchanges_sls', onchanges=[{'sls': 'bar'}]),
+                  self._chunk('reloads', reload_modules=True)]
+        tags = self.state_obj._auto_parallel_tags(chunks)
+        self.assertEqual(tags, set([salt.state._gen_tag(chunks[0]),
+                                    salt.state._gen_tag(chunks[3])]))
+
+    def _call_chunks(self, auto_order, **orders):
+        '''
+        Run the chunks compiled from high data, with the given orders, return
+        the IDs of the states called and ``None`` where call_chunks waited for
+        the parallel processes
+        '''
+        high = {}
+        for id_ in ('one', 'two', 'three'):
+            high[id_] = {'test': ['nop'], '__sls__': 'foo', '__env__': 'base'}
+            if id_ in orders:
+                high[id_]['test'].append({'order': orders[id_]})
+        highstate = salt.state.BaseHighState.__new__(salt.state.BaseHighState)
+        highstate.opts = {'state_auto_order': auto_order}
+        highstate.iorder = 10000
+        highstate._handle_iorder(high)
+        self.state_obj.opts['state_auto_order'] = auto_order
+        chunks = self.state_obj.order_chunks(self.state_obj.compile_high_data(high))
+        calls = []
+
+        def _call_chunk(low, running, chunks):
+            calls.append(low['__id__'])
+            running = dict(running)
+            running[salt.state._gen_tag(low)] = {'result': True, 'changes': {}}
+            return running
+
+        def _wait_procs(*args):
+            calls.append(None)
+
+        with patch.object(self.state_obj, 'call_chunk', side_effect=_call_chunk), \
+                patch.object(self.state_obj, '_wait_procs', side_effect=_wait_procs):
+            ret = self.state_obj.call_chunks(chunks)
+        self.assertEqual(len(ret), 3)
+        self.assertEqual(len(self.state_obj._auto_parallel), 3)
+        return calls
+
+    def test_auto_parallel_auto_order(self):
+        '''
+        Test that the orders given by state_auto_order do not keep the chunks
+        from overlapping.
+        '''
+        # Only the final wait for all the chunks
+        self.assertEqual(self._call_chunks(True), ['one', 'two', 'three', None])
+
+    def test_auto_parallel_explicit_order(self):
+        '''
+        Test that chunks with different explicit orders do not overlap.
+        '''
+        # Between order 1 and the default order, and at the end
+        self.assertEqual(self._call_chunks(False, three=1),
+                         ['three', None, 'one', 'two', None])
+
+    def test_auto_parallel_explicit_order_auto_order(self):
+        '''
+        Test that explicit orders keep the chunks from overlapping with the
+        chunks ordered by state_auto_order.
+        '''
+        self.assertEqual(self._call_chunks(True, three=1),
+                         ['three', None, 'one', 'two', None])
+        self.assertEqual(self._call_chunks(True, one='last'),
+                         ['two', 'three', None, 'one', None])
+        self.assertEqual(self._call_chunks(True, three='first'),
+                         ['three', None, 'one', 'two', None])
+
+    def test_parallel_workers_default(self):
+        '''
+        Test that the parallel processes are limited to the number of CPUs by
+        default, and not limited with state_parallel_workers set to 0.
+        '''
+        proc = MagicMock()
+        proc.is_alive.side_effect = [True, False]
+        self.state_obj._parallel_procs = [proc]
+        with patch('multiprocessing.cpu_count', MagicMock(return_value=1)):
+            self.state_obj._wait_parallel_slot()
+        proc.join.assert_called_once_with(0.1)
+        self.assertEqual(self.state_obj._parallel_procs, [])
+
+        proc = MagicMock()
+        self.state_obj._parallel_procs = [proc]
+        self.state_obj.opts['state_parallel_workers'] = 0
+        with patch('multiprocessing.cpu_count', MagicMock(return_value=1)):
+            self.state_obj._wait_parallel_slot()
+        proc.join.assert_not_called()
+
+    def test_auto_parallel_disabled_by_failhard(self):
+        '''
+        Test that failhard disables running chunks in parallel automatically.
+        '''
+        self.state_obj.opts['failhard'] = True
+        self.assertEqual(
+            self.state_obj._auto_parallel_tags([self._chunk('independent')]),
+            set())
+
+
+class StateIncrementalTestCase(TestCase, AdaptedConfigurationTestCaseMixin):
+    '''
+    TestCase for the input fingerprints of incremental state runs
+    '''
+    def setUp(self):
+        with patch('salt.state.State._gather_pillar'):
+            minion_opts = self.get_temp_config('minion')
+            minion_opts['state_incremental'] = True
+            minion_opts['test'] = False
+            self.state_obj = salt.state.State(minion_opts)
+        self.low = {'state': 'test', 'fun': 'nop', 'name': 'foo',
+                    '__id__': 'foo', '__sls__': 'foo'}
+        self.cdata = {'full': 'test.nop', 'args': ['foo'], 'kwargs': {}}
+
+    def test_fingerprint(self):
+        '''
+        Test that the fingerprint follows the arguments and facts
+        '''
+        facts = MagicMock(return_value={'hash': 'abc'})
+        with patch.dict(self.state_obj.states, {'test.mod_fingerprint': facts}):
+            first = self.state_obj._fingerprint(self.low, self.cdata)
+            self.assertIsNotNone(first)
+            self.assertEqual(first, self.state_obj._fingerprint(self.low, self.cdata))
+
+            cdata = dict(self.cdata, kwargs={'extra': True})
+            self.assertNotEqual(first, self.state_obj._fingerprint(self.low, cdata))
+
+            facts.return_value = {'hash': 'def'}
+            self.assertNotEqual(first, self.state_obj._fingerprint(self.low, self.cdata))
+
+    def test_fingerprint_not_supported(self):
+        '''
+        Test that chunks with runtime checks or without fingerprint support
+        are never skipped
+        '''
+        self.assertIsNone(self.state_obj._fingerprint(self.low, self.cdata))
+        facts = MagicMock(return_value={'hash': 'abc'})
+        with patch.dict(self.state_obj.states, {'test.mod_fingerprint': facts}):
+            low = dict(self.low, unless='true')
+            self.assertIsNone(self.state_obj._fingerprint(low, self.cdata))
+            low = dict(self.low, fun='mod_watch')
+            self.assertIsNone(self.state_obj._fingerprint(low, self.cdata))
+
+    def test_load_fingerprints(self):
+        '''
+        Test that the fingerprints of states removed from the SLS files of a
+        run are forgotten, and nothing is loaded when the option is off
+        '''
+        bar = dict(self.low, name='bar', __id__='bar')
+        other = dict(self.low, __sls__='other')
+        self.state_obj._fingerprints = {
+            'foo': {salt.state._gen_tag(self.low): 'abc',
+                    salt.state._gen_tag(bar): 'def'},
+            'other': {salt.state._gen_tag(other): 'ghi'}}
+        self.state_obj._store_fingerprints()
+
+        self.state_obj._load_fingerprints([self.low])
+        self.assertEqual(self.state_obj._fingerprints,
+                         {'foo': {salt.state._gen_tag(self.low): 'abc'},
+                          'other': {salt.state._gen_tag(other): 'ghi'}})
+
+        self.state_obj.opts['state_incremental'] = False
+        self.state_obj._load_fingerprints([self.low])
+        self.assertIsNone(self.state_obj._fingerprints)
+
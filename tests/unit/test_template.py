@@ -12,6 +12,7 @@ from tests.support.mock import NO_MOCK, NO_MOCK_REASON, MagicMock
 
 # Import Salt libs
 from salt import template
+import salt.utils.profile
 from salt.ext.six.moves import StringIO
 
 
@@ -79,6 +80,48 @@ class TemplateTestCase(TestCase):
             input_data=input_data_windows).read()
         self.assertEqual(ret, input_data_windows)
 
+    def test_compile_template_render_profile(self):
+        '''
+        Test that an active render profile records renderer timings, sizes
+        and the execution functions called while rendering.
+        '''
+        render_globals = {
+            '__name__': 'salt.loaded.int.render.upper',
+            '__salt__': {'test.echo': lambda text: text.upper()},
+            'StringIO': StringIO,
+        }
+        exec(  # pylint: disable=exec-used
+            'def render(data, saltenv, sls, **kwargs):\n'
+            '    return StringIO(__salt__[\'test.echo\'](data.read()))\n',
+            render_globals)
+        salt_funcs = render_globals['__salt__']
+
+        with salt.utils.profile.RenderProfile('test') as profile:
+            ret = template.compile_template(
+                ':string:',
+                {'upper': render_globals['render']},
+                'upper',
+                [],
+                [],
+                sls='foo',
+                input_data='foo bar\n').read()
+        self.assertEqual(ret, 'FOO BAR\n')
+        # The original __salt__ must be restored after rendering
+        self.assertIs(render_globals['__salt__'], salt_funcs)
+        self.assertIsNone(salt.utils.profile.active_render_profile())
+
+        report = profile.report()
+        self.assertEqual(len(report['templates']), 1)
+        record = report['templates'][0]
+        self.assertEqual(record['sls'], 'foo')
+        self.assertEqual(record['bytes_in'], 8)
+        self.assertEqual(record['bytes_out'], 8)
+        self.assertEqual([step['renderer'] for step in record['renderers']],
+                         ['upper'])
+        self.assertEqual(record['salt_calls']['test.echo']['count'], 1)
+        self.assertEqual(report['renderers']['upper']['count'], 1)
+        self.assertEqual(report['salt_calls']['test.echo']['count'], 1)
+
     def test_check_render_pipe_str(self):
         '''
         Check that all renderers specified in the pipe string are available.
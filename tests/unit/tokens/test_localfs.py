@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+'''
+Tests for salt.tokens.localfs
+'''
+# Import Python libs
+from __future__ import absolute_import, print_function, unicode_literals
+import os
+import shutil
+import tempfile
+import time
+
+# Import Salt Testing libs
+from tests.support.unit import TestCase, skipIf
+from tests.support.mock import patch, NO_MOCK, NO_MOCK_REASON
+from tests.support.paths import TMP
+
+# Import Salt libs
+import salt.payload
+import salt.tokens.localfs
+import salt.utils.files
+
+
+@skipIf(NO_MOCK, NO_MOCK_REASON)
+class LocalfsTokensTestCase(TestCase):
+    def setUp(self):
+        self.token_dir = tempfile.mkdtemp(dir=TMP)
+        self.opts = {'token_dir': self.token_dir, 'hash_type': 'sha256'}
+        salt.tokens.localfs._CACHE.clear()
+
+    def tearDown(self):
+        salt.tokens.localfs._CACHE.clear()
+        shutil.rmtree(self.token_dir)
+
+    def _mk_token(self):
+        return salt.tokens.localfs.mk_token(
+            self.opts,
+            {'name': 'fred', 'eauth': 'pam', 'expire': time.time() + 60})
+
+    def test_get_token_cached(self):
+        tdata = self._mk_token()
+        self.assertEqual(salt.tokens.localfs.get_token(self.opts, tdata['token']), tdata)
+        with patch('salt.utils.files.fopen') as fopen_mock:
+            ret = salt.tokens.localfs.get_token(self.opts, tdata['token'])
+        fopen_mock.assert_not_called()
+        self.assertEqual(ret, tdata)
+        # The cached data is not changed through the returned data
+        ret['name'] = 'barney'
+        self.assertEqual(salt.tokens.localfs.get_token(self.opts, tdata['token']), tdata)
+
+    def test_get_token_changed(self):
+        tdata = self._mk_token()
+        salt.tokens.localfs.get_token(self.opts, tdata['token'])
+        t_path = os.path.join(self.token_dir, tdata['token'])
+        tdata['name'] = 'barney-rubble'
+        with salt.utils.files.fopen(t_path, 'w+b') as fp_:
+            fp_.write(salt.payload.Serial(self.opts).dumps(tdata))
+        self.assertEqual(salt.tokens.localfs.get_token(self.opts, tdata['token']), tdata)
+
+    def test_get_token_removed(self):
+        tdata = self._mk_token()
+        salt.tokens.localfs.get_token(self.opts, tdata['token'])
+        # Removed by another process
+        os.remove(os.path.join(self.token_dir, tdata['token']))
+        self.assertEqual(salt.tokens.localfs.get_token(self.opts, tdata['token']), {})
+
+        tdata = self._mk_token()
+        salt.tokens.localfs.get_token(self.opts, tdata['token'])
+        salt.tokens.localfs.rm_token(self.opts, tdata['token'])
+        self.assertEqual(salt.tokens.localfs.get_token(self.opts, tdata['token']), {})
+        self.assertEqual(len(salt.tokens.localfs._CACHE), 0)
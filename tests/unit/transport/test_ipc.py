@@ -19,7 +19,9 @@ import salt.exceptions
 import salt.transport.ipc
 import salt.transport.server
 import salt.transport.client
+import salt.transport.frame
 import salt.utils.platform
+import salt.utils.stringutils
 
 from salt.ext import six
 from salt.ext.six.moves import range
@@ -27,7 +29,7 @@ from salt.ext.six.moves import range
 # Import Salt Testing libs
 from tests.support.mock import MagicMock
 from tests.support.paths import TMP
-from tests.support.unit import skipIf
+from tests.support.unit import skipIf, TestCase
 
 log = logging.getLogger(__name__)
 
@@ -154,3 +156,177 @@ class IPCMessageClient(BaseIPCReqCase):
         self.channel.send({'stop': True})
         self.wait()
         self.assertEqual(self.payloads[:-1], [None, None, 'foo', 'foo'])
+
+
+class IPCTagFilterTestCase(TestCase):
+    '''
+    Test matching published messages against subscriber tag filters
+    '''
+    def test_msg_tag(self):
+        msg = salt.utils.stringutils.to_bytes('salt/job/1/ret\n\n\x81\xa1a\x01')
+        self.assertEqual(salt.transport.ipc.msg_tag(msg), 'salt/job/1/ret')
+        self.assertEqual(salt.transport.ipc.msg_tag('salt/auth\n\n'), 'salt/auth')
+        self.assertEqual(salt.transport.ipc.msg_tag(b'salt/auth'), 'salt/auth')
+
+    def test_match_tag_filter(self):
+        tag_filter = [('salt/job/', 'startswith'), ('*/minion/*/start', 'fnmatch')]
+        match = salt.transport.ipc.match_tag_filter
+        self.assertTrue(match('salt/job/1/ret/web1', tag_filter))
+        self.assertTrue(match('salt/minion/web1/start', tag_filter))
+        self.assertFalse(match('salt/auth', tag_filter))
+        self.assertFalse(match('salt/auth', []))
+
+
+class IPCPublisherQueueTestCase(TestCase):
+    '''
+    Test the bounded subscriber queues of the IPC publisher
+    '''
+    def _publisher(self, policy):
+        opts = {'ipc_publisher_queue_size': 10,
+                'ipc_publisher_queue_policy': policy}
+        publisher = salt.transport.ipc.IPCMessagePublisher(
+            opts, 'unused.ipc', io_loop=MagicMock())
+        stream = MagicMock()
+        publisher.streams.add(stream)
+        return publisher, stream
+
+    def test_drop_oldest(self):
+        publisher, stream = self._publisher('drop_oldest')
+        for pack in (b'aaaa', b'bbbb', b'cccc'):
+            publisher._enqueue(stream, pack)
+        self.assertEqual(list(publisher.queues[stream].msgs), [b'bbbb', b'cccc'])
+        stats = publisher.stats()
+        self.assertEqual(stats['queued_bytes'], 8)
+        self.assertEqual(stats['dropped_msgs'], 1)
+        self.assertEqual(stats['dropped_bytes'], 4)
+
+    def test_drop_newest(self):
+        publisher, stream = self._publisher('drop_newest')
+        for pack in (b'aaaa', b'bbbb', b'cccc'):
+            publisher._enqueue(stream, pack)
+        self.assertEqual(list(publisher.queues[stream].msgs), [b'aaaa', b'bbbb'])
+        self.assertEqual(publisher.stats()['dropped_msgs'], 1)
+
+    def test_disconnect(self):
+        publisher, stream = self._publisher('disconnect')
+        for pack in (b'aaaa', b'bbbb', b'cccc'):
+            publisher._enqueue(stream, pack)
+        stream.close.assert_called_once_with()
+        stats = publisher.stats()
+        self.assertEqual(stats['subscribers'], 0)
+        self.assertEqual(stats['disconnected'], 1)
+        self.assertEqual(stats['dropped_msgs'], 3)
+
+    def test_large_message(self):
+        for policy in ('drop_oldest', 'drop_newest', 'disconnect'):
+            publisher, stream = self._publisher(policy)
+            publisher._enqueue(stream, b'x' * 20)
+            self.assertEqual(list(publisher.queues[stream].msgs), [b'x' * 20])
+            stream.close.assert_not_called()
+            self.assertEqual(publisher.stats()['dropped_msgs'], 0)
+
+        publisher, stream = self._publisher('drop_oldest')
+        publisher._enqueue(stream, b'aaaa')
+        publisher._enqueue(stream, b'x' * 20)
+        self.assertEqual(list(publisher.queues[stream].msgs), [b'x' * 20])
+
+    def test_queue_parts(self):
+        publisher, stream = self._publisher('drop_oldest')
+        publisher._enqueue(stream, [b'aa', b'bb'])
+        publisher._enqueue(stream, [b'cccc', b'dddd'])
+        self.assertEqual(list(publisher.queues[stream].msgs), [[b'cccc', b'dddd']])
+        self.assertEqual(publisher.stats()['dropped_bytes'], 4)
+
+
+class IPCFramingTestCase(TestCase):
+    '''
+    Test framing messages given as lists of buffers
+    '''
+    def test_frame_msg_ipc_parts(self):
+        for size in (0, 5, 31, 32, 255, 256, 65535, 65536):
+            body = b'x' * size
+            parts = salt.transport.frame.frame_msg_ipc_parts([b'tag\n\n', body])
+            self.assertEqual(b''.join(parts),
+                             salt.transport.frame.frame_msg_ipc(b'tag\n\n' + body))
+
+    def test_coalesce(self):
+        parts = [b'a', b'b', b'c' * 10, b'd']
+        self.assertEqual(list(salt.transport.ipc._coalesce(parts, size=10)),
+                         [b'ab', b'c' * 10, b'd'])
+        self.assertEqual(list(salt.transport.ipc._coalesce(parts)),
+                         [b''.join(parts)])
+
+
+class IPCPublisherBacklogTestCase(TestCase):
+    '''
+    Test resuming subscribers from the backlog of the IPC publisher
+    '''
+    def setUp(self):
+        self.publisher = salt.transport.ipc.IPCMessagePublisher(
+            {'ipc_publisher_backlog': 3}, 'unused.ipc', io_loop=MagicMock())
+
+    def tearDown(self):
+        del self.publisher
+
+    def _connect(self):
+        stream = MagicMock()
+        self.publisher.streams.add(stream)
+        self.publisher.connect_seqs[stream] = self.publisher.seq
+        self.publisher.queues[stream] = salt.transport.ipc._SendQueue(held=True)
+        return stream
+
+    def _queued(self, stream):
+        return [b''.join(pack)[-1:] for pack in self.publisher.queues[stream].msgs]
+
+    def test_resume(self):
+        for msg in (b'a', b'b', b'c', b'd'):
+            self.publisher.publish(msg)
+        self.assertEqual([seq for seq, _, _ in self.publisher.backlog], [2, 3, 4])
+        stream = self._connect()
+        self.publisher.publish(b'e')
+        # Messages published since connecting wait for the replayed ones
+        self.publisher.io_loop.spawn_callback.assert_not_called()
+        self.publisher._resume(stream, self.publisher.epoch, 2)
+        self.assertEqual(self._queued(stream), [b'c', b'd', b'e'])
+        self.assertEqual(self.publisher.stats()['replayed_msgs'], 2)
+        self.publisher.io_loop.spawn_callback.assert_called_once_with(
+            self.publisher._write, stream, self.publisher.queues[stream])
+
+    def test_resume_nothing(self):
+        self.publisher.publish(b'a')
+        stream = self._connect()
+        self.publisher.publish(b'b')
+        self.publisher._resume(stream, None, None)
+        self.assertEqual(self._queued(stream), [b'b'])
+        self.assertFalse(self.publisher.queues[stream].held)
+        self.assertEqual(self.publisher.stats()['replayed_msgs'], 0)
+
+    def test_resume_other_epoch(self):
+        for msg in (b'a', b'b'):
+            self.publisher.publish(msg)
+        stream = self._connect()
+        self.publisher._resume(stream, self.publisher.epoch - 1, 5)
+        self.assertEqual(self._queued(stream), [b'a', b'b'])
+
+    def test_resume_tag_filter(self):
+        for msg in (b'salt/auth\n\n', b'salt/job/1\n\n'):
+            self.publisher.publish(msg)
+        stream = self._connect()
+        self.publisher.tag_filters[stream] = [('salt/job/', 'startswith')]
+        self.publisher._resume(stream, self.publisher.epoch, 0)
+        self.assertEqual(len(self.publisher.queues[stream].msgs), 1)
+
+    def test_backlog_size(self):
+        publisher = salt.transport.ipc.IPCMessagePublisher(
+            {'ipc_publisher_backlog': 10, 'ipc_publisher_backlog_size': 100},
+            'unused.ipc', io_loop=MagicMock())
+        for msg in (b'a' * 10, b'b' * 10, b'c' * 10):
+            publisher.publish(msg)
+        self.assertEqual([seq for seq, _, _ in publisher.backlog], [2, 3])
+        stats = publisher.stats()
+        self.assertEqual(stats['backlog_msgs'], 2)
+        self.assertLessEqual(stats['backlog_bytes'], 100)
+
+        # The newest message is kept even if it is larger than the limit
+        publisher.publish(b'd' * 200)
+        self.assertEqual([seq for seq, _, _ in publisher.backlog], [4])
@@ -10,6 +10,7 @@ import threading
 import tornado.gen
 import tornado.ioloop
 import tornado.concurrent
+import tornado.iostream
 from tornado.testing import AsyncTestCase, gen_test
 
 import salt.config
@@ -18,6 +19,8 @@ import salt.utils.platform
 import salt.utils.process
 import salt.transport.server
 import salt.transport.client
+import salt.transport.frame
+import salt.transport.tcp
 import salt.exceptions
 from salt.ext.six.moves import range
 from salt.transport.tcp import SaltMessageClientPool
@@ -310,3 +313,64 @@ class SaltMessageClientPoolTest(AsyncTestCase):
 
         with self.assertRaises(tornado.ioloop.TimeoutError):
             test_connect(self)
+
+
+class PubServerTest(AsyncTestCase):
+    def setUp(self):
+        super(PubServerTest, self).setUp()
+        with patch('salt.master.AESFuncs', MagicMock()):
+            self.pub_server = salt.transport.tcp.PubServer(
+                {'tcp_publish_batch_size': 2}, io_loop=MagicMock())
+        self.clients = []
+        for idx in range(5):
+            client = MagicMock()
+            client.id_ = 'minion{0}'.format(idx)
+            self.clients.append(client)
+            self.pub_server.clients.add(client)
+            self.pub_server.present[client.id_] = {client}
+
+    def tearDown(self):
+        del self.pub_server
+        super(PubServerTest, self).tearDown()
+
+    def test_presence_table(self):
+        self.pub_server.presence_table = True
+        client = MagicMock()
+        client.id_ = 'minion5'
+        client.address = ('10.0.0.5', 4505)
+        with patch('salt.utils.presence.write') as write_mock:
+            self.pub_server._add_client_present(client)
+            self.pub_server._remove_client_present(self.clients[0])
+            self.pub_server.io_loop.call_later.assert_called_once_with(
+                1, self.pub_server._write_presence)
+            self.pub_server._write_presence()
+        present = write_mock.call_args[0][1]
+        self.assertEqual(sorted(present),
+                         ['minion1', 'minion2', 'minion3', 'minion4', 'minion5'])
+        self.assertEqual(present['minion5'], '10.0.0.5')
+
+        with patch('salt.utils.presence.remove') as remove_mock:
+            self.pub_server.close()
+        remove_mock.assert_called_once_with(self.pub_server.opts)
+
+    def test_close_incomplete(self):
+        # __del__ closes publishers whose __init__ raised
+        pub_server = salt.transport.tcp.PubServer.__new__(salt.transport.tcp.PubServer)
+        pub_server.close()
+
+    @gen_test
+    def test_publish_payload(self):
+        yield self.pub_server.publish_payload({'payload': b'foo'}, None)
+        payload = salt.transport.frame.frame_msg(b'foo')
+        for client in self.clients:
+            client.stream.write.assert_called_once_with(payload)
+
+    @gen_test
+    def test_publish_payload_topic_lst(self):
+        self.clients[0].stream.write.side_effect = tornado.iostream.StreamClosedError()
+        yield self.pub_server.publish_payload(
+            {'payload': b'foo', 'topic_lst': ['minion0', 'minion1', 'minion9']}, None)
+        self.assertTrue(self.clients[1].stream.write.called)
+        self.assertFalse(self.clients[2].stream.write.called)
+        self.assertNotIn(self.clients[0], self.pub_server.clients)
+        self.assertNotIn('minion0', self.pub_server.present)
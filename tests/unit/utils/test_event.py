@@ -11,6 +11,9 @@
 from __future__ import absolute_import, unicode_literals, print_function
 import os
 import hashlib
+import signal
+import shutil
+import tempfile
 import time
 from tornado.testing import AsyncTestCase
 import zmq
@@ -22,12 +25,16 @@ from contextlib import contextmanager
 from multiprocessing import Process
 
 # Import Salt Testing libs
+from tests.support.mock import NO_MOCK, NO_MOCK_REASON, MagicMock, patch
 from tests.support.unit import expectedFailure, skipIf, TestCase
 
 # Import salt libs
+import salt.config
+import salt.minion
 import salt.utils.event
 import salt.utils.stringutils
 import tests.integration as integration
+from salt.ext.six.moves import queue
 from salt.utils.process import clean_proc
 
 # Import 3rd-+arty libs
@@ -277,6 +284,20 @@ class TestSaltEvent(TestCase):
             self.assertGotEvent(evt2, {'data': 'foo2'})
             self.assertGotEvent(evt1, {'data': 'foo1'})
 
+    def test_event_tag_filter(self):
+        '''Test events not matching the tag filter are not sent'''
+        with eventpublisher_process():
+            me = salt.utils.event.MasterEvent(SOCK_DIR, listen=True)
+            me.set_tag_filter(['evt1'])
+            me.subscribe('evt2')
+            # Give the publisher time to receive the filter
+            time.sleep(0.5)
+            me.fire_event({'data': 'foo2'}, 'evt2')
+            me.fire_event({'data': 'foo1'}, 'evt1')
+            evt1 = me.get_event(tag='evt1')
+            self.assertGotEvent(evt1, {'data': 'foo1'})
+            self.assertIsNone(me.get_event(tag='evt2', wait=0.5))
+
     def test_event_multiple_clients(self):
         '''Test event is received by multiple clients'''
         with eventpublisher_process():
@@ -325,6 +346,17 @@ class TestSaltEvent(TestCase):
                 evt = me.get_event(tag='testevents')
                 self.assertGotEvent(evt, {'data': '{0}'.format(i)}, 'Event {0}'.format(i))
 
+    def test_pack_bytes_tag(self):
+        '''Test that events with a tag given as bytes are packed'''
+        for tag in ('salt/test', b'salt/test'):
+            tag_part, data_part = salt.utils.event.SaltEvent.pack_parts(tag, {'a': 1})
+            self.assertEqual(tag_part, b'salt/test' + salt.utils.stringutils.to_bytes(
+                salt.utils.event.TAGEND))
+            unpacked_tag, data = salt.utils.event.SaltEvent.unpack(
+                salt.utils.event.SaltEvent.pack(tag, {'a': 1}))
+            self.assertEqual(unpacked_tag, 'salt/test')
+            self.assertEqual(data, {'a': 1})
+
     # Test the fire_master function. As it wraps the underlying fire_event,
     # we don't need to perform extensive testing.
     def test_send_master_event(self):
@@ -366,3 +398,153 @@ class TestAsyncEventPublisher(AsyncTestCase):
         self.assertEqual(self.tag, 'evt1')
         self.data.pop('_stamp')  # drop the stamp
         self.assertEqual(self.data, {'data': 'foo1'})
+
+
+@skipIf(NO_MOCK, NO_MOCK_REASON)
+class TestEventReturn(TestCase):
+    def setUp(self):
+        cachedir = tempfile.mkdtemp(dir=integration.TMP)
+        self.addCleanup(shutil.rmtree, cachedir, ignore_errors=True)
+        opts = salt.config.DEFAULT_MASTER_OPTS.copy()
+        opts.update({'cachedir': cachedir,
+                     'event_return': 'fake',
+                     'event_return_spool': True})
+        with patch('salt.minion.MasterMinion'):
+            self.event_return = salt.utils.event.EventReturn(opts)
+        self.event_return.minion.returners = {'fake.event_return': self._store}
+        self.stored = []
+        self.down = False
+
+    def _store(self, events):
+        if self.down:
+            raise Exception('backend down')
+        self.stored.append(events)
+
+    def test_spooled_events_are_replayed_in_order(self):
+        self.down = True
+        self.event_return._flush_batch([{'tag': 'evt1'}])
+        self.event_return._flush_batch([{'tag': 'evt2'}])
+        self.assertEqual(self.stored, [])
+        self.assertEqual(
+            len(self.event_return._spooled('fake.event_return')), 2)
+
+        self.down = False
+        self.event_return._retry_at.clear()
+        self.event_return._flush_batch([{'tag': 'evt3'}])
+        self.assertEqual(
+            self.stored,
+            [[{'tag': 'evt1'}], [{'tag': 'evt2'}], [{'tag': 'evt3'}]])
+        self.assertEqual(self.event_return._spooled('fake.event_return'), [])
+        self.assertEqual(self.event_return.stats['flushed_events'], 3)
+        self.assertEqual(self.event_return.stats['spooled_events'], 0)
+
+    def test_spooled_events_count_restored(self):
+        self.down = True
+        self.event_return._flush_batch([{'tag': 'evt1'}, {'tag': 'evt2'}])
+        self.event_return._flush_batch([{'tag': 'evt3'}])
+        with patch('salt.minion.MasterMinion'):
+            event_return = salt.utils.event.EventReturn(self.event_return.opts)
+        self.assertEqual(event_return.stats['spooled_events'], 3)
+
+    def test_spool_size(self):
+        self.down = True
+        self.event_return.opts['event_return_spool_size'] = 1
+        for tag in ('evt1', 'evt2', 'evt3'):
+            self.event_return._flush_batch([{'tag': tag}])
+        # Only the newest batch is kept
+        spooled = self.event_return._spooled('fake.event_return')
+        self.assertEqual(len(spooled), 1)
+        self.assertEqual(self.event_return.stats['spooled_events'], 1)
+        self.assertEqual(self.event_return.stats['dropped_events'], 2)
+
+        self.down = False
+        self.event_return._retry_at.clear()
+        self.event_return._flush_batch([{'tag': 'evt4'}])
+        self.assertEqual(self.stored, [[{'tag': 'evt3'}], [{'tag': 'evt4'}]])
+
+    def _flush_queued(self):
+        seq, events = self.event_return.flush_queue.get()
+        self.event_return._flush_batch(events, seq)
+
+    def test_full_backlog_is_spooled(self):
+        self.event_return.flush_thread = MagicMock()
+        self.event_return.flush_queue = queue.Queue(maxsize=1)
+        for tag in ('evt1', 'evt2'):
+            self.event_return.event_queue = [{'tag': tag}]
+            self.event_return.flush_events()
+        # The batch which did not fit in the backlog is spooled right away
+        self.assertEqual(self.event_return.flush_queue.qsize(), 1)
+        self.assertEqual(
+            len(self.event_return._spooled('fake.event_return')), 1)
+
+        # The flush thread stores it after the older batch in the backlog,
+        # and before the newer ones
+        self._flush_queued()
+        self.event_return.event_queue = [{'tag': 'evt3'}]
+        self.event_return.flush_events()
+        self._flush_queued()
+        self.assertEqual(
+            self.stored,
+            [[{'tag': 'evt1'}], [{'tag': 'evt2'}], [{'tag': 'evt3'}]])
+        self.assertEqual(self.event_return._spooled('fake.event_return'), [])
+        self.assertEqual(self.event_return.stats['dropped_events'], 0)
+
+    def test_signal_stops_reading(self):
+        self.event_return.flush_thread = MagicMock()
+        with patch('signal.signal'):
+            self.event_return._handle_signals(signal.SIGTERM, None)
+        self.assertTrue(self.event_return.stop)
+        self.event_return.flush_thread.join.assert_not_called()
+
+
+@skipIf(NO_MOCK, NO_MOCK_REASON)
+class TestEventBusStats(TestCase):
+    def setUp(self):
+        self.publisher = MagicMock()
+        self.publisher.stats.return_value = {'subscribers': 1}
+        self.bus_stats = salt.utils.event.EventBusStats(self.publisher)
+
+    def test_counts_per_tag_prefix(self):
+        for tag in ('salt/job/1/new', 'salt/job/1/ret/web1', 'salt/auth'):
+            self.bus_stats.add(salt.utils.event.SaltEvent.pack(tag, {}))
+        self.bus_stats.roll()
+        report = self.bus_stats.report()
+        self.assertEqual(report['events'], 3)
+        self.assertEqual(sorted(report['tags']), ['salt/auth', 'salt/job'])
+        self.assertEqual(report['tags']['salt/job']['events'], 2)
+        self.assertGreater(report['tags']['salt/job']['events_per_sec'], 0)
+        self.assertEqual(report['publisher'], {'subscribers': 1})
+
+    def test_prefixes_bounded(self):
+        # The master fires a bare jid tag for every publish
+        for jid in ('20190101000000000000', '20190101000000000001'):
+            self.bus_stats.add(salt.utils.event.SaltEvent.pack(jid, {}))
+        self.bus_stats.max_prefixes = 2
+        for idx in range(3):
+            self.bus_stats.add(salt.utils.event.SaltEvent.pack(
+                'salt/job{0}/new'.format(idx), {}))
+        report = self.bus_stats.report(publisher=False)
+        self.assertEqual(sorted(report['tags']), ['other', 'salt/job0'])
+        self.assertEqual(report['tags']['other']['events'], 4)
+        self.assertNotIn('publisher', report)
+
+    def test_passed_tag(self):
+        with patch('salt.transport.ipc.msg_tag') as msg_tag:
+            self.bus_stats.add(salt.utils.event.SaltEvent.pack('salt/auth', {}),
+                               tag='salt/auth')
+        msg_tag.assert_not_called()
+        self.assertEqual(list(self.bus_stats.report()['tags']), ['salt/auth'])
+
+    def test_rolls_window(self):
+        self.bus_stats.window_start -= self.bus_stats.window
+        self.bus_stats.add(salt.utils.event.SaltEvent.pack('salt/auth', {}))
+        self.assertIsNotNone(self.bus_stats.rates)
+
+    def test_answers_requests(self):
+        self.bus_stats.add(salt.utils.event.SaltEvent.pack(
+            salt.utils.event.EventBusStats.request_tag, {'id': 'abc'}))
+        raw = self.publisher.publish.call_args[0][0]
+        tag, data = salt.utils.event.SaltEvent.unpack(raw)
+        self.assertEqual(tag, salt.utils.event.EventBusStats.tag)
+        self.assertEqual(data['id'], 'abc')
+        self.assertEqual(data['events'], 1)
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+'''
+Unit tests for salt.utils.minion
+'''
+
+# Import Python libs
+from __future__ import absolute_import, print_function, unicode_literals
+import os
+import shutil
+import tempfile
+
+# Import Salt Testing libs
+from tests.support.paths import TMP
+from tests.support.unit import TestCase
+
+# Import Salt libs
+import salt.utils.minion
+
+
+class JidQueueTestCase(TestCase):
+    '''
+    Test the minion's de-dup jid queue
+    '''
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp(dir=TMP)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_add(self):
+        jid_queue = salt.utils.minion.JidQueue(2, jids=['1'])
+        self.assertTrue(jid_queue.add('2'))
+        self.assertFalse(jid_queue.add('1'))
+        self.assertTrue(jid_queue.add('3'))
+        self.assertEqual(jid_queue, ['2', '3'])
+        self.assertNotIn('1', jid_queue)
+        self.assertEqual(len(jid_queue), 2)
+
+    def test_persist(self):
+        path = os.path.join(self.tmp_dir, 'minion_jid_queue.p')
+        jid_queue = salt.utils.minion.JidQueue(2, path=path)
+        for jid in ('1', '2', '3'):
+            jid_queue.add(jid)
+        jid_queue = salt.utils.minion.JidQueue(2, path=path)
+        self.assertEqual(jid_queue, ['2', '3'])
+        self.assertFalse(jid_queue.add('3'))
@@ -50,6 +50,16 @@ class CkMinionsTestCase(TestCase):
     def setUp(self):
         self.ckminions = salt.utils.minions.CkMinions({'minion_data_cache': True})
 
+    def test_connected_ids_presence_table(self):
+        present = {'minion1': '10.0.0.1', 'minion2': '10.0.0.2'}
+        with patch('salt.utils.presence.read', MagicMock(return_value=present)):
+            self.assertEqual(self.ckminions.connected_ids(),
+                             {'minion1', 'minion2'})
+            self.assertEqual(self.ckminions.connected_ids(subset=['minion2', 'minion3']),
+                             {'minion2'})
+            self.assertEqual(self.ckminions.connected_ids(show_ip=True),
+                             {('minion1', '10.0.0.1'), ('minion2', '10.0.0.2')})
+
     def test_spec_check(self):
         # Test spec-only rule
         auth_list = ['@runner']
@@ -368,6 +378,35 @@ class CkMinionsTestCase(TestCase):
         ret = self.ckminions.auth_check(auth_list, 'test.arg', args, 'runner')
         self.assertTrue(ret)
 
+    @patch('salt.utils.minions.CkMinions._pki_minions', MagicMock(return_value=['alpha', 'beta', 'gamma']))
+    def test_auth_check_targets_matched_once(self):
+        auth_list = [{'alpha': 'test.ping'}, {'alpha': 'test.echo'}, {'beta': 'test.arg'}]
+        with patch.object(self.ckminions, 'check_minions',
+                          wraps=self.ckminions.check_minions) as check_mock:
+            ret = self.ckminions.auth_check(
+                auth_list, ['test.arg', 'test.echo'], [[], []], 'alpha')
+        self.assertTrue(ret)
+        # The target, alpha and beta
+        self.assertEqual(check_mock.call_count, 3)
+
+    def test_auth_check_cache(self):
+        self.ckminions.opts['auth_check_cache_ttl'] = 60
+        auth_list = [{'alpha': 'test.ping'}]
+        with patch.object(self.ckminions, '_auth_check', MagicMock(return_value=True)) as check_mock:
+            self.assertTrue(self.ckminions.auth_check(auth_list, 'test.ping', [], 'alpha'))
+            self.assertTrue(self.ckminions.auth_check(auth_list, 'test.ping', [], 'alpha'))
+            self.assertEqual(check_mock.call_count, 1)
+            self.assertTrue(self.ckminions.auth_check(auth_list, 'test.ping', [], 'beta'))
+            auth_list = [{'beta': 'test.ping'}]
+            self.assertTrue(self.ckminions.auth_check(auth_list, 'test.ping', [], 'alpha'))
+            self.assertEqual(check_mock.call_count, 3)
+
+    def test_match_check(self):
+        self.assertTrue(self.ckminions.match_check('test.*', 'test.ping'))
+        self.assertTrue(self.ckminions.match_check('test.*', ['test.ping', 'test.arg']))
+        self.assertFalse(self.ckminions.match_check('test.*', ['test.ping', 'cmd.run']))
+        self.assertFalse(self.ckminions.match_check('test.(', 'test.ping'))
+
 
 @skipIf(sys.version_info < (2, 7), 'Python 2.7 needed for dictionary equality assertions')
 class TargetParseTestCase(TestCase):
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+'''
+Tests for salt.utils.pki
+'''
+# Import Python libs
+from __future__ import absolute_import, print_function, unicode_literals
+import os
+import shutil
+import tempfile
+import time
+
+# Import Salt Testing libs
+from tests.support.unit import TestCase, skipIf
+from tests.support.mock import patch, NO_MOCK, NO_MOCK_REASON
+from tests.support.paths import TMP
+
+# Import Salt libs
+import salt.utils.files
+import salt.utils.pki
+
+
+@skipIf(NO_MOCK, NO_MOCK_REASON)
+class ListKeysTestCase(TestCase):
+    def setUp(self):
+        self.pki_dir = tempfile.mkdtemp(dir=TMP)
+        self.path = os.path.join(self.pki_dir, 'minions')
+        os.makedirs(self.path)
+        self.opts = {'pki_index': True}
+        for name in ('minion2', 'minion1', '.key_cache'):
+            self._add_key(name)
+        salt.utils.pki._INDEX.clear()
+
+    def tearDown(self):
+        salt.utils.pki._INDEX.clear()
+        shutil.rmtree(self.pki_dir)
+
+    def _add_key(self, name):
+        with salt.utils.files.fopen(os.path.join(self.path, name), 'w') as fp_:
+            fp_.write('key')
+        # Pretend the directory was changed a while ago
+        stamp = time.time() - 10
+        os.utime(self.path, (stamp, stamp))
+
+    def test_list_keys(self):
+        self.assertEqual(salt.utils.pki.list_keys({}, self.path),
+                         ['minion1', 'minion2'])
+        self.assertEqual(salt.utils.pki.list_keys(self.opts, self.path),
+                         ['minion1', 'minion2'])
+        self.assertTrue(os.path.isfile(os.path.join(self.pki_dir, '.minions.index')))
+
+    def test_list_keys_cached(self):
+        salt.utils.pki.list_keys(self.opts, self.path)
+        with patch('salt.utils.pki._list') as list_mock:
+            self.assertEqual(salt.utils.pki.list_keys(self.opts, self.path),
+                             ['minion1', 'minion2'])
+            # Read from the snapshot, as another process would
+            salt.utils.pki._INDEX.clear()
+            self.assertEqual(salt.utils.pki.list_keys(self.opts, self.path),
+                             ['minion1', 'minion2'])
+        list_mock.assert_not_called()
+
+    def test_list_keys_changed(self):
+        salt.utils.pki.list_keys(self.opts, self.path)
+        self._add_key('minion3')
+        self.assertEqual(salt.utils.pki.list_keys(self.opts, self.path),
+                         ['minion1', 'minion2', 'minion3'])
+        os.remove(os.path.join(self.path, 'minion1'))
+        self.assertEqual(salt.utils.pki.list_keys(self.opts, self.path),
+                         ['minion2', 'minion3'])
+
+    def test_list_keys_missing(self):
+        self.assertRaises(OSError, salt.utils.pki.list_keys,
+                          self.opts, os.path.join(self.pki_dir, 'minions_pre'))
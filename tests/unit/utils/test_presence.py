@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+'''
+Tests for salt.utils.presence
+'''
+# Import Python libs
+from __future__ import absolute_import, print_function, unicode_literals
+import shutil
+import tempfile
+
+# Import Salt Testing libs
+from tests.support.unit import TestCase
+from tests.support.paths import TMP
+
+# Import Salt libs
+import salt.utils.presence
+
+
+class PresenceTableTestCase(TestCase):
+    def setUp(self):
+        self.sock_dir = tempfile.mkdtemp(dir=TMP)
+        self.opts = {'sock_dir': self.sock_dir,
+                     'transport': 'tcp',
+                     'presence_table': True}
+
+    def tearDown(self):
+        shutil.rmtree(self.sock_dir)
+
+    def test_enabled(self):
+        self.assertTrue(salt.utils.presence.enabled(self.opts))
+        self.opts['transport_opts'] = {'zeromq': {}}
+        self.assertFalse(salt.utils.presence.enabled(self.opts))
+        self.opts['transport'] = 'zeromq'
+        self.assertFalse(salt.utils.presence.enabled(self.opts))
+
+    def test_read_write(self):
+        self.assertIsNone(salt.utils.presence.read(self.opts))
+        salt.utils.presence.write(self.opts, {'minion1': '10.0.0.1'})
+        self.assertEqual(salt.utils.presence.read(self.opts),
+                         {'minion1': '10.0.0.1'})
+        salt.utils.presence.write(self.opts, {'minion2': '10.0.0.2'})
+        self.assertEqual(salt.utils.presence.read(self.opts),
+                         {'minion2': '10.0.0.2'})
+        salt.utils.presence.remove(self.opts)
+        self.assertIsNone(salt.utils.presence.read(self.opts))
+        salt.utils.presence.write(self.opts, {'minion1': '10.0.0.1'})
+        self.opts['presence_table'] = False
+        self.assertIsNone(salt.utils.presence.read(self.opts))
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+# Import python libs
+from __future__ import absolute_import, unicode_literals, print_function
+import fnmatch
+
+# Import Salt Testing libs
+from tests.support.unit import TestCase
+
+# Import Salt libs
+import salt.utils.tagmatch
+
+
+class TagMatcherTestCase(TestCase):
+
+    patterns = ['salt/job/*/ret/*', 'salt/minion/?eb1/start',
+                'salt/beacon/[ab]*', 'salt/auth']
+    tags = ['salt/job/20180101/ret/web1', 'salt/job/20180101/new',
+            'salt/minion/web1/start', 'salt/minion/webb1/start',
+            'salt/beacon/a/load', 'salt/beacon/c/load',
+            'salt/auth', 'salt/auth/extra', '']
+
+    def test_match_like_fnmatch(self):
+        matcher = salt.utils.tagmatch.TagMatcher(self.patterns)
+        for tag in self.tags:
+            expected = any(fnmatch.fnmatchcase(tag, pattern)
+                           for pattern in self.patterns)
+            self.assertEqual(matcher.match(tag), expected, tag)
+            # The cached result is the same
+            self.assertEqual(matcher.match(tag), expected, tag)
+
+    def test_no_patterns(self):
+        matcher = salt.utils.tagmatch.TagMatcher([])
+        self.assertFalse(matcher)
+        self.assertFalse(matcher.match('salt/auth'))
+
+    def test_cache_size(self):
+        matcher = salt.utils.tagmatch.TagMatcher(['salt/*'], cache_size=2)
+        for tag in self.tags:
+            matcher.match(tag)
+        self.assertEqual(list(matcher.cache), ['salt/auth/extra', ''])
+
+    def test_match(self):
+        self.assertTrue(salt.utils.tagmatch.match('salt/auth', 'salt/*'))
+        self.assertFalse(salt.utils.tagmatch.match('salt/auth', 'salt/job/*'))
+
+    def test_literal_patterns(self):
+        matcher = salt.utils.tagmatch.TagMatcher(['salt/auth', 'salt/key'])
+        self.assertTrue(matcher.match('salt/auth'))
+        self.assertFalse(matcher.match('salt/auth/extra'))
+        self.assertEqual(list(matcher.cache), [])
+
+        salt.utils.tagmatch.match('salt/auth', 'salt/literal')
+        self.assertNotIn('salt/literal', salt.utils.tagmatch._MATCHERS)
+